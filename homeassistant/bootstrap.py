@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Generator
 import contextlib
 from functools import partial
+import gc
 from itertools import chain
 import logging
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
@@ -415,6 +417,23 @@ def _init_blocking_io_modules_in_executor() -> None:
     is_docker_env()
 
 
+@contextlib.contextmanager
+def _pause_garbage_collection() -> Generator[None]:
+    """Pause the cyclic garbage collector.
+
+    Loading the registries creates a lot of long lived objects which
+    trigger collections that can't free anything.
+    """
+    if not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
 async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
     """Load the registries and modules that will do blocking I/O."""
     if DATA_REGISTRIES_LOADED in hass.data:
@@ -423,21 +442,23 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
     translation.async_setup(hass)
     entity.async_setup(hass)
     template.async_setup(hass)
-    await asyncio.gather(
-        create_eager_task(get_internal_store_manager(hass).async_initialize()),
-        create_eager_task(area_registry.async_load(hass)),
-        create_eager_task(category_registry.async_load(hass)),
-        create_eager_task(device_registry.async_load(hass)),
-        create_eager_task(entity_registry.async_load(hass)),
-        create_eager_task(floor_registry.async_load(hass)),
-        create_eager_task(issue_registry.async_load(hass)),
-        create_eager_task(label_registry.async_load(hass)),
-        hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
-        create_eager_task(template.async_load_custom_templates(hass)),
-        create_eager_task(restore_state.async_load(hass)),
-        create_eager_task(hass.config_entries.async_initialize()),
-        create_eager_task(async_get_system_info(hass)),
-    )
+    with _pause_garbage_collection():
+        await asyncio.gather(
+            create_eager_task(get_internal_store_manager(hass).async_initialize()),
+            create_eager_task(area_registry.async_load(hass)),
+            create_eager_task(category_registry.async_load(hass)),
+            create_eager_task(device_registry.async_load(hass)),
+            create_eager_task(entity_registry.async_load(hass)),
+            create_eager_task(floor_registry.async_load(hass)),
+            create_eager_task(issue_registry.async_load(hass)),
+            create_eager_task(label_registry.async_load(hass)),
+            hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
+            create_eager_task(template.async_load_custom_templates(hass)),
+            create_eager_task(template.async_load_bytecode_cache(hass)),
+            create_eager_task(restore_state.async_load(hass)),
+            create_eager_task(hass.config_entries.async_initialize()),
+            create_eager_task(async_get_system_info(hass)),
+        )
 
 
 async def async_from_config_dict(
@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
+from functools import partial
 import logging
 from typing import Any, cast
 
@@ -185,15 +186,36 @@ def _generate_stream_message(
     }
 
 
+def _generate_columnar_stream_message(
+    columns: dict[str, dict[str, list[Any]]],
+    state_table: list[str],
+    start_day: dt,
+    end_day: dt,
+) -> dict[str, Any]:
+    """Generate a columnar history stream message response."""
+    return {
+        "columns": columns,
+        "state_table": state_table,
+        "start_time": start_day.timestamp(),
+        "end_time": end_day.timestamp(),
+    }
+
+
 @callback
 def _async_send_empty_response(
-    connection: ActiveConnection, msg_id: int, start_time: dt, end_time: dt | None
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    columnar: bool = False,
 ) -> None:
     """Send an empty response when we know all results are filtered away."""
     connection.send_result(msg_id)
     stream_end_time = end_time or dt_util.utcnow()
     connection.send_message(
-        _generate_websocket_response(msg_id, start_time, stream_end_time, {})
+        _generate_empty_websocket_response(
+            msg_id, start_time, stream_end_time, columnar
+        )
     )
 
 
@@ -211,6 +233,81 @@ def _generate_websocket_response(
     )
 
 
+def _generate_columnar_websocket_response(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    columns: dict[str, dict[str, list[Any]]],
+    state_table: list[str],
+) -> bytes:
+    """Generate a columnar websocket response."""
+    return json_bytes(
+        messages.event_message(
+            msg_id,
+            _generate_columnar_stream_message(
+                columns, state_table, start_time, end_time
+            ),
+        )
+    )
+
+
+def _generate_empty_websocket_response(
+    msg_id: int, start_time: dt, end_time: dt, columnar: bool
+) -> bytes:
+    """Generate a websocket response without any states."""
+    if columnar:
+        return _generate_columnar_websocket_response(
+            msg_id, start_time, end_time, {}, []
+        )
+    return _generate_websocket_response(msg_id, start_time, end_time, {})
+
+
+def _generate_columnar_historical_response(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> tuple[float, bytes | None]:
+    """Generate a columnar historical response."""
+    columns, state_table = history.get_significant_states_columnar(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+    last_time_ts = max(
+        (
+            entity_columns[COMPRESSED_STATE_LAST_UPDATED][-1]
+            for entity_columns in columns.values()
+            if entity_columns[COMPRESSED_STATE_LAST_UPDATED]
+        ),
+        default=0.0,
+    )
+
+    if last_time_ts == 0:
+        return last_time_ts, None
+
+    return (
+        last_time_ts,
+        _generate_columnar_websocket_response(
+            msg_id,
+            start_time,
+            dt_util.utc_from_timestamp(last_time_ts),
+            columns,
+            state_table,
+        ),
+    )
+
+
 def _generate_historical_response(
     hass: HomeAssistant,
     msg_id: int,
@@ -221,8 +318,7 @@ def _generate_historical_response(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
-    send_empty: bool,
-) -> tuple[float, dt | None, bytes | None]:
+) -> tuple[float, bytes | None]:
     """Generate a historical response."""
     states = cast(
         dict[str, list[dict[str, Any]]],
@@ -239,6 +335,39 @@ def _generate_historical_response(
             True,
         ),
     )
+    return _generate_response_from_states(msg_id, start_time, states)
+
+
+def _generate_downsampled_historical_response(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    downsample_tier: int,
+) -> tuple[float, bytes | None]:
+    """Generate a historical response from a downsampled tier."""
+    states = history.get_significant_states_downsampled(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        downsample_tier,
+        include_start_time_state,
+        significant_changes_only,
+        no_attributes,
+    )
+    return _generate_response_from_states(msg_id, start_time, states)
+
+
+def _generate_response_from_states(
+    msg_id: int, start_time: dt, states: dict[str, list[dict[str, Any]]]
+) -> tuple[float, bytes | None]:
+    """Generate a historical response from compressed states."""
     last_time_ts = 0.0
     for state_list in states.values():
         if (
@@ -249,19 +378,13 @@ def _generate_historical_response(
             last_time_ts = cast(float, state_last_time)
 
     if last_time_ts == 0:
-        # If we did not send any states ever, we need to send an empty response
-        # so the websocket client knows it should render/process/consume the
-        # data.
-        if not send_empty:
-            return last_time_ts, None, None
-        last_time_dt = end_time
-    else:
-        last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
+        return last_time_ts, None
 
     return (
         last_time_ts,
-        last_time_dt,
-        _generate_websocket_response(msg_id, start_time, last_time_dt, states),
+        _generate_websocket_response(
+            msg_id, start_time, dt_util.utc_from_timestamp(last_time_ts), states
+        ),
     )
 
 
@@ -276,26 +399,68 @@ async def _async_send_historical_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    columnar: bool,
+    downsample_tier: int | None,
     send_empty: bool,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    Large requests are split into time windows of entity batches which
+    are sent to the client as soon as each of them has been fetched.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    generate_response: Callable[..., tuple[float, bytes | None]]
+    if columnar:
+        generate_response = _generate_columnar_historical_response
+    elif downsample_tier:
+        generate_response = partial(
+            _generate_downsampled_historical_response,
+            downsample_tier=downsample_tier,
+        )
+    else:
+        generate_response = _generate_historical_response
+    max_concurrent_queries = instance.max_concurrent_queries
+    last_time_ts = 0.0
+    for window in history.plan_history_queries(
+        start_time, end_time, entity_ids or [], include_start_time_state
+    ):
+        for idx in range(0, len(window), max_concurrent_queries):
+            if msg_id not in connection.subscriptions:
+                # Unsubscribe happened while sending historical states
+                return None
+            for response in asyncio.as_completed(
+                [
+                    instance.async_add_executor_job(
+                        generate_response,
+                        hass,
+                        msg_id,
+                        chunk.start_time,
+                        chunk.end_time,
+                        chunk.entity_ids,
+                        chunk.include_start_time_state,
+                        significant_changes_only,
+                        minimal_response,
+                        no_attributes,
+                    )
+                    for chunk in window[idx : idx + max_concurrent_queries]
+                ]
+            ):
+                chunk_last_time_ts, payload = await response
+                if payload:
+                    connection.send_message(payload)
+                last_time_ts = max(last_time_ts, chunk_last_time_ts)
+    if last_time_ts == 0:
+        # If we did not send any states ever, we need to send an empty response
+        # so the websocket client knows it should render/process/consume the
+        # data.
+        if send_empty:
+            connection.send_message(
+                _generate_empty_websocket_response(
+                    msg_id, start_time, end_time, columnar
+                )
+            )
+        return None
+    return dt_util.utc_from_timestamp(last_time_ts)
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -405,6 +570,10 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
+        # The number of points the client can show, for example the width
+        # of the graph in pixels
+        vol.Optional("points"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -444,6 +613,19 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    # The columnar format is only available once the states_meta
+    # migration is complete, the client can tell by the "columns" key
+    columnar = msg["columnar"] and get_instance(hass).states_meta_manager.active
+    # With a minimal response the states can come from a downsampled tier
+    # when the client can not show more points than the tier has buckets
+    downsample_tier = (
+        history.select_downsample_tier(start_time, end_time or utc_now, points)
+        if (points := msg.get("points"))
+        and minimal_response
+        and not columnar
+        and get_instance(hass).states_meta_manager.active
+        else None
+    )
 
     if end_time and end_time <= utc_now:
         if (
@@ -453,7 +635,9 @@ async def ws_stream(
                 hass, entity_ids, start_time, no_attributes
             )
         ):
-            _async_send_empty_response(connection, msg_id, start_time, end_time)
+            _async_send_empty_response(
+                connection, msg_id, start_time, end_time, columnar
+            )
             return
 
         connection.subscriptions[msg_id] = callback(lambda: None)
@@ -469,6 +653,8 @@ async def ws_stream(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            columnar,
+            downsample_tier,
             True,
         )
         return
@@ -533,6 +719,8 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        columnar,
+        downsample_tier,
         True,
     )
 
@@ -577,5 +765,7 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        columnar,
+        downsample_tier,
         send_empty=not last_event_time,
     )
@@ -16,6 +16,7 @@ from .util import get_instance
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the recorder websocket API."""
     websocket_api.async_register_command(hass, ws_info)
+    websocket_api.async_register_command(hass, ws_purge_progress)
 
 
 @websocket_api.websocket_command(
@@ -54,3 +55,19 @@ def ws_info(
         "thread_running": is_running,
     }
     connection.send_result(msg["id"], recorder_info)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/purge_progress",
+    }
+)
+@callback
+def ws_purge_progress(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the progress of the current or last purge."""
+    progress = None
+    if (instance := get_instance(hass)) and instance.purge_progress:
+        progress = instance.purge_progress.as_dict()
+    connection.send_result(msg["id"], progress)
@@ -59,6 +59,8 @@ CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+DOWNSAMPLED_STATES_SCHEMA_VERSION = 48
+LAST_USED_SCHEMA_VERSION = 49
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
@@ -87,13 +87,16 @@ from .migration import (
     StatesContextIDMigration,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
+from .partition import setup_partitioned_states
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import get_migration_changes
+from .spill_queue import SpillQueue
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
-from .table_managers.states import StatesManager
+from .table_managers.states import PendingStatesRow, StatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
@@ -109,6 +112,8 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    SpillQueueDrainTask,
+    StatesPartitionTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -150,11 +155,17 @@ DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
 QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
 
+SPILL_QUEUE_FILE = ".recorder_spill_queue"
+SPILL_QUEUE_DRAIN_BATCH_SIZE = 1000
+
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
 # Pool size must accommodate Recorder thread + All db executors
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
+# Leave db executors free for other queries while a request runs
+# its queries concurrently
+MAX_CONCURRENT_QUERIES = max(1, MAX_DB_EXECUTOR_WORKERS // 2)
 
 
 class Recorder(threading.Thread):
@@ -174,6 +185,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        partition_states: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -184,6 +196,9 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.purge_progress: PurgeProgress | None = None
+        self.partition_states = partition_states
+        self.states_partitioned = False
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
@@ -203,6 +218,10 @@ class Recorder(threading.Thread):
         self.engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
+        # Events are put into the spill queue instead of the in-memory
+        # queue while the backlog is too large to keep in memory
+        self._spill_queue = SpillQueue(hass.config.path(SPILL_QUEUE_FILE))
+        self._spilling = False
 
         # The entity_filter is exposed on the recorder instance so that
         # it can be used to see if an entity is being recorded and is called
@@ -213,6 +232,7 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._bulk_insert_states = False
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -246,11 +266,14 @@ class Recorder(threading.Thread):
         # We update the value once we connect to the DB
         # and determine what is actually supported.
         self.max_bind_vars = SQLITE_MAX_BIND_VARS
+        # The number of read queries that can usefully run at the same
+        # time in the database executor, updated once we know the pool.
+        self.max_concurrent_queries = 1
 
     @property
     def backlog(self) -> int:
         """Return the number of items in the recorder backlog."""
-        return self._queue.qsize()
+        return self._queue.qsize() + len(self._spill_queue)
 
     @cached_property
     def dialect_name(self) -> SupportedDialect | None:
@@ -301,9 +324,19 @@ class Recorder(threading.Thread):
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
+        self._async_listen_events(self._queue.put_nowait)
+        self._queue_watcher = async_track_time_interval(
+            self.hass,
+            self._async_check_queue,
+            QUEUE_CHECK_INTERVAL,
+            name="Recorder queue watcher",
+        )
+
+    @callback
+    def _async_listen_events(self, queue_put: Callable[[Event], None]) -> None:
+        """Listen for events to record and put them with queue_put."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -336,12 +369,55 @@ class Recorder(threading.Thread):
             MATCH_ALL,
             _event_listener,
         )
-        self._queue_watcher = async_track_time_interval(
-            self.hass,
-            self._async_check_queue,
-            QUEUE_CHECK_INTERVAL,
-            name="Recorder queue watcher",
+
+    @callback
+    def _async_start_spilling(self) -> None:
+        """Put new events into the spill queue instead of the in-memory queue."""
+        if self._spilling or not self._event_listener or self._spill_queue.failed:
+            return
+        _LOGGER.warning(
+            "The recorder backlog queue reached %s events; new events will be "
+            "written to %s until the backlog has been recorded",
+            self.backlog,
+            self._spill_queue.path,
         )
+        self._spilling = True
+        self._event_listener()
+        self._async_listen_events(self._async_spill_event)
+        self.queue_task(SpillQueueDrainTask())
+
+    @callback
+    def _async_stop_spilling(self) -> None:
+        """Put new events into the in-memory queue again."""
+        if not self._spilling:
+            return
+        self._spilling = False
+        if self._event_listener:
+            self._event_listener()
+            self._async_listen_events(self._queue.put_nowait)
+        # Record the events that were spilled before the listener was replaced
+        # ahead of the events put into the in-memory queue from now on
+        self.queue_task(SpillQueueDrainTask(until_empty=True))
+
+    @callback
+    def _async_spill_event(self, event: Event) -> None:
+        """Put an event into the spill queue."""
+        spill_queue = self._spill_queue
+        if spill_queue.failed:
+            # The spill queue keeps the events it could not write in memory
+            self._async_stop_spilling()
+            self._queue.put_nowait(event)
+            return
+        try:
+            flush = spill_queue.put(event)
+        except TypeError as ex:
+            # The recorder drops events it cannot serialize, drop it here
+            # instead of recording it ahead of the events already spilled
+            _LOGGER.warning("Event is not JSON serializable: %s: %s", event, ex)
+            return
+        if flush and not spill_queue.flush_scheduled:
+            spill_queue.flush_scheduled = True
+            self.hass.async_add_executor_job(spill_queue.flush)
 
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
@@ -373,7 +449,11 @@ class Recorder(threading.Thread):
         The queue grows during migration or if something really goes wrong.
         """
         _LOGGER.debug("Recorder queue size is: %s", self.backlog)
-        if not self._reached_max_backlog():
+        if self._spill_queue.failed:
+            self._async_stop_spilling()
+        elif self._queue.qsize() >= MAX_QUEUE_BACKLOG_MIN_VALUE:
+            self._async_start_spilling()
+        if self._spilling or not self._reached_max_backlog():
             return
         _LOGGER.error(
             (
@@ -395,7 +475,7 @@ class Recorder(threading.Thread):
     def _reached_max_backlog(self) -> bool:
         """Check if the system has reached the max queue backlog and return True if it has."""
         # First check the minimum value since its cheap
-        if self.backlog < MAX_QUEUE_BACKLOG_MIN_VALUE:
+        if self._queue.qsize() < MAX_QUEUE_BACKLOG_MIN_VALUE:
             return False
         # If they have more RAM available, keep filling the backlog
         # since we do not want to stop recording events or give the
@@ -451,6 +531,9 @@ class Recorder(threading.Thread):
         """Shut down the Recorder at final write."""
         if not self._hass_started.done():
             self._hass_started.set_result(SHUTDOWN_TASK)
+        if self._spilling:
+            self._spilling = False
+            self.queue_task(SpillQueueDrainTask(until_empty=True))
         self.queue_task(StopTask())
         self._async_stop_listeners()
         await self.hass.async_add_executor_job(self.join)
@@ -525,8 +608,12 @@ class Recorder(threading.Thread):
             # until after the database is vacuumed
             repack = self.auto_repack and is_second_sunday(now)
             purge_before = dt_util.utcnow() - timedelta(days=self.keep_days)
+            if self.states_partitioned:
+                self.queue_task(StatesPartitionTask(purge_before))
             self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
         else:
+            if self.states_partitioned:
+                self.queue_task(StatesPartitionTask(None))
             self.queue_task(PerodicCleanupTask())
 
     @callback
@@ -650,6 +737,10 @@ class Recorder(threading.Thread):
                 name="Recorder commit",
             )
 
+        # Make sure the partitions for the next days exist
+        if self.states_partitioned:
+            self.queue_task(StatesPartitionTask(None))
+
         # Run nightly tasks at 4:12am
         self._nightly_listener = async_track_time_change(
             self.hass, self.async_nightly_tasks, hour=4, minute=12, second=0
@@ -1000,10 +1091,21 @@ class Recorder(threading.Thread):
 
         local_start_time = dt_util.now()
         hass = self.hass
+        spill_requested = False
         with write_lock_db_sqlite(self):
             # Notify that lock is being held, wait until database can be used again.
             hass.add_job(_async_set_database_locked, task)
             while not task.database_unlock.wait(timeout=DB_LOCK_QUEUE_CHECK_TIMEOUT):
+                if (
+                    self._spilling and not self._spill_queue.failed
+                ) or self._queue.qsize() < MAX_QUEUE_BACKLOG_MIN_VALUE:
+                    continue
+                if not spill_requested and not self._spill_queue.failed:
+                    # Keep holding the lock and spill new events to disk,
+                    # check again once the event loop has switched over
+                    spill_requested = True
+                    hass.add_job(self._async_start_spilling)
+                    continue
                 if self._reached_max_backlog():
                     _LOGGER.warning(
                         "Database queue backlog reached more than %s events "
@@ -1022,6 +1124,20 @@ class Recorder(threading.Thread):
             self.backlog,
         )
 
+    def _drain_spill_queue(self, until_empty: bool) -> None:
+        """Record a batch of events from the spill queue."""
+        spill_queue = self._spill_queue
+        while events := spill_queue.get_batch(SPILL_QUEUE_DRAIN_BATCH_SIZE):
+            for event in events:
+                self._guarded_process_one_task_or_event_or_recover(event)
+            if not until_empty:
+                # Continue after the tasks that were queued in the meantime
+                self.queue_task(SpillQueueDrainTask())
+                return
+        if self._spilling:
+            # The backlog has been recorded
+            self.hass.add_job(self._async_stop_spilling)
+
     def _process_one_event(self, event: Event[Any]) -> None:
         if not self.enabled:
             return
@@ -1070,9 +1186,12 @@ class Recorder(threading.Thread):
             and (data_id := event_data_manager.get(shared_data, hash_, session))
         ):
             dbevent.data_id = data_id
+            event_data_manager.mark_used(data_id, event.time_fired_timestamp)
         else:
             # No matching attributes found, save them in the DB
             dbevent_data = EventData(shared_data=shared_data, hash=hash_)
+            if event_data_manager.tracks_last_used:
+                dbevent_data.last_used_ts = event.time_fired_timestamp
             event_data_manager.add_pending(dbevent_data)
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
@@ -1088,30 +1207,21 @@ class Recorder(threading.Thread):
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
-        dbstate = States.from_event(event)
         old_state = event.data["old_state"]
 
         assert self.event_session is not None
         session = self.event_session
 
         states_manager = self.states_manager
+        old_state_id: int | None = None
         if pending_state := states_manager.pop_pending(entity_id):
-            dbstate.old_state = pending_state
             if old_state:
                 pending_state.last_reported_ts = old_state.last_reported_timestamp
         elif old_state_id := states_manager.pop_committed(entity_id):
-            dbstate.old_state_id = old_state_id
             if old_state:
                 states_manager.update_pending_last_reported(
                     old_state_id, old_state.last_reported_timestamp
                 )
-        if entity_removed:
-            dbstate.state = None
-        else:
-            states_manager.add_pending(entity_id, dbstate)
-
-        if states_meta_manager.active:
-            dbstate.entity_id = None
 
         if entity_id is None or not (
             shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
@@ -1119,47 +1229,96 @@ class Recorder(threading.Thread):
             return
 
         # Map the entity_id to the StatesMeta table
-        if pending_states_meta := states_meta_manager.get_pending(entity_id):
-            dbstate.states_meta_rel = pending_states_meta
-        elif metadata_id := states_meta_manager.get(entity_id, session, True):
-            dbstate.metadata_id = metadata_id
-        elif states_meta_manager.active and entity_removed:
-            # If the entity was removed, we don't need to add it to the
-            # StatesMeta table or record it in the pending commit
-            # if it does not have a metadata_id allocated to it as
-            # it either never existed or was just renamed.
-            return
-        else:
+        metadata_id: int | None = None
+        if (states_meta := states_meta_manager.get_pending(entity_id)) is None and not (
+            metadata_id := states_meta_manager.get(entity_id, session, True)
+        ):
+            if states_meta_manager.active and entity_removed:
+                # If the entity was removed, we don't need to add it to the
+                # StatesMeta table or record it in the pending commit
+                # if it does not have a metadata_id allocated to it as
+                # it either never existed or was just renamed.
+                return
             states_meta = StatesMeta(entity_id=entity_id)
             states_meta_manager.add_pending(states_meta)
             self._add_to_session(session, states_meta)
-            dbstate.states_meta_rel = states_meta
 
         # Map the event data to the StateAttributes table
         shared_attrs = shared_attrs_bytes.decode("utf-8")
-        dbstate.attributes = None
+        last_updated_ts = (
+            new_state.last_updated_timestamp
+            if (new_state := event.data["new_state"])
+            else event.time_fired_timestamp
+        )
+        attributes_id: int | None = None
         # Matching attributes found in the pending commit
-        if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
-            dbstate.state_attributes = pending_event_data
-        # Matching attributes id found in the cache
-        elif (
-            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
-        ) or (
-            (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
-            and (
-                attributes_id := state_attributes_manager.get(
-                    shared_attrs, hash_, session
+        if (
+            state_attributes := state_attributes_manager.get_pending(shared_attrs)
+        ) is None and not (
+            # Matching attributes id found in the cache
+            (attributes_id := state_attributes_manager.get_from_cache(shared_attrs))
+            or (
+                (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
+                and (
+                    attributes_id := state_attributes_manager.get(
+                        shared_attrs, hash_, session
+                    )
                 )
             )
         ):
-            dbstate.attributes_id = attributes_id
-        else:
             # No matching attributes found, save them in the DB
-            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
-            state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
-            dbstate.state_attributes = dbstate_attributes
+            state_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+            if state_attributes_manager.tracks_last_used:
+                state_attributes.last_used_ts = last_updated_ts
+            state_attributes_manager.add_pending(state_attributes)
+            self._add_to_session(session, state_attributes)
+        elif attributes_id:
+            state_attributes_manager.mark_used(attributes_id, last_updated_ts)
 
+        if (
+            self._bulk_insert_states
+            and metadata_id
+            and attributes_id
+            and pending_state is None
+            and states_meta_manager.active
+            and self.schema_version == SCHEMA_VERSION
+        ):
+            # Everything the row references is already in the database
+            # so it can skip the ORM unit of work and be bulk inserted
+            values = States.values_from_event(event)
+            if entity_removed:
+                values["state"] = None
+            values["metadata_id"] = metadata_id
+            values["attributes_id"] = attributes_id
+            values["old_state_id"] = old_state_id
+            row = PendingStatesRow(values)
+            if not entity_removed:
+                states_manager.add_pending(entity_id, row)
+            states_manager.add_pending_row(row)
+            self._event_session_has_pending_writes = True
+            return
+
+        dbstate = States.from_event(event)
+        if entity_removed:
+            dbstate.state = None
+        if states_meta_manager.active:
+            dbstate.entity_id = None
+        if isinstance(pending_state, PendingStatesRow):
+            states_manager.link_pending_old_state_row(dbstate, pending_state)
+        elif pending_state is not None:
+            dbstate.old_state = pending_state
+        elif old_state_id:
+            dbstate.old_state_id = old_state_id
+        if not entity_removed:
+            states_manager.add_pending(entity_id, dbstate)
+        if states_meta is not None:
+            dbstate.states_meta_rel = states_meta
+        else:
+            dbstate.metadata_id = metadata_id
+        if state_attributes is not None:
+            dbstate.state_attributes = state_attributes
+        else:
+            dbstate.attributes_id = attributes_id
         self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
@@ -1208,22 +1367,13 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
-        if (
-            pending_last_reported
-            := self.states_manager.get_pending_last_reported_timestamp()
-        ) and self.schema_version >= LAST_REPORTED_SCHEMA_VERSION:
-            with session.no_autoflush:
-                session.execute(
-                    update(States),
-                    [
-                        {
-                            "state_id": state_id,
-                            "last_reported_ts": last_reported_timestamp,
-                        }
-                        for state_id, last_reported_timestamp in pending_last_reported.items()
-                    ],
-                )
-        session.commit()
+        try:
+            self._write_event_session(session)
+        except SQLAlchemyError:
+            # The bulk inserted states were rolled back with the transaction
+            session.rollback()
+            self.states_manager.rollback_pending_rows()
+            raise
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1243,6 +1393,33 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _write_event_session(self, session: Session) -> None:
+        """Write the pending rows and commit the event session."""
+        states_manager = self.states_manager
+        # Bulk insert the states first so states added to the session
+        # can be linked to them when the session is flushed
+        with session.no_autoflush:
+            states_manager.insert_pending_rows(session)
+        if (
+            pending_last_reported
+            := states_manager.get_pending_last_reported_timestamp()
+        ) and self.schema_version >= LAST_REPORTED_SCHEMA_VERSION:
+            with session.no_autoflush:
+                session.execute(
+                    update(States),
+                    [
+                        {
+                            "state_id": state_id,
+                            "last_reported_ts": last_reported_timestamp,
+                        }
+                        for state_id, last_reported_timestamp in pending_last_reported.items()
+                    ],
+                )
+        with session.no_autoflush:
+            self.state_attributes_manager.write_pending_last_used(session)
+            self.event_data_manager.write_pending_last_used(session)
+        session.commit()
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1251,6 +1428,7 @@ class Recorder(threading.Thread):
             self._close_connection()
         move_away_broken_database(dburl_to_path(self.db_url))
         self.recorder_runs_manager.reset()
+        statistics.get_statistics_during_period_cache(self.hass).clear()
         self._setup_recorder()
         if setup_run:
             self._setup_run()
@@ -1410,6 +1588,11 @@ class Recorder(threading.Thread):
                 with contextlib.suppress(ImportError):
                     kwargs["connect_args"]["conv"] = build_mysqldb_conv()
 
+        # All access to an in-memory database is serialized by the MutexPool
+        self.max_concurrent_queries = (
+            1 if kwargs.get("poolclass") is MutexPool else MAX_CONCURRENT_QUERIES
+        )
+
         # Disable extended logging for non SQLite databases
         if not self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["echo"] = False
@@ -1424,7 +1607,15 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         migration.pre_migrate_schema(self.engine)
+        self.states_partitioned = setup_partitioned_states(
+            self.engine, self.partition_states
+        )
         Base.metadata.create_all(self.engine)
+        # States can only be bulk inserted if the database returns the
+        # state_id of each row so later states can link to them
+        self._bulk_insert_states = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
@@ -1485,6 +1676,7 @@ class Recorder(threading.Thread):
                 # to cleanly close the connection.
                 self._db_executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
+            self._spill_queue.close()
             if self._db_executor:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
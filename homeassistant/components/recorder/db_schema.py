@@ -77,7 +77,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 47
+SCHEMA_VERSION = 49
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -87,6 +87,7 @@ TABLE_EVENT_TYPES = "event_types"
 TABLE_STATES = "states"
 TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_STATES_META = "states_meta"
+TABLE_STATES_DOWNSAMPLED = "states_downsampled"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
@@ -112,6 +113,7 @@ ALL_TABLES = [
     TABLE_SCHEMA_CHANGES,
     TABLE_MIGRATION_CHANGES,
     TABLE_STATES_META,
+    TABLE_STATES_DOWNSAMPLED,
     TABLE_STATISTICS,
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
@@ -361,6 +363,9 @@ class EventData(Base):
     shared_data: Mapped[str | None] = mapped_column(
         Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
     )
+    # The newest time_fired_ts of the events using the row, advanced at most
+    # once per LAST_USED_INTERVAL so it may lag behind by that much
+    last_used_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -500,6 +505,20 @@ class States(Base):
     @staticmethod
     def from_event(event: Event[EventStateChangedData]) -> States:
         """Create object from a state_changed event."""
+        return States(
+            entity_id=event.data["entity_id"],
+            attributes=None,
+            context_id=None,
+            context_user_id=None,
+            context_parent_id=None,
+            last_updated=None,
+            last_changed=None,
+            **States.values_from_event(event),
+        )
+
+    @staticmethod
+    def values_from_event(event: Event[EventStateChangedData]) -> dict[str, Any]:
+        """Return the column values of a state_changed event."""
         state = event.data["new_state"]
         # None state means the state was removed from the state machine
         if state is None:
@@ -519,23 +538,16 @@ class States(Base):
             else:
                 last_reported_ts = state.last_reported_timestamp
         context = event.context
-        return States(
-            state=state_value,
-            entity_id=event.data["entity_id"],
-            attributes=None,
-            context_id=None,
-            context_id_bin=ulid_to_bytes_or_none(context.id),
-            context_user_id=None,
-            context_user_id_bin=uuid_hex_to_bytes_or_none(context.user_id),
-            context_parent_id=None,
-            context_parent_id_bin=ulid_to_bytes_or_none(context.parent_id),
-            origin_idx=event.origin.idx,
-            last_updated=None,
-            last_changed=None,
-            last_updated_ts=last_updated_ts,
-            last_changed_ts=last_changed_ts,
-            last_reported_ts=last_reported_ts,
-        )
+        return {
+            "state": state_value,
+            "context_id_bin": ulid_to_bytes_or_none(context.id),
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+            "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+            "origin_idx": event.origin.idx,
+            "last_updated_ts": last_updated_ts,
+            "last_changed_ts": last_changed_ts,
+            "last_reported_ts": last_reported_ts,
+        }
 
     def to_native(self, validate_entity_id: bool = True) -> State | None:
         """Convert to an HA state object."""
@@ -587,6 +599,9 @@ class StateAttributes(Base):
     shared_attrs: Mapped[str | None] = mapped_column(
         Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
     )
+    # The newest last_updated_ts of the states using the row, advanced at most
+    # once per LAST_USED_INTERVAL so it may lag behind by that much
+    last_used_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -669,6 +684,46 @@ class StatesMeta(Base):
         )
 
 
+class StatesDownsampled(Base):
+    """Downsampled states of an entity, one row per bucket of a tier."""
+
+    __table_args__ = (
+        # Used for fetching the buckets of an entity in a tier for a period
+        Index(
+            "ix_states_downsampled_metadata_id_tier_start_ts",
+            "metadata_id",
+            "tier",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATES_DOWNSAMPLED
+    id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    metadata_id: Mapped[int | None] = mapped_column(
+        ID_TYPE,
+        ForeignKey(f"{TABLE_STATES_META}.metadata_id", ondelete="CASCADE"),
+    )
+    # The length of the buckets in minutes
+    tier: Mapped[int | None] = mapped_column(SmallInteger)
+    start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
+    # The last state in the bucket and when it was updated
+    state: Mapped[str | None] = mapped_column(String(MAX_LENGTH_STATE_STATE))
+    last_updated_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    # The range of the numeric states in the bucket
+    min: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    max: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.StatesDownsampled("
+            f"id={self.id}, metadata_id={self.metadata_id}, tier={self.tier}, "
+            f"start_ts={self.start_ts}, state='{self.state}'"
+            ")>"
+        )
+
+
 class StatisticsBase:
     """Statistics base class."""
 
@@ -0,0 +1,101 @@
+"""Downsampled states for long range history graphs."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from itertools import groupby
+import logging
+import math
+from operator import itemgetter
+from typing import Final
+
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from .db_schema import States, StatesDownsampled
+from .util import execute_stmt_lambda_element
+
+_LOGGER = logging.getLogger(__name__)
+
+# The length of the buckets of each tier in minutes, finest first
+DOWNSAMPLE_TIERS: Final = (1, 15)
+
+
+def _states_in_period_stmt(start_ts: float, end_ts: float) -> StatementLambdaElement:
+    """Return a statement for all states in a period."""
+    return lambda_stmt(
+        lambda: select(States.metadata_id, States.state, States.last_updated_ts)
+        .filter(States.last_updated_ts >= start_ts)
+        .filter(States.last_updated_ts < end_ts)
+        .filter(States.metadata_id.is_not(None))
+        .order_by(States.metadata_id, States.last_updated_ts)
+    )
+
+
+def _float_or_none(state: str | None) -> float | None:
+    """Return the state as a finite float or None."""
+    try:
+        value = float(state)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def compile_downsampled_states(
+    session: Session, start: datetime, end: datetime
+) -> None:
+    """Compile the downsampled states of all entities for a statistics period.
+
+    Each bucket holds the last state and its last_updated timestamp, and the
+    min and max of the numeric states in the bucket. Buckets without states
+    are not stored.
+
+    The buckets of a tier are compiled once the period that completes them
+    has been compiled.
+    """
+    for tier in DOWNSAMPLE_TIERS:
+        tier_length = timedelta(minutes=tier)
+        if end.minute % tier:
+            continue
+        # 1-minute buckets cover the period, longer ones end with it
+        period_start = min(start, end - tier_length)
+        period_start_ts = period_start.timestamp()
+        tier_seconds = tier_length.total_seconds()
+        buckets: list[StatesDownsampled] = []
+        for metadata_id, rows in groupby(
+            execute_stmt_lambda_element(
+                session,
+                _states_in_period_stmt(period_start_ts, end.timestamp()),
+                orm_rows=False,
+            ),
+            itemgetter(0),
+        ):
+            bucket: StatesDownsampled | None = None
+            for _, state, last_updated_ts in rows:
+                bucket_start_ts = period_start_ts + tier_seconds * (
+                    (last_updated_ts - period_start_ts) // tier_seconds
+                )
+                if bucket is None or bucket.start_ts != bucket_start_ts:
+                    bucket = StatesDownsampled(
+                        metadata_id=metadata_id,
+                        tier=tier,
+                        start_ts=bucket_start_ts,
+                    )
+                    buckets.append(bucket)
+                bucket.state = state
+                bucket.last_updated_ts = last_updated_ts
+                if (value := _float_or_none(state)) is None:
+                    continue
+                if bucket.min is None or value < bucket.min:
+                    bucket.min = value
+                if bucket.max is None or value > bucket.max:
+                    bucket.max = value
+        _LOGGER.debug(
+            "Compiled %s downsampled states for tier %s during %s-%s",
+            len(buckets),
+            tier,
+            period_start,
+            end,
+        )
+        session.add_all(buckets)
@@ -12,22 +12,33 @@ from homeassistant.core import HomeAssistant, State
 from ... import recorder
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+from .downsampled import (
+    get_significant_states_downsampled as _get_significant_states_downsampled,
+    select_downsample_tier,
+)
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_columnar as _modern_get_significant_states_columnar,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
+from .planner import HistoryQueryChunk, plan_history_queries
 
 # These are the APIs of this package
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "HistoryQueryChunk",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_columnar",
+    "get_significant_states_downsampled",
     "get_significant_states_with_session",
+    "plan_history_queries",
+    "select_downsample_tier",
     "state_changes_during_period",
 ]
 
@@ -115,6 +126,60 @@ def get_significant_states(
     )
 
 
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> tuple[dict[str, dict[str, list[Any]]], list[str]]:
+    """Return significant states during a time period in columnar format."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        raise NotImplementedError(
+            "Columnar history requires the states_meta migration to be complete"
+        )
+    return _modern_get_significant_states_columnar(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+
+
+def get_significant_states_downsampled(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str],
+    tier: int,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    no_attributes: bool = False,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return a minimal compressed response using a downsampled tier."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        raise NotImplementedError(
+            "Downsampled history requires the states_meta migration to be complete"
+        )
+    return _get_significant_states_downsampled(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        tier,
+        include_start_time_state,
+        significant_changes_only,
+        no_attributes,
+    )
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
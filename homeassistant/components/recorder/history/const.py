@@ -19,3 +19,7 @@ NEED_ATTRIBUTE_DOMAINS = {
     "thermostat",
     "water_heater",
 }
+
+# Keys for the range of the numeric states of a downsampled bucket
+DOWNSAMPLED_MIN_KEY = "mn"
+DOWNSAMPLED_MAX_KEY = "mx"
@@ -0,0 +1,265 @@
+"""Provide history from the downsampled states tiers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, cast
+
+from sqlalchemy import func, lambda_stmt, select
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.core import HomeAssistant, split_entity_id
+import homeassistant.util.dt as dt_util
+
+from ... import recorder
+from ..const import DOWNSAMPLED_STATES_SCHEMA_VERSION
+from ..db_schema import SchemaChanges, StatesDownsampled, StatisticsRuns
+from ..downsample import DOWNSAMPLE_TIERS
+from ..models import extract_metadata_ids, process_timestamp
+from ..util import execute_stmt_lambda_element, session_scope
+from .const import DOWNSAMPLED_MAX_KEY, DOWNSAMPLED_MIN_KEY, NEED_ATTRIBUTE_DOMAINS
+from .modern import get_significant_states_with_session
+
+# Statistics, and with them the downsampled states, are compiled in
+# periods of this length
+_COMPILE_PERIOD = timedelta(minutes=5)
+
+
+def select_downsample_tier(
+    start_time: datetime, end_time: datetime, points: int
+) -> int | None:
+    """Return the coarsest tier that still has a bucket for each point.
+
+    Returns None if the raw states are needed for the requested resolution.
+    """
+    seconds_per_point = (end_time - start_time).total_seconds() / points
+    selected: int | None = None
+    for tier in DOWNSAMPLE_TIERS:
+        if tier * 60 > seconds_per_point:
+            break
+        selected = tier
+    return selected
+
+
+def _ceil_ts(timestamp: float, tier: int) -> float:
+    """Round a timestamp up to the start of a bucket of a tier."""
+    return timestamp - timestamp % -(tier * 60)
+
+
+def _downsampled_since_stmt() -> StatementLambdaElement:
+    """Return a statement for when the downsampled states were introduced."""
+    return lambda_stmt(
+        lambda: select(func.min(SchemaChanges.changed)).filter(
+            SchemaChanges.schema_version >= DOWNSAMPLED_STATES_SCHEMA_VERSION
+        )
+    )
+
+
+def _last_statistics_run_stmt() -> StatementLambdaElement:
+    """Return a statement for the start of the last statistics run."""
+    return lambda_stmt(lambda: select(func.max(StatisticsRuns.start)))
+
+
+def _downsampled_period(
+    session: Session, tier: int, start_time_ts: float, end_time_ts: float
+) -> tuple[float, float] | None:
+    """Return the part of a period covered by complete buckets of a tier.
+
+    Buckets are compiled together with the statistics, so they are complete
+    from the first bucket of the longest tier after the schema was upgraded
+    until the end of the last statistics run.
+    """
+    if not (since := session.execute(_downsampled_since_stmt()).scalar()) or not (
+        last_run := session.execute(_last_statistics_run_stmt()).scalar()
+    ):
+        return None
+    start_ts = max(
+        _ceil_ts(process_timestamp(since).timestamp(), DOWNSAMPLE_TIERS[-1]),
+        _ceil_ts(start_time_ts, tier),
+    )
+    end_ts = min(
+        (process_timestamp(last_run) + _COMPILE_PERIOD).timestamp(), end_time_ts
+    )
+    end_ts -= end_ts % (tier * 60)
+    return (start_ts, end_ts) if start_ts < end_ts else None
+
+
+def _downsampled_states_stmt(
+    metadata_ids: list[int], tier: int, start_ts: float, end_ts: float
+) -> StatementLambdaElement:
+    """Return a statement for the buckets of a tier in a period."""
+    return lambda_stmt(
+        lambda: select(
+            StatesDownsampled.metadata_id,
+            StatesDownsampled.state,
+            StatesDownsampled.last_updated_ts,
+            StatesDownsampled.min,
+            StatesDownsampled.max,
+        )
+        .filter(StatesDownsampled.metadata_id.in_(metadata_ids))
+        .filter(StatesDownsampled.tier == tier)
+        .filter(StatesDownsampled.start_ts >= start_ts)
+        .filter(StatesDownsampled.start_ts < end_ts)
+        .order_by(StatesDownsampled.metadata_id, StatesDownsampled.start_ts)
+    )
+
+
+def _raw_states(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the minimal compressed raw states."""
+    return cast(
+        dict[str, list[dict[str, Any]]],
+        get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            True,
+            no_attributes,
+            True,
+        ),
+    )
+
+
+def get_significant_states_downsampled(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str],
+    tier: int,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    no_attributes: bool = False,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return a minimal compressed response using the buckets of a tier.
+
+    Parts of the period that are not covered by the tier, and entities
+    that need their attributes, are served from the raw states. Buckets
+    with numeric states carry the min and max of the bucket in addition
+    to the last state. Consecutive buckets without a change are skipped.
+    """
+    downsampled_entity_ids = [
+        entity_id
+        for entity_id in entity_ids
+        if split_entity_id(entity_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+    ]
+    with session_scope(hass=hass, read_only=True) as session:
+        if not downsampled_entity_ids or not (
+            period := _downsampled_period(
+                session, tier, start_time.timestamp(), end_time.timestamp()
+            )
+        ):
+            return _raw_states(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+
+        tier_start_ts, tier_end_ts = period
+        result: dict[str, list[dict[str, Any]]] = {
+            entity_id: [] for entity_id in entity_ids
+        }
+        if raw_entity_ids := [
+            entity_id
+            for entity_id in entity_ids
+            if entity_id not in downsampled_entity_ids
+        ]:
+            result.update(
+                _raw_states(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    raw_entity_ids,
+                    include_start_time_state,
+                    significant_changes_only,
+                    no_attributes,
+                )
+            )
+
+        tier_start = dt_util.utc_from_timestamp(tier_start_ts)
+        if include_start_time_state or tier_start > start_time:
+            for entity_id, states in _raw_states(
+                hass,
+                session,
+                start_time,
+                tier_start,
+                downsampled_entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            ).items():
+                result[entity_id].extend(states)
+
+        entity_id_to_metadata_id = recorder.get_instance(
+            hass
+        ).states_meta_manager.get_many(downsampled_entity_ids, session, False)
+        metadata_id_to_entity_id = {
+            metadata_id: entity_id
+            for entity_id, metadata_id in entity_id_to_metadata_id.items()
+            if metadata_id is not None
+        }
+        for metadata_id, rows in groupby(
+            execute_stmt_lambda_element(
+                session,
+                _downsampled_states_stmt(
+                    extract_metadata_ids(entity_id_to_metadata_id),
+                    tier,
+                    tier_start_ts,
+                    tier_end_ts,
+                ),
+                orm_rows=False,
+            ),
+            itemgetter(0),
+        ):
+            states = result[metadata_id_to_entity_id[metadata_id]]
+            prev_state = states[-1][COMPRESSED_STATE_STATE] if states else None
+            for _, state, last_updated_ts, min_value, max_value in rows:
+                if state == prev_state and min_value == max_value:
+                    continue
+                prev_state = state
+                comp_state: dict[str, Any] = {
+                    COMPRESSED_STATE_STATE: state,
+                    COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+                }
+                if min_value is not None:
+                    comp_state[DOWNSAMPLED_MIN_KEY] = min_value
+                    comp_state[DOWNSAMPLED_MAX_KEY] = max_value
+                states.append(comp_state)
+
+        # Include the states after the last bucket, one microsecond earlier
+        # since the start of the period is exclusive
+        for entity_id, states in _raw_states(
+            hass,
+            session,
+            dt_util.utc_from_timestamp(tier_end_ts) - timedelta(microseconds=1),
+            end_time,
+            downsampled_entity_ids,
+            False,
+            significant_changes_only,
+            no_attributes,
+        ).items():
+            result[entity_id].extend(states)
+
+    return {entity_id: states for entity_id, states in result.items() if states}
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -19,10 +19,16 @@ from sqlalchemy import (
     select,
     union_all,
 )
+from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
@@ -37,6 +43,7 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..models.state_attributes import decode_attributes_from_source
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
@@ -229,6 +236,89 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        result := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = result
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> tuple[dict[str, dict[str, list[Any]]], list[str]]:
+    """Return significant states during a time period in columnar format.
+
+    The result is a tuple of the columns of each entity and the table of
+    state strings the columns refer to, see _sorted_states_to_columns.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            result := _significant_states_rows(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return {}, []
+        rows, start_time_ts, entity_id_to_metadata_id = result
+        return _sorted_states_to_columns(
+            rows,
+            start_time_ts,
+            entity_id_to_metadata_id,
+            minimal_response,
+            not significant_changes_only,
+            no_attributes,
+        )
+
+
+def _significant_states_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[Sequence[Row] | Result, float | None, dict[str, int | None]] | None:
+    """Query the significant states rows sorted by metadata_id and last_updated.
+
+    Returns None if none of the entities are in the database, otherwise the
+    rows, the start time to use for the start time states and the mapping of
+    entity_id to metadata_id.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -237,7 +327,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,14 +365,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
+    return (
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -816,3 +902,98 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    include_last_changed: bool,
+    no_attributes: bool,
+) -> tuple[dict[str, dict[str, list[Any]]], list[str]]:
+    """Convert SQL results into columns without creating a state per row.
+
+    Each entity gets a dict of equally long lists:
+
+    s: index of the state in the returned table of state strings
+    lu: last_updated timestamp
+    lc: last_changed timestamp, only if include_last_changed
+    a: attributes, unless no_attributes. The first entry holds all the
+       attributes, following entries are None if the attributes did not
+       change or a dict with the changed attributes under "+" and the
+       names of the removed attributes under "-". With minimal_response
+       only the first entry of entities outside NEED_ATTRIBUTE_DOMAINS
+       holds attributes and states that did not change are skipped.
+
+    States must be sorted by entity_id and last_updated
+    """
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    state_table: list[str] = []
+    state_index: dict[str, int] = {}
+    columns: dict[str, dict[str, list[Any]]] = {}
+    last_changed_idx = 3
+    attributes_idx = 4 if include_last_changed else 3
+    attr_cache: dict[str, dict[str, Any]] = {}
+    for metadata_id, group in groupby(states, itemgetter(0)):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        minimal = (
+            minimal_response
+            and split_entity_id(entity_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+        )
+        state_col: list[int] = []
+        last_updated_col: list[float] = []
+        last_changed_col: list[float] = []
+        attributes_col: list[dict[str, Any] | None] = []
+        prev_state: str | None = None
+        prev_source: Any = None
+        prev_attributes: dict[str, Any] = {}
+        for row in group:
+            state: str = row[1]
+            if minimal and last_updated_col and state == prev_state:
+                continue
+            prev_state = state
+            if (idx := state_index.get(state)) is None:
+                idx = state_index[state] = len(state_table)
+                state_table.append(state)
+            state_col.append(idx)
+            last_updated_ts: float = row[2] or start_time_ts  # type: ignore[assignment]
+            last_updated_col.append(last_updated_ts)
+            if include_last_changed:
+                last_changed_col.append(row[last_changed_idx] or last_updated_ts)
+            if no_attributes:
+                continue
+            if not attributes_col:
+                prev_source = row[attributes_idx]
+                prev_attributes = decode_attributes_from_source(prev_source, attr_cache)
+                attributes_col.append(prev_attributes)
+                continue
+            # Attributes are only decoded when the stored JSON changed
+            if minimal or (source := row[attributes_idx]) == prev_source:
+                attributes_col.append(None)
+                continue
+            prev_source = source
+            attributes = decode_attributes_from_source(source, attr_cache)
+            delta: dict[str, Any] = {}
+            if added := {
+                key: value
+                for key, value in attributes.items()
+                if key not in prev_attributes or prev_attributes[key] != value
+            }:
+                delta["+"] = added
+            if removed := [key for key in prev_attributes if key not in attributes]:
+                delta["-"] = removed
+            prev_attributes = attributes
+            attributes_col.append(delta or None)
+        entity_columns: dict[str, list[Any]] = {
+            COMPRESSED_STATE_STATE: state_col,
+            COMPRESSED_STATE_LAST_UPDATED: last_updated_col,
+        }
+        if include_last_changed:
+            entity_columns[COMPRESSED_STATE_LAST_CHANGED] = last_changed_col
+        if not no_attributes:
+            entity_columns[COMPRESSED_STATE_ATTRIBUTES] = attributes_col
+        columns[entity_id] = entity_columns
+    return columns, state_table
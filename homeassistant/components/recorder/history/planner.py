@@ -0,0 +1,87 @@
+"""Plan history queries that can run concurrently."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import math
+
+# Entities are queried in batches of this size
+HISTORY_QUERY_ENTITY_BATCH_SIZE = 50
+# The time range is split into windows of at least this length
+HISTORY_QUERY_MIN_WINDOW = timedelta(days=1)
+# ... but never into more than this many windows
+HISTORY_QUERY_MAX_WINDOWS = 7
+# Requests for fewer entities times days than this are small enough
+# to be queried in one window
+HISTORY_QUERY_MIN_ENTITY_DAYS_TO_SPLIT = 100
+
+
+@dataclass(slots=True, frozen=True)
+class HistoryQueryChunk:
+    """A part of a history request that can be queried on its own."""
+
+    start_time: datetime
+    end_time: datetime
+    entity_ids: list[str]
+    include_start_time_state: bool
+
+
+def plan_history_queries(
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+) -> list[list[HistoryQueryChunk]]:
+    """Split a history request into time windows of entity batches.
+
+    The windows are returned in time order and must be queried one after
+    the other so the states of each entity stay ordered. The chunks of a
+    window cover different entities and may be queried concurrently.
+
+    Only the first window includes the state at the start time. The
+    time range is only split when the request covers many entities for
+    a long time, the number of rows grows with both.
+    """
+    batches = [
+        entity_ids[idx : idx + HISTORY_QUERY_ENTITY_BATCH_SIZE]
+        for idx in range(0, len(entity_ids), HISTORY_QUERY_ENTITY_BATCH_SIZE)
+    ] or [entity_ids]
+    span = end_time - start_time
+    if (
+        len(entity_ids) or HISTORY_QUERY_ENTITY_BATCH_SIZE
+    ) * span < HISTORY_QUERY_MIN_ENTITY_DAYS_TO_SPLIT * timedelta(days=1):
+        number_of_windows = 1
+    else:
+        number_of_windows = max(
+            1,
+            min(HISTORY_QUERY_MAX_WINDOWS, math.ceil(span / HISTORY_QUERY_MIN_WINDOW)),
+        )
+    window = span / number_of_windows
+    plan: list[list[HistoryQueryChunk]] = []
+    for idx in range(number_of_windows):
+        window_end = (
+            end_time
+            if idx == number_of_windows - 1
+            else start_time + window * (idx + 1)
+        )
+        # The start and end times of a query are exclusive, move the start
+        # back one microsecond so states on the boundary between two
+        # windows are not lost
+        window_start = (
+            start_time
+            if idx == 0
+            else start_time + window * idx - timedelta(microseconds=1)
+        )
+        plan.append(
+            [
+                HistoryQueryChunk(
+                    window_start,
+                    window_end,
+                    batch,
+                    include_start_time_state and idx == 0,
+                )
+                for batch in batches
+            ]
+        )
+    return plan
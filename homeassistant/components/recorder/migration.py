@@ -1766,6 +1766,28 @@ class _SchemaVersion47Migrator(_SchemaVersionMigrator, target_version=47):
         )
 
 
+class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The states_downsampled table is created by Base.metadata.create_all
+        # and is populated when statistics are compiled, nothing to migrate.
+
+
+class _SchemaVersion49Migrator(_SchemaVersionMigrator, target_version=49):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # Existing rows keep a NULL last_used_ts, the purge checks if they
+        # are still used by scanning the states and events tables until
+        # they are used again.
+        for table in ("state_attributes", "event_data"):
+            _add_columns(
+                self.session_maker,
+                table,
+                [f"last_used_ts {self.column_types.timestamp_type}"],
+            )
+            _create_index(self.session_maker, table, f"ix_{table}_last_used_ts")
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -134,9 +134,11 @@ def row_to_compressed_state(
         )
     row_last_updated_ts: float = last_updated_ts or start_time_ts  # type: ignore[assignment]
     comp_state[COMPRESSED_STATE_LAST_UPDATED] = row_last_updated_ts
+    # Checking the fields is much faster than a getattr
+    # miss when the column was not selected
     if (
-        (row_last_changed_ts := getattr(row, "last_changed_ts", None))
-        and row_last_changed_ts
+        "last_changed_ts" in row._fields
+        and (row_last_changed_ts := row.last_changed_ts)
         and row_last_updated_ts != row_last_changed_ts
     ):
         comp_state[COMPRESSED_STATE_LAST_CHANGED] = row_last_changed_ts
@@ -0,0 +1,224 @@
+"""Time partitioning of the states table."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Final, cast
+
+from sqlalchemy import (
+    Column,
+    Identity,
+    Index,
+    MetaData,
+    Table,
+    inspect,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.session import Session
+
+import homeassistant.util.dt as dt_util
+
+from .const import SupportedDialect
+from .db_schema import TABLE_STATES, States
+from .util import session_scope
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+PARTITION_PREFIX: Final = f"{TABLE_STATES}_p"
+DEFAULT_PARTITION: Final = f"{TABLE_STATES}_default"
+# Partitions are created this many days ahead so new states never
+# land in the default partition while Home Assistant is running
+PARTITIONS_AHEAD: Final = 3
+
+_PARTITION_PRIMARY_KEY = ("state_id", "last_updated_ts")
+
+
+def partitioned_states_table() -> Table:
+    """Return the states table range partitioned by last_updated_ts.
+
+    The partition key has to be part of the primary key, and foreign keys
+    would prevent dropping partitions, so the states table has no foreign
+    keys when it is partitioned.
+    """
+    states = cast(Table, States.__table__)
+    table = Table(
+        TABLE_STATES,
+        MetaData(),
+        *(
+            Column(
+                column.name,
+                column.type,
+                *([Identity()] if column.name == "state_id" else []),
+                primary_key=column.name in _PARTITION_PRIMARY_KEY,
+            )
+            for column in states.columns
+        ),
+        postgresql_partition_by="RANGE (last_updated_ts)",
+    )
+    for index in states.indexes:
+        Index(
+            index.name,
+            *(table.c[column.name] for column in index.columns),
+            **index.dialect_kwargs,
+        )
+    return table
+
+
+def partition_name(day: datetime) -> str:
+    """Return the name of the partition of a day."""
+    return f"{PARTITION_PREFIX}{day:%Y%m%d}"
+
+
+def _partition_day(name: str) -> datetime | None:
+    """Return the day of a partition from its name."""
+    try:
+        return datetime.strptime(name.removeprefix(PARTITION_PREFIX), "%Y%m%d").replace(
+            tzinfo=dt_util.UTC
+        )
+    except ValueError:
+        return None
+
+
+def _create_partition_sql(day: datetime) -> str:
+    """Return the statement that creates the partition of a day."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(day)} PARTITION OF"
+        f" {TABLE_STATES} FOR VALUES FROM ({day.timestamp()})"
+        f" TO ({(day + timedelta(days=1)).timestamp()})"
+    )
+
+
+def _states_table_is_partitioned(connection: Connection) -> bool:
+    """Return if the states table is partitioned."""
+    return bool(
+        connection.execute(
+            text(
+                "SELECT COUNT(*) FROM pg_partitioned_table"
+                " JOIN pg_class ON pg_class.oid = pg_partitioned_table.partrelid"
+                " WHERE pg_class.relname = :table"
+            ),
+            {"table": TABLE_STATES},
+        ).scalar()
+    )
+
+
+def setup_partitioned_states(engine: Engine, enabled: bool) -> bool:
+    """Create the partitioned states table when a new database is created.
+
+    This function is called before calling Base.metadata.create_all.
+
+    Returns if the states table is partitioned. Only PostgreSQL databases
+    can be partitioned, other databases keep a plain states table.
+    """
+    if engine.dialect.name != SupportedDialect.POSTGRESQL:
+        if enabled:
+            _LOGGER.warning(
+                "Partitioning the states table is only supported with PostgreSQL"
+            )
+        return False
+    with engine.connect() as connection:
+        if inspect(connection).has_table(TABLE_STATES):
+            if (partitioned := _states_table_is_partitioned(connection)) != enabled:
+                _LOGGER.warning(
+                    "The states table is %s, partitioning can only be changed"
+                    " when the database is created",
+                    "partitioned" if partitioned else "not partitioned",
+                )
+            return partitioned
+        if not enabled:
+            return False
+        _LOGGER.debug("Creating the partitioned states table")
+        partitioned_states_table().create(connection)
+        connection.execute(
+            text(
+                f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE_STATES} DEFAULT"
+            )
+        )
+        connection.commit()
+    return True
+
+
+def _list_partitions(session: Session) -> dict[datetime, str]:
+    """Return the daily partitions of the states table by day."""
+    partitions: dict[datetime, str] = {}
+    for (name,) in session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits"
+            " JOIN pg_class parent ON parent.oid = pg_inherits.inhparent"
+            " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+            " WHERE parent.relname = :table"
+        ),
+        {"table": TABLE_STATES},
+    ):
+        if (day := _partition_day(name)) is not None:
+            partitions[day] = name
+    return partitions
+
+
+def _drop_partition(
+    instance: Recorder, session: Session, name: str, end: datetime
+) -> None:
+    """Drop a partition after disconnecting the states that follow its states."""
+    end_ts = end.timestamp()
+    session.execute(
+        update(States)
+        .where(States.last_updated_ts >= end_ts)
+        .where(
+            States.old_state_id.in_(
+                select(States.state_id).where(States.last_updated_ts < end_ts)
+            )
+        )
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    states_manager = instance.states_manager
+    if committed_state_ids := states_manager.get_committed_state_ids():
+        states_manager.evict_purged_state_ids(
+            set(
+                session.execute(
+                    select(States.state_id)
+                    .where(States.state_id.in_(committed_state_ids))
+                    .where(States.last_updated_ts < end_ts)
+                ).scalars()
+            )
+        )
+    session.execute(text(f"DROP TABLE {name}"))
+
+
+def rotate_states_partitions(instance: Recorder, drop_before: datetime | None) -> None:
+    """Create the upcoming partitions and drop the ones before drop_before.
+
+    Dropping a partition replaces deleting its states row by row, the
+    purge only deletes the states left in the default partition and in
+    the partition that holds drop_before.
+    """
+    today = dt_util.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        partitions = _list_partitions(session)
+
+    for days in range(PARTITIONS_AHEAD + 1):
+        if (day := today + timedelta(days=days)) in partitions:
+            continue
+        try:
+            with session_scope(session=instance.get_session()) as session:
+                session.execute(text(_create_partition_sql(day)))
+        except SQLAlchemyError:
+            # The default partition already has states of the day
+            _LOGGER.exception("Could not create states partition %s", day.date())
+
+    if drop_before is None:
+        return
+    for day, name in sorted(partitions.items()):
+        if (end := day + timedelta(days=1)) > drop_before:
+            break
+        _LOGGER.debug("Dropping states partition %s", name)
+        with session_scope(session=instance.get_session()) as session:
+            _drop_partition(instance, session, name, end)
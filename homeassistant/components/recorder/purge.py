@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
 from .db_schema import Events, States, StatesMeta
@@ -18,8 +21,11 @@ from .models import DatabaseEngine
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
+    attributes_ids_last_used,
     data_ids_exist_in_events,
     data_ids_exist_in_events_with_fast_in_distinct,
+    data_ids_last_used,
+    delete_downsampled_states_rows,
     delete_event_data_rows,
     delete_event_rows,
     delete_event_types_rows,
@@ -30,6 +36,7 @@ from .queries import (
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    find_downsampled_states_to_purge,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
@@ -40,8 +47,11 @@ from .queries import (
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
+    find_unused_event_data_to_purge,
+    find_unused_state_attributes_to_purge,
 )
 from .repack import repack_database
+from .table_managers import LAST_USED_INTERVAL
 from .util import retryable_database_job, session_scope
 
 if TYPE_CHECKING:
@@ -53,6 +63,91 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# A purge runs in cycles and the recorder commits the queued events between
+# them. The number of batches of a cycle is adapted so a cycle holds the
+# recorder thread for about this long.
+PURGE_CYCLE_TARGET_SECONDS = 1.0
+MIN_BATCHES_PER_PURGE = 1
+MAX_BATCHES_PER_PURGE = 200
+
+
+def _adapt_batches(batches: int, factor: float) -> int:
+    """Return the number of batches scaled by factor within the bounds."""
+    return min(
+        MAX_BATCHES_PER_PURGE, max(MIN_BATCHES_PER_PURGE, round(batches * factor))
+    )
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Track the progress of a purge that runs in multiple cycles."""
+
+    purge_before: datetime
+    started: datetime = field(default_factory=dt_util.utcnow)
+    finished: datetime | None = None
+    states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE
+    events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE
+    cycles: int = 0
+    states_purged: int = 0
+    events_purged: int = 0
+    duration: float = 0.0
+    # The oldest and the newest last_updated_ts of the purged states, the states
+    # are purged oldest first so everything before the high-water mark is gone
+    oldest_ts: float | None = None
+    high_water_mark_ts: float | None = None
+
+    def add_purged_states(self, count: int, oldest_ts: float, newest_ts: float) -> None:
+        """Record a batch of purged states."""
+        self.states_purged += count
+        if self.oldest_ts is None:
+            self.oldest_ts = oldest_ts
+        if self.high_water_mark_ts is None or newest_ts > self.high_water_mark_ts:
+            self.high_water_mark_ts = newest_ts
+
+    def cycle_done(self, duration: float, finished: bool) -> None:
+        """Record a purge cycle and adapt the batches of the next one."""
+        self.cycles += 1
+        self.duration += duration
+        if finished:
+            self.finished = dt_util.utcnow()
+            return
+        # Grow at most twofold and shrink at most by half so a single slow statement,
+        # for example during a checkpoint, does not collapse the batches
+        factor = min(2.0, max(0.5, PURGE_CYCLE_TARGET_SECONDS / max(duration, 0.001)))
+        self.states_batch_size = _adapt_batches(self.states_batch_size, factor)
+        self.events_batch_size = _adapt_batches(self.events_batch_size, factor)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dictionary."""
+        progress: float | None = None
+        if self.finished:
+            progress = 1.0
+        elif self.oldest_ts is not None and self.high_water_mark_ts is not None:
+            total = self.purge_before.timestamp() - self.oldest_ts
+            progress = (
+                min(1.0, (self.high_water_mark_ts - self.oldest_ts) / total)
+                if total > 0
+                else 1.0
+            )
+        rows = self.states_purged + self.events_purged
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "started": self.started.isoformat(),
+            "finished": self.finished.isoformat() if self.finished else None,
+            "high_water_mark": dt_util.utc_from_timestamp(
+                self.high_water_mark_ts
+            ).isoformat()
+            if self.high_water_mark_ts is not None
+            else None,
+            "progress": progress,
+            "cycles": self.cycles,
+            "states_purged": self.states_purged,
+            "events_purged": self.events_purged,
+            "rows_per_second": rows / self.duration if self.duration else None,
+            "states_batch_size": self.states_batch_size,
+            "events_batch_size": self.events_batch_size,
+        }
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -62,6 +157,7 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
@@ -87,11 +183,20 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, progress
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, progress
             )
+            if not has_more_to_purge:
+                # Only once all states and events before purge_before are gone
+                # the shared rows last used before it are no longer used
+                has_more_to_purge |= _purge_unused_state_attributes(
+                    instance, session, purge_before
+                )
+                has_more_to_purge |= _purge_unused_event_data(
+                    instance, session, purge_before
+                )
 
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
@@ -99,13 +204,24 @@ def purge_old_data(
         short_term_statistics = _select_short_term_statistics_to_purge(
             session, purge_before, instance.max_bind_vars
         )
+        downsampled_states = _select_downsampled_states_to_purge(
+            session, purge_before, instance.max_bind_vars
+        )
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
 
-        if has_more_to_purge or statistics_runs or short_term_statistics:
+        if downsampled_states:
+            _purge_downsampled_states(session, downsampled_states)
+
+        if (
+            has_more_to_purge
+            or statistics_runs
+            or short_term_statistics
+            or downsampled_states
+        ):
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
@@ -178,6 +294,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -193,16 +310,18 @@ def _purge_states_and_attributes_ids(
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(states_batch_size):
-        state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before, max_bind_vars
+        state_ids, attributes_ids, oldest_ts, newest_ts = (
+            _select_state_attributes_ids_to_purge(session, purge_before, max_bind_vars)
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        if progress:
+            progress.add_purged_states(len(state_ids), oldest_ts, newest_ts)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    _purge_unused_attributes_ids(instance, session, attributes_ids_batch, purge_before)
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -215,6 +334,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -235,9 +355,11 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        if progress:
+            progress.events_purged += len(event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    _purge_unused_data_ids(instance, session, data_ids_batch, purge_before)
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -247,22 +369,34 @@ def _purge_events_and_data_ids(
 
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
-) -> tuple[set[int], set[int]]:
-    """Return sets of state and attribute ids to purge."""
+) -> tuple[set[int], set[int], float, float]:
+    """Return sets of state and attribute ids to purge.
+
+    Also returns the oldest and the newest last_updated_ts of the states.
+    """
     state_ids = set()
     attributes_ids = set()
-    for state_id, attributes_id in session.execute(
+    last_updated_timestamps: list[float] = []
+    for state_id, attributes_id, last_updated_ts in session.execute(
         find_states_to_purge(purge_before.timestamp(), max_bind_vars)
     ).all():
         state_ids.add(state_id)
         if attributes_id:
             attributes_ids.add(attributes_id)
+        last_updated_timestamps.append(last_updated_ts)
     _LOGGER.debug(
         "Selected %s state ids and %s attributes_ids to remove",
         len(state_ids),
         len(attributes_ids),
     )
-    return state_ids, attributes_ids
+    if not last_updated_timestamps:
+        return state_ids, attributes_ids, 0.0, 0.0
+    return (
+        state_ids,
+        attributes_ids,
+        min(last_updated_timestamps),
+        max(last_updated_timestamps),
+    )
 
 
 def _select_event_data_ids_to_purge(
@@ -361,14 +495,54 @@ def _select_unused_attributes_ids(
     return to_remove
 
 
+def _select_ids_to_check_by_last_used(
+    instance: Recorder,
+    session: Session,
+    ids: set[int],
+    last_used_stmt: Callable[[Iterable[int]], StatementLambdaElement],
+    purge_before: datetime,
+) -> set[int]:
+    """Return the ids of shared rows that need a check if they are still used.
+
+    A row last used at or after purge_before is still used by a row that is
+    not purged, and a row last used more than LAST_USED_INTERVAL before it
+    is purged with an index lookup once all older rows are gone. Only rows
+    without a last_used_ts or in between need a scan of the rows using them.
+    """
+    purge_before_ts = purge_before.timestamp()
+    last_used_before_ts = purge_before_ts - LAST_USED_INTERVAL
+    to_check: set[int] = set()
+    for ids_chunk in chunked_or_all(ids, instance.max_bind_vars):
+        to_check.update(
+            id_
+            for id_, last_used_ts in session.execute(last_used_stmt(ids_chunk)).all()
+            if last_used_ts is None
+            or last_used_before_ts <= last_used_ts < purge_before_ts
+        )
+    return to_check
+
+
 def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
     attributes_ids_batch: set[int],
+    purge_before: datetime | None = None,
 ) -> None:
     """Purge unused attributes ids."""
     database_engine = instance.database_engine
     assert database_engine is not None
+    if (
+        purge_before
+        and attributes_ids_batch
+        and instance.state_attributes_manager.tracks_last_used
+    ):
+        attributes_ids_batch = _select_ids_to_check_by_last_used(
+            instance,
+            session,
+            attributes_ids_batch,
+            attributes_ids_last_used,
+            purge_before,
+        )
     if unused_attribute_ids_set := _select_unused_attributes_ids(
         instance, session, attributes_ids_batch, database_engine
     ):
@@ -412,16 +586,69 @@ def _select_unused_event_data_ids(
 
 
 def _purge_unused_data_ids(
-    instance: Recorder, session: Session, data_ids_batch: set[int]
+    instance: Recorder,
+    session: Session,
+    data_ids_batch: set[int],
+    purge_before: datetime | None = None,
 ) -> None:
     database_engine = instance.database_engine
     assert database_engine is not None
+    if purge_before and data_ids_batch and instance.event_data_manager.tracks_last_used:
+        data_ids_batch = _select_ids_to_check_by_last_used(
+            instance, session, data_ids_batch, data_ids_last_used, purge_before
+        )
     if unused_data_ids_set := _select_unused_event_data_ids(
         instance, session, data_ids_batch, database_engine
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
 
 
+def _purge_unused_state_attributes(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Purge state attributes that were last used before purge_before.
+
+    Returns true if there may be more state attributes to purge.
+    """
+    if not instance.state_attributes_manager.tracks_last_used:
+        return False
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.execute(
+            find_unused_state_attributes_to_purge(
+                purge_before.timestamp() - LAST_USED_INTERVAL, instance.max_bind_vars
+            )
+        ).all()
+    }
+    _LOGGER.debug("Selected %s unused attributes to remove", len(attributes_ids))
+    if attributes_ids:
+        _purge_batch_attributes_ids(instance, session, attributes_ids)
+    return len(attributes_ids) >= instance.max_bind_vars
+
+
+def _purge_unused_event_data(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Purge event data that were last used before purge_before.
+
+    Returns true if there may be more event data to purge.
+    """
+    if not instance.event_data_manager.tracks_last_used:
+        return False
+    data_ids = {
+        data_id
+        for (data_id,) in session.execute(
+            find_unused_event_data_to_purge(
+                purge_before.timestamp() - LAST_USED_INTERVAL, instance.max_bind_vars
+            )
+        ).all()
+    }
+    _LOGGER.debug("Selected %s unused event data to remove", len(data_ids))
+    if data_ids:
+        _purge_batch_data_ids(instance, session, data_ids)
+    return len(data_ids) >= instance.max_bind_vars
+
+
 def _select_statistics_runs_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> list[int]:
@@ -454,6 +681,17 @@ def _select_short_term_statistics_to_purge(
     return [statistic_id for (statistic_id,) in statistics]
 
 
+def _select_downsampled_states_to_purge(
+    session: Session, purge_before: datetime, max_bind_vars: int
+) -> list[int]:
+    """Return a list of downsampled states to purge."""
+    downsampled_states = session.execute(
+        find_downsampled_states_to_purge(purge_before, max_bind_vars)
+    ).all()
+    _LOGGER.debug("Selected %s downsampled states to remove", len(downsampled_states))
+    return [downsampled_id for (downsampled_id,) in downsampled_states]
+
+
 def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -570,6 +808,12 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
+def _purge_downsampled_states(session: Session, downsampled_states: list[int]) -> None:
+    """Delete by id."""
+    deleted_rows = session.execute(delete_downsampled_states_rows(downsampled_states))
+    _LOGGER.debug("Deleted %s downsampled states", deleted_rows)
+
+
 def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
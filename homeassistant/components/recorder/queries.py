@@ -17,6 +17,7 @@ from .db_schema import (
     RecorderRuns,
     StateAttributes,
     States,
+    StatesDownsampled,
     StatesMeta,
     Statistics,
     StatisticsRuns,
@@ -313,6 +314,26 @@ def data_ids_exist_in_events_with_fast_in_distinct(
     )
 
 
+def attributes_ids_last_used(
+    attributes_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Find the last_used_ts of attributes ids."""
+    return lambda_stmt(
+        lambda: select(
+            StateAttributes.attributes_id, StateAttributes.last_used_ts
+        ).filter(StateAttributes.attributes_id.in_(attributes_ids))
+    )
+
+
+def data_ids_last_used(data_ids: Iterable[int]) -> StatementLambdaElement:
+    """Find the last_used_ts of event data ids."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id, EventData.last_used_ts).filter(
+            EventData.data_id.in_(data_ids)
+        )
+    )
+
+
 def _event_data_id_exist(data_id: int | None) -> Select:
     """Check if a event data id exists in the events table."""
     return select(func.min(Events.data_id)).where(Events.data_id == data_id)
@@ -591,6 +612,17 @@ def delete_statistics_short_term_rows(
     )
 
 
+def delete_downsampled_states_rows(
+    downsampled_states: Iterable[int],
+) -> StatementLambdaElement:
+    """Delete states_downsampled rows."""
+    return lambda_stmt(
+        lambda: delete(StatesDownsampled)
+        .where(StatesDownsampled.id.in_(downsampled_states))
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_event_rows(
     event_ids: Iterable[int],
 ) -> StatementLambdaElement:
@@ -621,6 +653,7 @@ def find_events_to_purge(
     return lambda_stmt(
         lambda: select(Events.event_id, Events.data_id)
         .filter(Events.time_fired_ts < purge_before)
+        .order_by(Events.time_fired_ts)
         .limit(max_bind_vars)
     )
 
@@ -630,8 +663,31 @@ def find_states_to_purge(
 ) -> StatementLambdaElement:
     """Find states to purge."""
     return lambda_stmt(
-        lambda: select(States.state_id, States.attributes_id)
+        lambda: select(States.state_id, States.attributes_id, States.last_updated_ts)
         .filter(States.last_updated_ts < purge_before)
+        .order_by(States.last_updated_ts)
+        .limit(max_bind_vars)
+    )
+
+
+def find_unused_state_attributes_to_purge(
+    last_used_before: float, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find state attributes that were last used before a timestamp."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id)
+        .filter(StateAttributes.last_used_ts < last_used_before)
+        .limit(max_bind_vars)
+    )
+
+
+def find_unused_event_data_to_purge(
+    last_used_before: float, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find event data that were last used before a timestamp."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id)
+        .filter(EventData.last_used_ts < last_used_before)
         .limit(max_bind_vars)
     )
 
@@ -648,6 +704,18 @@ def find_short_term_statistics_to_purge(
     )
 
 
+def find_downsampled_states_to_purge(
+    purge_before: datetime, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find downsampled states to purge."""
+    purge_before_ts = purge_before.timestamp()
+    return lambda_stmt(
+        lambda: select(StatesDownsampled.id)
+        .filter(StatesDownsampled.start_ts < purge_before_ts)
+        .limit(max_bind_vars)
+    )
+
+
 def find_statistics_runs_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -0,0 +1,272 @@
+"""On-disk spill queue for the recorder."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import struct
+import threading
+from typing import IO, Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+_FRAME_HEADER = struct.Struct("<I")
+
+# Buffered frames are written to disk once they reach this size
+SPILL_QUEUE_FLUSH_SIZE = 1024**2
+
+
+def _encode_context(context: Context) -> list[str | None]:
+    """Encode a context."""
+    return [context.id, context.user_id, context.parent_id]
+
+
+def _decode_context(data: list[str | None]) -> Context:
+    """Decode a context."""
+    return Context(id=data[0], user_id=data[1], parent_id=data[2])
+
+
+def _encode_state(state: State | None) -> list[Any] | None:
+    """Encode a state."""
+    if state is None:
+        return None
+    return [
+        state.state,
+        state.attributes,
+        state.last_updated_timestamp,
+        state.last_changed_timestamp,
+        state.last_reported_timestamp,
+        _encode_context(state.context),
+        sorted(state_info["unrecorded_attributes"])
+        if (state_info := state.state_info)
+        else None,
+    ]
+
+
+def _decode_state(entity_id: str, data: list[Any] | None) -> State | None:
+    """Decode a state."""
+    if data is None:
+        return None
+    (
+        state,
+        attributes,
+        last_updated_ts,
+        last_changed_ts,
+        last_reported_ts,
+        context,
+        unrecorded_attributes,
+    ) = data
+    return State(
+        entity_id,
+        state,
+        attributes,
+        last_reported=None
+        if last_reported_ts == last_updated_ts
+        else dt_util.utc_from_timestamp(last_reported_ts),
+        context=_decode_context(context),
+        validate_entity_id=False,
+        state_info=None
+        if unrecorded_attributes is None
+        else {"unrecorded_attributes": frozenset(unrecorded_attributes)},
+        last_updated_timestamp=last_updated_ts,
+        last_changed_timestamp=last_changed_ts,
+    )
+
+
+def encode_event(event: Event[Any]) -> bytes:
+    """Encode an event into a frame."""
+    header = [
+        event.event_type,
+        event.time_fired_timestamp,
+        event.origin.value,
+        _encode_context(event.context),
+    ]
+    if event.event_type == EVENT_STATE_CHANGED:
+        data = event.data
+        payload = json_bytes(
+            [
+                *header,
+                data["entity_id"],
+                _encode_state(data["old_state"]),
+                _encode_state(data["new_state"]),
+            ]
+        )
+    else:
+        payload = json_bytes([*header, event.data])
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+def decode_event(payload: bytes) -> Event[Any]:
+    """Decode the payload of a frame into an event."""
+    frame: list[Any] = json_loads(payload)  # type: ignore[assignment]
+    event_type, time_fired_ts, origin, context = frame[:4]
+    if event_type == EVENT_STATE_CHANGED:
+        entity_id = frame[4]
+        data = {
+            "entity_id": entity_id,
+            "old_state": _decode_state(entity_id, frame[5]),
+            "new_state": _decode_state(entity_id, frame[6]),
+        }
+    else:
+        data = frame[4]
+    return Event(
+        event_type,
+        data,
+        EventOrigin(origin),
+        time_fired_ts,
+        _decode_context(context),
+    )
+
+
+class SpillQueue:
+    """Append-only file of events waiting to be recorded.
+
+    Events are put from the event loop into an in-memory buffer of
+    length prefixed frames which is written to the file by flush.
+    The recorder thread reads the events back in the order they were
+    put; the file is truncated once it has been read completely.
+
+    If the file cannot be written the queue is failed and the frames
+    that were not written stay in the buffer to be read from memory.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the spill queue."""
+        self.path = path
+        self._buffer = bytearray()
+        self._buffered_events = 0
+        self._buffer_lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._file: IO[bytes] | None = None
+        self._file_events = 0
+        self._read_pos = 0
+        self._write_pos = 0
+        self.flush_scheduled = False
+        self.failed = False
+
+    def __len__(self) -> int:
+        """Return the number of events that have not been read yet."""
+        return self._buffered_events + self._file_events
+
+    def put(self, event: Event[Any]) -> bool:
+        """Put an event into the spill queue.
+
+        Returns True if the buffer should be flushed.
+
+        Events that cannot be serialized raise TypeError.
+
+        This call is not thread-safe and must be called from the
+        event loop.
+        """
+        frame = encode_event(event)
+        with self._buffer_lock:
+            self._buffer += frame
+            self._buffered_events += 1
+            return len(self._buffer) >= SPILL_QUEUE_FLUSH_SIZE
+
+    def _write_buffer(self) -> None:
+        """Write the buffered frames to the file.
+
+        Must be called with the file lock held.
+        """
+        if self.failed:
+            return
+        with self._buffer_lock:
+            buffer = self._buffer
+            events = self._buffered_events
+            self._buffer = bytearray()
+            self._buffered_events = 0
+        if not events:
+            return
+        try:
+            if self._file is None:
+                self._file = open(self.path, "w+b")  # noqa: SIM115
+            self._file.seek(self._write_pos)
+            self._file.write(buffer)
+            self._file.flush()
+        except OSError:
+            _LOGGER.exception(
+                "Error writing to the recorder spill queue, %s events will be "
+                "read from memory",
+                events,
+            )
+            if self._file is not None:
+                # Remove the frames that were only partially written
+                with contextlib.suppress(OSError):
+                    self._file.truncate(self._write_pos)
+            with self._buffer_lock:
+                self._buffer[:0] = buffer
+                self._buffered_events += events
+            self.failed = True
+            return
+        self._write_pos += len(buffer)
+        self._file_events += events
+
+    def flush(self) -> None:
+        """Write the buffered frames to the file."""
+        self.flush_scheduled = False
+        with self._file_lock:
+            self._write_buffer()
+
+    def get_batch(self, max_events: int) -> list[Event[Any]]:
+        """Read up to max_events events in the order they were put.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        events: list[Event[Any]] = []
+        with self._file_lock:
+            self._write_buffer()
+            if (file := self._file) is not None and self._file_events:
+                file.seek(self._read_pos)
+                while len(events) < max_events and file.tell() < self._write_pos:
+                    (length,) = _FRAME_HEADER.unpack(file.read(_FRAME_HEADER.size))
+                    events.append(decode_event(file.read(length)))
+                self._read_pos = file.tell()
+                self._file_events -= len(events)
+                if not self._file_events:
+                    # Everything has been read, start over
+                    # to keep the file from growing forever
+                    file.seek(0)
+                    file.truncate()
+                    self._read_pos = self._write_pos = 0
+            if self.failed and len(events) < max_events:
+                self._read_buffer(events, max_events)
+        return events
+
+    def _read_buffer(self, events: list[Event[Any]], max_events: int) -> None:
+        """Read the frames that could not be written from the buffer.
+
+        Must be called with the file lock held.
+        """
+        with self._buffer_lock:
+            buffer = self._buffer
+            pos = 0
+            while len(events) < max_events and pos < len(buffer):
+                (length,) = _FRAME_HEADER.unpack_from(buffer, pos)
+                pos += _FRAME_HEADER.size
+                events.append(decode_event(bytes(buffer[pos : pos + length])))
+                pos += length
+                self._buffered_events -= 1
+            del buffer[:pos]
+
+    def close(self) -> None:
+        """Close and remove the spill queue file.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with self._file_lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path)
@@ -11,7 +11,8 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
-from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
+import threading
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypedDict, cast
 
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
@@ -62,6 +63,7 @@ from .db_schema import (
     StatisticsRuns,
     StatisticsShortTerm,
 )
+from .downsample import compile_downsampled_states
 from .models import (
     StatisticData,
     StatisticDataTimestamp,
@@ -155,6 +157,13 @@ UNIT_CLASSES = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_DURING_PERIOD_CACHE = "recorder_statistics_during_period_cache"
+
+# Periods whose reduced results are cached by statistics_during_period
+CACHED_STATISTICS_PERIODS = {"day", "week", "month"}
+# The cache is bounded by the number of cached rows, each row is a small
+# dict of floats
+MAX_CACHED_STATISTICS_ROWS = 20000
 
 
 def mean(values: list[float]) -> float | None:
@@ -198,6 +207,112 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+class StatisticsDuringPeriodKey(NamedTuple):
+    """Key of a cached statistics_during_period result."""
+
+    statistic_ids: frozenset[str]
+    period: str
+    units: tuple[tuple[str, str], ...] | None
+    types: frozenset[str]
+    start_ts: float
+    end_ts: float | None
+    # The display unit depends on the unit of the current state
+    state_units: tuple[str | None, ...]
+
+
+class StatisticsDuringPeriodCache:
+    """Cache for the reduced results of statistics_during_period.
+
+    Results are invalidated when statistics they cover are written,
+    and the least recently used results are evicted once more than
+    MAX_CACHED_STATISTICS_ROWS rows are cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._results: dict[
+            StatisticsDuringPeriodKey, dict[str, list[StatisticsRow]]
+        ] = {}
+        self._rows = 0
+        # Incremented by each invalidation, a result is only cached if
+        # nothing was invalidated while it was queried
+        self.generation = 0
+
+    def get(
+        self, key: StatisticsDuringPeriodKey
+    ) -> dict[str, list[StatisticsRow]] | None:
+        """Return a copy of a cached result."""
+        with self._lock:
+            if (result := self._results.pop(key, None)) is None:
+                return None
+            # Move the result to the end to keep the order of use
+            self._results[key] = result
+        return _copy_statistics_result(result)
+
+    def set(
+        self,
+        key: StatisticsDuringPeriodKey,
+        generation: int,
+        result: dict[str, list[StatisticsRow]],
+    ) -> None:
+        """Cache a copy of a result queried since generation."""
+        if (rows := _count_statistics_rows(result)) > MAX_CACHED_STATISTICS_ROWS:
+            return
+        result = _copy_statistics_result(result)
+        with self._lock:
+            if generation != self.generation:
+                return
+            if (old_result := self._results.pop(key, None)) is not None:
+                self._rows -= _count_statistics_rows(old_result)
+            self._results[key] = result
+            self._rows += rows
+            while self._rows > MAX_CACHED_STATISTICS_ROWS:
+                oldest_key = next(iter(self._results))
+                self._rows -= _count_statistics_rows(self._results.pop(oldest_key))
+
+    def invalidate(
+        self, statistic_ids: Iterable[str] | None, start_ts: float | None = None
+    ) -> None:
+        """Invalidate the results with statistics written from start_ts.
+
+        If statistic_ids is None the results of all statistics are invalidated,
+        if start_ts is None results are invalidated regardless of their period.
+        """
+        ids = None if statistic_ids is None else set(statistic_ids)
+        with self._lock:
+            self.generation += 1
+            for key in [
+                key
+                for key in self._results
+                if (ids is None or not ids.isdisjoint(key.statistic_ids))
+                and (start_ts is None or key.end_ts is None or start_ts < key.end_ts)
+            ]:
+                self._rows -= _count_statistics_rows(self._results.pop(key))
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self.generation += 1
+            self._results.clear()
+            self._rows = 0
+
+
+def _count_statistics_rows(result: dict[str, list[StatisticsRow]]) -> int:
+    """Return the number of rows of a statistics result."""
+    return sum(len(rows) for rows in result.values())
+
+
+def _copy_statistics_result(
+    result: dict[str, list[StatisticsRow]],
+) -> dict[str, list[StatisticsRow]]:
+    """Copy a statistics result, callers are allowed to modify the rows."""
+    return {
+        statistic_id: [cast(StatisticsRow, row.copy()) for row in rows]
+        for statistic_id, rows in result.items()
+    }
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -455,6 +570,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
     start = start.replace(minute=0, second=0, microsecond=0)
     # Commit every 12 hours of data
     commit_interval = 60 / period_size * 12
+    compiled_since: datetime | None = None
 
     with session_scope(
         session=instance.get_session(),
@@ -469,6 +585,8 @@ def compile_missing_statistics(instance: Recorder) -> bool:
             )
 
         periods_without_commit = 0
+        if start < last_period:
+            compiled_since = start
         while start < last_period:
             periods_without_commit += 1
             end = start + timedelta(minutes=period_size)
@@ -482,6 +600,11 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    if compiled_since is not None:
+        get_statistics_during_period_cache(instance.hass).invalidate(
+            None, compiled_since.replace(minute=0).timestamp()
+        )
+
     return True
 
 
@@ -508,6 +631,12 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
             instance, session, start, fire_events
         )
 
+    if start.minute == 55:
+        # The hourly statistics of the hour were compiled
+        get_statistics_during_period_cache(instance.hass).invalidate(
+            None, (start - timedelta(minutes=55)).timestamp()
+        )
+
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
         # statistics meta data into the cache in a fresh session to ensure that the
@@ -590,6 +719,8 @@ def _compile_statistics(
         # A full hour is ready, summarize it
         _compile_hourly_statistics(session, start)
 
+    compile_downsampled_states(session, start, end)
+
     session.add(StatisticsRuns(start=start))
 
     if fire_events:
@@ -735,6 +866,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_statistics_during_period_cache(instance.hass).invalidate(statistic_ids)
 
 
 def update_statistics_metadata(
@@ -760,6 +892,11 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    get_statistics_during_period_cache(instance.hass).invalidate(
+        {statistic_id, new_statistic_id}
+        if isinstance(new_statistic_id, str)
+        else {statistic_id}
+    )
 
 
 async def async_list_statistic_ids(
@@ -1753,6 +1890,27 @@ def _statistics_during_period_with_session(
         if end_time is not None:
             end_time = _find_month_end_time(dt_util.as_local(end_time))
 
+    cache = get_statistics_during_period_cache(hass)
+    generation = cache.generation
+    cache_key: StatisticsDuringPeriodKey | None = None
+    if statistic_ids is not None and period in CACHED_STATISTICS_PERIODS:
+        cache_key = StatisticsDuringPeriodKey(
+            frozenset(statistic_ids),
+            period,
+            tuple(sorted(units.items())) if units else None,
+            frozenset(_types),
+            start_time.timestamp(),
+            end_time.timestamp() if end_time is not None else None,
+            tuple(
+                state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                if (state := hass.states.get(statistic_id))
+                else None
+                for statistic_id in sorted(statistic_ids)
+            ),
+        )
+        if (cached_result := cache.get(cache_key)) is not None:
+            return cached_result
+
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
@@ -1764,6 +1922,8 @@ def _statistics_during_period_with_session(
     )
 
     if not stats:
+        if cache_key is not None:
+            cache.set(cache_key, generation, {})
         return {}
 
     result = _sorted_statistics_to_dict(
@@ -1791,6 +1951,9 @@ def _statistics_during_period_with_session(
             hass, session, start_time, units, _types, table, metadata, result
         )
 
+    if cache_key is not None:
+        cache.set(cache_key, generation, result)
+
     # Return statistics combined with metadata
     return result
 
@@ -2345,6 +2508,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_STATISTICS_DURING_PERIOD_CACHE)
+def get_statistics_during_period_cache(
+    hass: HomeAssistant,
+) -> StatisticsDuringPeriodCache:
+    """Get the statistics during period cache."""
+    return StatisticsDuringPeriodCache()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2410,9 +2581,14 @@ def import_statistics(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
-            instance, session, metadata, statistics, table
-        )
+        _import_statistics_with_session(instance, session, metadata, statistics, table)
+
+    # The imported statistics may update the metadata, so all
+    # results of the statistic are invalidated
+    get_statistics_during_period_cache(instance.hass).invalidate(
+        {metadata["statistic_id"]}
+    )
+    return True
 
 
 @retryable_database_job("adjust_statistics")
@@ -2454,6 +2630,9 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+    get_statistics_during_period_cache(instance.hass).invalidate(
+        {statistic_id}, start_time.replace(minute=0).timestamp()
+    )
     return True
 
 
@@ -2522,6 +2701,8 @@ def change_statistics_unit(
             session, statistic_id, new_unit
         )
 
+    get_statistics_during_period_cache(instance.hass).invalidate({statistic_id})
+
 
 @callback
 def async_change_statistics_unit(
@@ -55,6 +55,20 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_purge_info(instance: Recorder) -> dict[str, Any]:
+    """Get the progress of the current or last purge."""
+    if not (purge_progress := instance.purge_progress):
+        return {}
+    progress = purge_progress.as_dict()
+    purge_info: dict[str, Any] = {}
+    if progress["progress"] is not None:
+        purge_info["purge_progress"] = f"{progress['progress']:.0%}"
+    if progress["rows_per_second"] is not None:
+        purge_info["purge_throughput"] = f"{progress['rows_per_second']:.0f} rows/s"
+    return purge_info
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -72,4 +86,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | _async_get_purge_info(instance)
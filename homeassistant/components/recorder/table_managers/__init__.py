@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
 from lru import LRU
+from sqlalchemy import bindparam, or_, update
+from sqlalchemy.orm.session import Session
 
 from homeassistant.util.event_type import EventType
 
+from ..const import LAST_USED_SCHEMA_VERSION
+from ..db_schema import EventData, StateAttributes
+
 if TYPE_CHECKING:
     from ..core import Recorder
 
@@ -74,3 +80,108 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
         lru = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+
+# The last_used_ts of a shared row is advanced at most once per this many
+# seconds, so it is never older than the newest row using it minus this
+LAST_USED_INTERVAL = 3600
+
+
+class BaseLastUsedLRUTableManager[_DataT: (EventData, StateAttributes)](
+    BaseLRUTableManager[_DataT]
+):
+    """Base class for LRU table managers of rows shared by other rows.
+
+    The shared rows carry a last_used_ts generation marker so the purge
+    can find the rows that are no longer used with an index lookup instead
+    of scanning the tables that use them.
+    """
+
+    _table: type[_DataT]
+    _id_column: str
+
+    def __init__(self, recorder: Recorder, lru_size: int) -> None:
+        """Initialize the table manager."""
+        super().__init__(recorder, lru_size)
+        self._last_used: LRU[int, float] = LRU(lru_size)
+        self._pending_last_used: dict[int, float] = {}
+
+    @property
+    def tracks_last_used(self) -> bool:
+        """Return if the database has the last_used_ts column."""
+        return self.recorder.schema_version >= LAST_USED_SCHEMA_VERSION
+
+    def mark_used(self, id_: int, timestamp: float) -> None:
+        """Mark a row as used by a row at timestamp.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self.tracks_last_used or (
+            (last_used := self._last_used.get(id_)) is not None
+            and timestamp - last_used < LAST_USED_INTERVAL
+        ):
+            return
+        if timestamp > self._pending_last_used.get(id_, 0):
+            self._pending_last_used[id_] = timestamp
+
+    def write_pending_last_used(self, session: Session) -> None:
+        """Write the pending last_used_ts markers in the session.
+
+        A marker only moves forward, a row may already have been marked
+        with a newer timestamp when the markers were not cached, for
+        example after a restart.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._pending_last_used:
+            return
+        table = self._table.__table__
+        last_used_ts = table.c.last_used_ts
+        session.execute(
+            update(table)
+            .where(table.c[self._id_column] == bindparam("b_id"))
+            .where(or_(last_used_ts.is_(None), last_used_ts < bindparam("b_ts")))
+            .values(last_used_ts=bindparam("b_ts")),
+            [
+                {"b_id": id_, "b_ts": timestamp}
+                for id_, timestamp in self._pending_last_used.items()
+            ],
+        )
+
+    def post_commit_last_used(self, new_rows: Iterable[_DataT]) -> None:
+        """Remember the committed last_used_ts markers.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        last_used = self._last_used
+        for id_, timestamp in self._pending_last_used.items():
+            last_used[id_] = timestamp
+        self._pending_last_used.clear()
+        if not self.tracks_last_used:
+            return
+        for row in new_rows:
+            if row.last_used_ts is not None:
+                last_used[getattr(row, self._id_column)] = row.last_used_ts
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._last_used.clear()
+        self._pending_last_used.clear()
+
+    def adjust_lru_size(self, new_size: int) -> None:
+        """Adjust the LRU cache size.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().adjust_lru_size(new_size)
+        if new_size > self._last_used.get_size():
+            self._last_used.set_size(new_size)
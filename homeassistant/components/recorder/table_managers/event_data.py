@@ -15,7 +15,7 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 from ..db_schema import EventData
 from ..queries import get_shared_event_datas
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseLastUsedLRUTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -26,9 +26,12 @@ CACHE_SIZE = 2048
 _LOGGER = logging.getLogger(__name__)
 
 
-class EventDataManager(BaseLRUTableManager[EventData]):
+class EventDataManager(BaseLastUsedLRUTableManager[EventData]):
     """Manage the EventData table."""
 
+    _table = EventData
+    _id_column = "data_id"
+
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
@@ -123,6 +126,7 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         """
         for shared_data, db_event_data in self._pending.items():
             self._id_map[shared_data] = db_event_data.data_id
+        self.post_commit_last_used(self._pending.values())
         self._pending.clear()
 
     def evict_purged(self, data_ids: set[int]) -> None:
@@ -15,7 +15,7 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 from ..db_schema import StateAttributes
 from ..queries import get_shared_attributes
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseLastUsedLRUTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -31,9 +31,12 @@ CACHE_SIZE = 2048
 _LOGGER = logging.getLogger(__name__)
 
 
-class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
+class StateAttributesManager(BaseLastUsedLRUTableManager[StateAttributes]):
     """Manage the StateAttributes table."""
 
+    _table = StateAttributes
+    _id_column = "attributes_id"
+
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
@@ -134,6 +137,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         """
         for shared_attrs, db_state_attributes in self._pending.items():
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
+        self.post_commit_last_used(self._pending.values())
         self._pending.clear()
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
@@ -2,19 +2,52 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
 from ..db_schema import States
 
 
+class PendingStatesRow:
+    """A row of the states table waiting for a bulk insert.
+
+    Rows are plain column values and only exist when their metadata_id,
+    attributes_id and old_state_id are already known, so they can be
+    inserted without the ORM unit of work.
+    """
+
+    __slots__ = ("values", "state_id")
+
+    def __init__(self, values: dict[str, Any]) -> None:
+        """Initialize the row."""
+        self.values = values
+        self.state_id: int | None = None
+
+    @property
+    def last_reported_ts(self) -> float | None:
+        """Return the last reported timestamp."""
+        return self.values["last_reported_ts"]  # type: ignore[no-any-return]
+
+    @last_reported_ts.setter
+    def last_reported_ts(self, last_reported_ts: float | None) -> None:
+        """Set the last reported timestamp."""
+        self.values["last_reported_ts"] = last_reported_ts
+
+
 class StatesManager:
     """Manage the states table."""
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        self._pending: dict[str, States | PendingStatesRow] = {}
+        self._pending_rows: list[PendingStatesRow] = []
+        self._pending_old_state_rows: list[tuple[States, PendingStatesRow]] = []
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    def pop_pending(self, entity_id: str) -> States | PendingStatesRow | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -35,7 +68,7 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(self, entity_id: str, state: States | PendingStatesRow) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -45,6 +78,56 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_row(self, row: PendingStatesRow) -> None:
+        """Add a row to be bulk inserted on the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_rows.append(row)
+
+    def link_pending_old_state_row(self, state: States, row: PendingStatesRow) -> None:
+        """Set old_state_id of a state to the state_id of a row once inserted.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_old_state_rows.append((state, row))
+
+    def insert_pending_rows(self, session: Session) -> None:
+        """Bulk insert the pending rows and load their state_id.
+
+        Must be called before the session is flushed so states that
+        reference a pending row as old state can be linked.
+
+        Rows that already have a state_id are not inserted again, the
+        state_id is cleared by rollback_pending_rows if the transaction
+        that inserted them fails.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if rows := [row for row in self._pending_rows if row.state_id is None]:
+            result = session.execute(
+                insert(States).returning(States.state_id, sort_by_parameter_order=True),
+                [row.values for row in rows],
+            )
+            for row, state_id in zip(rows, result.scalars(), strict=True):
+                row.state_id = state_id
+        for state, row in self._pending_old_state_rows:
+            state.old_state_id = row.state_id
+
+    def rollback_pending_rows(self) -> None:
+        """Mark the pending rows as not inserted after a failed commit.
+
+        The rows are inserted again when the commit is retried.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for row in self._pending_rows:
+            row.state_id = None
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -64,6 +147,8 @@ class StatesManager:
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        self._pending_rows.clear()
+        self._pending_old_state_rows.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -74,6 +159,16 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_rows.clear()
+        self._pending_old_state_rows.clear()
+
+    def get_committed_state_ids(self) -> list[int]:
+        """Return the state_id of the last committed state of each entity.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return list(self._last_committed_id.values())
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -9,12 +9,13 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
-from . import entity_registry, purge, statistics
+from . import entity_registry, partition, purge, statistics
 from .const import DOMAIN
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
@@ -111,9 +112,25 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
+        progress = instance.purge_progress
+        if (
+            progress is None
+            or progress.finished
+            or progress.purge_before != self.purge_before
         ):
+            progress = instance.purge_progress = purge.PurgeProgress(self.purge_before)
+        start = time.monotonic()
+        finished = purge.purge_old_data(
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            progress.events_batch_size,
+            progress.states_batch_size,
+            progress,
+        )
+        progress.cycle_done(time.monotonic() - start, finished)
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -127,6 +144,21 @@ class PurgeTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class StatesPartitionTask(RecorderTask):
+    """Object to store information about a states partition task.
+
+    Creates the upcoming partitions of the states table and drops the
+    partitions that only hold states older than drop_before.
+    """
+
+    drop_before: datetime | None
+
+    def run(self, instance: Recorder) -> None:
+        """Rotate the states partitions."""
+        partition.rotate_states_partitions(instance, self.drop_before)
+
+
 @dataclass(slots=True)
 class PurgeEntitiesTask(RecorderTask):
     """Object to store entity information about purge task."""
@@ -291,6 +323,18 @@ class CommitTask(RecorderTask):
         instance._commit_event_session_or_retry()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class SpillQueueDrainTask(RecorderTask):
+    """Record events from the spill queue."""
+
+    until_empty: bool = False
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._drain_spill_queue(self.until_empty)  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class AddRecorderPlatformTask(RecorderTask):
     """Add a recorder platform."""
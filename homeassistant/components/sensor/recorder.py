@@ -4,11 +4,13 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 import datetime
 import itertools
 import logging
 import math
-from typing import Any
+import operator
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -25,6 +27,9 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
@@ -33,7 +38,6 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, State, split_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
-from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.loader import async_suggest_report_issue
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
@@ -94,8 +98,18 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
+@dataclass(slots=True)
+class _FloatStates:
+    """The float states of an entity, one list per column."""
+
+    values: list[float]
+    timestamps: list[float]
+    states: list[str]
+    attributes: list[dict[str, Any]]
+
+
 def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    values: list[float], timestamps: list[float], start_ts: float, end_ts: float
 ) -> float:
     """Calculate a time weighted average.
 
@@ -103,33 +117,19 @@ def _time_weighted_average(
     state changes.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
-    accumulated = 0.0
-
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = max(state.last_updated, start)
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
-
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    start_times = [max(timestamp, start_ts) for timestamp in timestamps]
+    # Adjust start time, if there was no last known state
+    start_ts = start_times[0]
+    # Weight each value by the duration until the next state change, and
+    # the last value by the duration until the end of the period
+    durations = map(
+        operator.sub, itertools.chain(start_times[1:], (end_ts,)), start_times
+    )
+    accumulated = sum(map(operator.mul, values, durations))
 
-    period_seconds = (end - start).total_seconds()
+    period_seconds = end_ts - start_ts
     if period_seconds == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
@@ -141,9 +141,12 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
-def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
-    """Return a set of all units."""
-    return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
+def _get_units(float_states: _FloatStates) -> list[str | None]:
+    """Return the unit of each state."""
+    return [
+        attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        for attributes in float_states.attributes
+    ]
 
 
 def _equivalent_units(units: set[str | None]) -> bool:
@@ -157,34 +160,42 @@ def _equivalent_units(units: set[str | None]) -> bool:
     return len(units) == 1
 
 
-def _entity_history_to_float_and_state(
-    entity_history: Iterable[State],
-) -> list[tuple[float, State]]:
-    """Return a list of (float, state) tuples for the given entity."""
-    float_states: list[tuple[float, State]] = []
-    append = float_states.append
+def _entity_history_to_float_states(
+    entity_history: Iterable[dict[str, Any]],
+) -> _FloatStates | None:
+    """Return the float states of an entity from its compressed states."""
+    values: list[float] = []
+    timestamps: list[float] = []
+    states: list[str] = []
+    attributes: list[dict[str, Any]] = []
     isfinite = math.isfinite
-    for state in entity_history:
+    for comp_state in entity_history:
         try:
-            if (float_state := float(state.state)) is not None and isfinite(
-                float_state
-            ):
-                append((float_state, state))
+            float_state = float(state := comp_state[COMPRESSED_STATE_STATE])
         except (ValueError, TypeError):
-            pass
-    return float_states
+            continue
+        if not isfinite(float_state):
+            continue
+        values.append(float_state)
+        timestamps.append(comp_state[COMPRESSED_STATE_LAST_UPDATED])
+        states.append(state)
+        attributes.append(comp_state[COMPRESSED_STATE_ATTRIBUTES])
+    if not values:
+        return None
+    return _FloatStates(values, timestamps, states, attributes)
 
 
 def _normalize_states(
     hass: HomeAssistant,
     old_metadatas: dict[str, tuple[int, StatisticMetaData]],
-    fstates: list[tuple[float, State]],
+    float_states: _FloatStates,
     entity_id: str,
-) -> tuple[str | None, list[tuple[float, State]]]:
+) -> tuple[str | None, _FloatStates | None]:
     """Normalize units."""
     state_unit: str | None = None
     statistics_unit: str | None
-    state_unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    units = _get_units(float_states)
+    state_unit = units[0]
     old_metadata = old_metadatas[entity_id][1] if entity_id in old_metadatas else None
     if not old_metadata:
         # We've not seen this sensor before, the first valid state determines the unit
@@ -197,7 +208,7 @@ def _normalize_states(
     if statistics_unit not in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER:
         # The unit used by this sensor doesn't support unit conversion
 
-        all_units = _get_units(fstates)
+        all_units = set(units)
         if not _equivalent_units(all_units):
             if WARN_UNSTABLE_UNIT not in hass.data:
                 hass.data[WARN_UNSTABLE_UNIT] = set()
@@ -220,18 +231,15 @@ def _normalize_states(
                     extra,
                     LINK_DEV_STATISTICS,
                 )
-            return None, []
+            return None, None
 
-        return state_unit, fstates
+        return state_unit, float_states
 
     converter = statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER[statistics_unit]
-    valid_fstates: list[tuple[float, State]] = []
-    convert: Callable[[float], float] | None = None
-    last_unit: str | None | UndefinedType = UNDEFINED
     valid_units = converter.VALID_UNITS
-
-    for fstate, state in fstates:
-        state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    # Create one converter for each unit instead of converting state by state
+    converters: dict[str | None, Callable[[float], float] | None] = {}
+    for state_unit in (unique_units := dict.fromkeys(units)):
         # Exclude states with unsupported unit from statistics
         if state_unit not in valid_units:
             if WARN_UNSUPPORTED_UNIT not in hass.data:
@@ -252,22 +260,38 @@ def _normalize_states(
                     LINK_DEV_STATISTICS,
                 )
             continue
+        if state_unit == statistics_unit:
+            converters[state_unit] = None
+        else:
+            converters[state_unit] = converter.converter_factory(
+                state_unit, statistics_unit
+            )
 
-        if state_unit != last_unit:
-            # The unit of measurement has changed since the last state change
-            # recreate the converter factory
-            if state_unit == statistics_unit:
-                convert = None
-            else:
-                convert = converter.converter_factory(state_unit, statistics_unit)
-            last_unit = state_unit
-
-        if convert is not None:
-            fstate = convert(fstate)
-
-        valid_fstates.append((fstate, state))
+    if not converters:
+        return statistics_unit, None
+    if len(converters) == len(unique_units) and not any(converters.values()):
+        # All states are already in the unit of the statistics
+        return statistics_unit, float_states
+
+    valid_float_states = _FloatStates([], [], [], [])
+    for value, timestamp, state, attributes, state_unit in zip(
+        float_states.values,
+        float_states.timestamps,
+        float_states.states,
+        float_states.attributes,
+        units,
+        strict=True,
+    ):
+        if state_unit not in converters:
+            continue
+        if (convert := converters[state_unit]) is not None:
+            value = convert(value)
+        valid_float_states.values.append(value)
+        valid_float_states.timestamps.append(timestamp)
+        valid_float_states.states.append(state)
+        valid_float_states.attributes.append(attributes)
 
-    return statistics_unit, valid_fstates
+    return statistics_unit, valid_float_states
 
 
 def _suggest_report_issue(hass: HomeAssistant, entity_id: str) -> str:
@@ -389,6 +413,29 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+def _get_compressed_states(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    entity_ids: list[str],
+    significant_changes_only: bool = True,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the compressed states of the entities during start-end."""
+    return cast(
+        dict[str, list[dict[str, Any]]],
+        history.get_significant_states_with_session(
+            hass,
+            session,
+            start - datetime.timedelta.resolution,
+            end,
+            entity_ids=entity_ids,
+            significant_changes_only=significant_changes_only,
+            compressed_state_format=True,
+        ),
+    )
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -404,14 +451,16 @@ def compile_statistics(  # noqa: C901
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list: dict[str, list[State]] = {}
+    # The states are fetched as compressed states to get the values, timestamps
+    # and attributes of all entities without creating a State for each row
+    history_list: dict[str, list[dict[str, Any]]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
+        history_list = _get_compressed_states(
             hass,
             session,
-            start - datetime.timedelta.resolution,
+            start,
             end,
-            entity_ids=entities_full_history,
+            entities_full_history,
             significant_changes_only=False,
         )
     entities_significant_history = [
@@ -420,23 +469,27 @@ def compile_statistics(  # noqa: C901
         if "sum" not in wanted_statistics[i.entity_id]
     ]
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        _history_list = _get_compressed_states(
+            hass, session, start, end, entities_significant_history
         )
         history_list = {**history_list, **_history_list}
 
-    entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    entities_with_float_states: dict[str, _FloatStates] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
-        if not (entity_history := history_list.get(entity_id, [_state])):
+        if (entity_history := history_list.get(entity_id)) is None:
+            entity_history = [
+                {
+                    COMPRESSED_STATE_STATE: _state.state,
+                    COMPRESSED_STATE_ATTRIBUTES: _state.attributes,
+                    COMPRESSED_STATE_LAST_UPDATED: _state.last_updated_timestamp,
+                }
+            ]
+        if not entity_history:
             continue
-        if not (float_states := _entity_history_to_float_and_state(entity_history)):
+        if not (float_states := _entity_history_to_float_states(entity_history)):
             continue
         entities_with_float_states[entity_id] = float_states
 
@@ -447,7 +500,7 @@ def compile_statistics(  # noqa: C901
     old_metadatas = statistics.get_metadata_with_session(
         get_instance(hass), session, statistic_ids=set(entities_with_float_states)
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+    to_process: list[tuple[str, str | None, str, _FloatStates]] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
@@ -459,7 +512,7 @@ def compile_statistics(  # noqa: C901
             maybe_float_states,
             entity_id,
         )
-        if not valid_float_states:
+        if valid_float_states is None:
             continue
         state_class: str = _state.attributes[ATTR_STATE_CLASS]
         to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
@@ -513,16 +566,17 @@ def compile_statistics(  # noqa: C901
         # Make calculations
         stat: StatisticData = {"start": start}
         if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+            stat["max"] = max(valid_float_states.values)
         if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+            stat["min"] = min(valid_float_states.values)
 
         if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            stat["mean"] = _time_weighted_average(
+                valid_float_states.values,
+                valid_float_states.timestamps,
+                start.timestamp(),
+                end.timestamp(),
+            )
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
@@ -540,13 +594,19 @@ def compile_statistics(  # noqa: C901
                 new_state = old_state = last_stat.get("state")
                 _sum = last_stat.get("sum") or 0.0
 
-            for fstate, state in valid_float_states:
+            for fstate, timestamp, state, attributes in zip(
+                valid_float_states.values,
+                valid_float_states.timestamps,
+                valid_float_states.states,
+                valid_float_states.attributes,
+                strict=True,
+            ):
                 reset = False
                 if (
                     state_class != SensorStateClass.TOTAL_INCREASING
                     and (
                         last_reset := _last_reset_as_utc_isoformat(
-                            state.attributes.get("last_reset"), entity_id
+                            attributes.get("last_reset"), entity_id
                         )
                     )
                     != old_last_reset
@@ -581,8 +641,26 @@ def compile_statistics(  # noqa: C901
                     )
                 elif state_class == SensorStateClass.TOTAL_INCREASING:
                     try:
-                        if old_state is None or reset_detected(
-                            hass, entity_id, fstate, new_state, state
+                        if old_state is None or (
+                            # Only create a State for the warnings when the
+                            # value decreased or is negative
+                            (
+                                fstate < 0
+                                or (new_state is not None and fstate < new_state)
+                            )
+                            and reset_detected(
+                                hass,
+                                entity_id,
+                                fstate,
+                                new_state,
+                                State(
+                                    entity_id,
+                                    state,
+                                    attributes,
+                                    validate_entity_id=False,
+                                    last_updated_timestamp=timestamp,
+                                ),
+                            )
                         ):
                             reset = True
                             _LOGGER.info(
@@ -594,7 +672,7 @@ def compile_statistics(  # noqa: C901
                                 entity_id,
                                 new_state,
                                 fstate,
-                                state.last_updated.isoformat(),
+                                dt_util.utc_from_timestamp(timestamp).isoformat(),
                             )
                     except HomeAssistantError:
                         continue
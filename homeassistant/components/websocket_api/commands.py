@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Callable
+from dataclasses import dataclass
 from functools import lru_cache, partial
 import json
 import logging
@@ -19,6 +21,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -60,6 +63,7 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -67,6 +71,9 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+DATA_ENTITIES_SUBSCRIPTIONS: HassKey[_EntitiesSubscriptions] = HassKey(
+    "websocket_api_entities_subscriptions"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -97,6 +104,7 @@ def async_register_commands(
     async_reg(hass, handle_validate_config)
     async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_supported_features)
+    async_reg(hass, handle_connection_stats)
     async_reg(hass, handle_integration_descriptions)
 
 
@@ -367,31 +375,129 @@ def _send_handle_get_states_response(
     )
 
 
+@dataclass(slots=True, eq=False)
+class _EntitiesSubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    send_message: Callable[[str | bytes | dict[str, Any]], None]
+    entity_filter: Callable[[str], bool] | None
+    user: User
+    message_id_as_bytes: bytes
+
+
+class _EntitiesSubscriptions:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state_changed listener is shared by all connections so each
+    state change is matched against the subscriptions and diffed once,
+    instead of once per connection.
+    """
+
+    __slots__ = ("_hass", "_unfiltered", "_filtered", "_by_entity_id", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscriptions."""
+        self._hass = hass
+        # Subscriptions without an entity_ids or include/exclude filter
+        self._unfiltered: set[_EntitiesSubscription] = set()
+        # Subscriptions with only an include/exclude filter
+        self._filtered: set[_EntitiesSubscription] = set()
+        # Subscriptions with entity_ids, indexed by entity_id
+        self._by_entity_id: defaultdict[str, set[_EntitiesSubscription]] = defaultdict(
+            set
+        )
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(
+        self, subscription: _EntitiesSubscription, entity_ids: set[str] | None
+    ) -> CALLBACK_TYPE:
+        """Add a subscription and return a callback to remove it."""
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._by_entity_id[entity_id].add(subscription)
+        elif subscription.entity_filter:
+            self._filtered.add(subscription)
+        else:
+            self._unfiltered.add(subscription)
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward_entity_changes
+            )
+        return partial(self._async_remove, subscription, entity_ids)
+
+    @callback
+    def _async_remove(
+        self, subscription: _EntitiesSubscription, entity_ids: set[str] | None
+    ) -> None:
+        """Remove a subscription."""
+        if entity_ids:
+            by_entity_id = self._by_entity_id
+            for entity_id in entity_ids:
+                subscriptions = by_entity_id[entity_id]
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del by_entity_id[entity_id]
+        else:
+            self._filtered.discard(subscription)
+            self._unfiltered.discard(subscription)
+        if (
+            self._unsub is not None
+            and not self._unfiltered
+            and not self._filtered
+            and not self._by_entity_id
+        ):
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_forward_entity_changes(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Forward entity state changed events to websocket."""
+        entity_id = event.data["entity_id"]
+        matched: list[_EntitiesSubscription] = [*self._unfiltered]
+        if subscriptions := self._by_entity_id.get(entity_id):
+            matched.extend(
+                subscription
+                for subscription in subscriptions
+                if not (entity_filter := subscription.entity_filter)
+                or entity_filter(entity_id)
+            )
+        if self._filtered:
+            matched.extend(
+                subscription
+                for subscription in self._filtered
+                if subscription.entity_filter(entity_id)  # type: ignore[misc]
+            )
+        for subscription in matched:
+            # We have to lookup the permissions again because the user might
+            # have changed since the subscription was created.
+            user = subscription.user
+            permissions = user.permissions
+            if (
+                not user.is_admin
+                and not permissions.access_all_entities(POLICY_READ)
+                and not permissions.check_entity(entity_id, POLICY_READ)
+            ):
+                continue
+            # The diff is only calculated and serialized for the first
+            # subscription, the others only append their message id.
+            subscription.send_message(
+                messages.cached_state_diff_message(
+                    subscription.message_id_as_bytes, event
+                )
+            )
+
+
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+def _async_get_entities_subscriptions(hass: HomeAssistant) -> _EntitiesSubscriptions:
+    """Return the shared subscribe_entities subscriptions."""
+    if (subscriptions := hass.data.get(DATA_ENTITIES_SUBSCRIPTIONS)) is None:
+        subscriptions = hass.data[DATA_ENTITIES_SUBSCRIPTIONS] = _EntitiesSubscriptions(
+            hass
+        )
+    return subscriptions
 
 
 @callback
@@ -415,16 +521,16 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
+    connection.subscriptions[msg_id] = _async_get_entities_subscriptions(
+        hass
+    ).async_add(
+        _EntitiesSubscription(
             connection.send_message,
-            entity_ids,
             entity_filter,
             connection.user,
             message_id_as_bytes,
         ),
+        entity_ids,
     )
     connection.send_result(msg_id)
 
@@ -911,6 +1017,15 @@ def handle_supported_features(
     connection.send_result(msg["id"])
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "connection_stats"})
+def handle_connection_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle getting the message statistics of the connection."""
+    connection.send_result(msg["id"], connection.stats.as_dict())
+
+
 @decorators.require_admin
 @decorators.websocket_command({"type": "integration/descriptions"})
 @decorators.async_response
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Hashable
 from contextvars import ContextVar
+from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING, Any, Literal
 
 from aiohttp import web
@@ -30,6 +31,24 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+@dataclass(slots=True)
+class ConnectionStats:
+    """Statistics of the messages sent to a websocket connection."""
+
+    messages_sent: int = 0
+    frames_sent: int = 0
+    bytes_sent: int = 0
+    queue_size: int = 0
+    max_queue_size: int = 0
+    # Time in seconds the oldest message of a frame waited to be sent
+    total_queue_latency: float = 0.0
+    max_queue_latency: float = 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Return the statistics as a dict."""
+        return asdict(self)
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -45,6 +64,7 @@ class ActiveConnection:
         "supported_features",
         "handlers",
         "binary_handlers",
+        "stats",
     )
 
     def __init__(
@@ -69,6 +89,7 @@ class ActiveConnection:
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        self.stats = ConnectionStats()
         current_connection.set(self)
 
     def __repr__(self) -> str:
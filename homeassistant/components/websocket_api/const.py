@@ -34,6 +34,11 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Maximum size of a frame of coalesced messages. Messages that are still
+# pending once the budget is reached are sent in the next frame so a burst
+# does not produce a single huge frame the client has to parse at once.
+MAX_COALESCED_FRAME_BYTES: Final = 2**18
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -22,8 +22,10 @@ from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
+from .connection import ConnectionStats
 from .const import (
     DATA_CONNECTIONS,
+    MAX_COALESCED_FRAME_BYTES,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
@@ -82,6 +84,8 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_stats",
+        "_message_times",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -105,6 +109,10 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Replaced with the stats of the ActiveConnection after the auth phase
+        self._stats = ConnectionStats()
+        # The times the messages in the message queue were queued at
+        self._message_times: deque[float] = deque()
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -132,12 +140,14 @@ class WebSocketHandler:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
         message_queue = self._message_queue
+        message_times = self._message_times
         logger = self._logger
         wsock = self._wsock
         loop = self._loop
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = connection.can_coalesce
+        stats = self._stats
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
@@ -153,18 +163,32 @@ class WebSocketHandler:
                     # coalesce may be enabled later in the connection
                     can_coalesce = connection.can_coalesce
 
+                queue_latency = loop.time() - message_times[0]
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
-                    if is_debug_log_enabled():
-                        debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
-                    continue
+                    message_count = 1
+                elif sum(map(len, message_queue)) <= MAX_COALESCED_FRAME_BYTES:
+                    message_count = len(message_queue)
+                    message = b"".join((b"[", b",".join(message_queue), b"]"))
+                    message_queue.clear()
+                else:
+                    message, message_count = self._pop_coalesced_frame()
+
+                if message_queue:
+                    for _ in range(message_count):
+                        message_times.popleft()
+                else:
+                    message_times.clear()
+                stats.messages_sent += message_count
+                stats.frames_sent += 1
+                stats.bytes_sent += len(message)
+                stats.queue_size = len(message_queue)
+                stats.total_queue_latency += queue_latency
+                stats.max_queue_latency = max(stats.max_queue_latency, queue_latency)
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
                 if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                    debug("%s: Sending %s", self.description, message)
+                await send_bytes_text(message)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -175,6 +199,23 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    def _pop_coalesced_frame(self) -> tuple[bytes, int]:
+        """Pop queued messages into a frame up to MAX_COALESCED_FRAME_BYTES.
+
+        The frame always contains at least one message even if it
+        exceeds the budget on its own.
+        """
+        message_queue = self._message_queue
+        messages = [message_queue.popleft()]
+        frame_size = len(messages[0])
+        while (
+            message_queue
+            and (frame_size := frame_size + len(message_queue[0]))
+            <= MAX_COALESCED_FRAME_BYTES
+        ):
+            messages.append(message_queue.popleft())
+        return b"".join((b"[", b",".join(messages), b"]")), len(messages)
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -203,7 +244,12 @@ class WebSocketHandler:
 
         message_queue = self._message_queue
         message_queue.append(message)
-        if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
+        self._message_times.append(self._loop.time())
+        queue_size_after_add = len(message_queue)
+        stats = self._stats
+        stats.queue_size = queue_size_after_add
+        stats.max_queue_size = max(stats.max_queue_size, queue_size_after_add)
+        if queue_size_after_add >= MAX_PENDING_MSG:
             self._logger.error(
                 (
                     "%s: Client unable to keep up with pending messages. Reached %s pending"
@@ -401,6 +447,7 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
+        self._stats = connection.stats
         self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -532,6 +579,7 @@ class WebSocketHandler:
                 self._hass = None  # type: ignore[assignment]
                 self._logger = None  # type: ignore[assignment]
                 self._message_queue = None  # type: ignore[assignment]
+                self._message_times = None  # type: ignore[assignment]
                 self._handle_task = None
                 self._writer_task = None
                 self._ready_future = None
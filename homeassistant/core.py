@@ -29,6 +29,7 @@ import logging
 import os
 import pathlib
 import re
+import sys
 import threading
 import time
 from time import monotonic
@@ -45,6 +46,7 @@ from typing import (
 )
 from urllib.parse import urlparse
 
+from lru import LRU
 from typing_extensions import TypeVar
 import voluptuous as vol
 import yarl
@@ -132,6 +134,13 @@ STOP_STAGE_SHUTDOWN_TIMEOUT = 100
 FINAL_WRITE_STAGE_SHUTDOWN_TIMEOUT = 60
 CLOSE_STAGE_SHUTDOWN_TIMEOUT = 30
 
+# Maximum number of distinct attribute sets the state machine keeps interned
+MAX_INTERNED_ATTRIBUTES = 4096
+# Only attributes with values of exactly these types are interned, values of
+# other types can be equal and still serialize differently, like (1,) and
+# (1.0,) or datetimes in different time zones
+_INTERNABLE_ATTRIBUTE_TYPES: Final = frozenset({str, int, float, bool, type(None)})
+
 
 _SENTINEL = object()
 _DataT = TypeVar("_DataT", bound=Mapping[str, Any], default=Mapping[str, Any])
@@ -1405,6 +1414,8 @@ _FilterableJobType = tuple[
     Callable[[_DataT], bool] | None,  # event_filter
 ]
 
+_ListenerJobType = HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None]
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1444,7 +1455,13 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_listeners",
+        "_match_all_listeners",
+        "_entity_id_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1452,6 +1469,10 @@ class EventBus:
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
+        # event_type -> entity_id -> jobs
+        self._entity_id_listeners: dict[
+            EventType[Any] | str, dict[str, list[_ListenerJobType[Any]]]
+        ] = {}
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
         self._async_logging_changed()
@@ -1468,7 +1489,12 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, entity_id_listeners in self._entity_id_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + sum(
+                len(jobs) for jobs in entity_id_listeners.values()
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1563,6 +1589,105 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        if (
+            event_data is None
+            or not (entity_id_listeners := self._entity_id_listeners.get(event_type))
+            # The entity_id of some events is a list which is not hashable
+            or type(entity_id := event_data.get("entity_id")) is not str
+            or not (jobs := entity_id_listeners.get(entity_id))
+        ):
+            return
+
+        if not event:
+            event = Event(event_type, event_data, origin, time_fired, context)
+
+        for job in jobs.copy():
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+
+    @callback
+    def async_fire_many_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        events: Iterable[tuple[_DataT, Context | None]],
+        origin: EventOrigin = EventOrigin.local,
+        time_fired: float | None = None,
+    ) -> None:
+        """Fire multiple events of the same type, for internal use only.
+
+        The listeners are resolved once for the whole batch instead of once
+        per event. Listeners added or removed while the batch is being
+        dispatched will only see the change on the next call.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            match_all_listeners = self._match_all_listeners
+        else:
+            match_all_listeners = EMPTY_LIST
+
+        filterable_jobs = (
+            self._listeners.get(event_type, EMPTY_LIST) + match_all_listeners
+        )
+        entity_id_listeners = self._entity_id_listeners.get(event_type)
+        debug = self._debug
+        run_hass_job = self._hass.async_run_hass_job
+
+        for event_data, context in events:
+            if debug:
+                _LOGGER.debug(
+                    "Bus:Handling %s", _event_repr(event_type, origin, event_data)
+                )
+
+            event: Event[_DataT] | None = None
+            for job, event_filter in filterable_jobs:
+                if event_filter is not None:
+                    try:
+                        if event_data is None or not event_filter(event_data):
+                            continue
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
+                        continue
+
+                if not event:
+                    event = Event(
+                        event_type,
+                        event_data,
+                        origin,
+                        time_fired,
+                        context,
+                    )
+
+                try:
+                    run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+
+            if (
+                entity_id_listeners is None
+                or event_data is None
+                # The entity_id of some events is a list which is not hashable
+                or type(entity_id := event_data.get("entity_id")) is not str
+                or not (jobs := entity_id_listeners.get(entity_id))
+            ):
+                continue
+
+            if not event:
+                event = Event(event_type, event_data, origin, time_fired, context)
+
+            for job in jobs.copy():
+                try:
+                    run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1626,6 +1751,47 @@ class EventBus:
                 )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_entity_ids(
+        self,
+        event_type: EventType[_DataT] | str,
+        entity_ids: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for the given entity_ids.
+
+        This is an alternative to passing an event_filter to async_listen that
+        only matches on the entity_id key of the event data. Listeners are
+        indexed by entity_id so firing an event only costs a dict lookup
+        instead of calling the filter of every listener.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError(
+                "async_listen_entity_ids does not support MATCH_ALL"
+            )
+        if isinstance(entity_ids, str):
+            entity_ids = (entity_ids.lower(),)
+        else:
+            # A listener is only added once for each entity_id, so it is
+            # called once per event and can be removed again
+            entity_ids = tuple(
+                dict.fromkeys(entity_id.lower() for entity_id in entity_ids)
+            )
+
+        job = HassJob(listener, f"listen {event_type} {entity_ids}")
+        if (entity_id_listeners := self._entity_id_listeners.get(event_type)) is None:
+            entity_id_listeners = self._entity_id_listeners[event_type] = {}
+        for entity_id in entity_ids:
+            if (jobs := entity_id_listeners.get(entity_id)) is None:
+                entity_id_listeners[entity_id] = [job]
+            else:
+                jobs.append(job)
+        return functools.partial(
+            self._async_remove_entity_id_listener, event_type, entity_ids, job
+        )
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -1726,6 +1892,31 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_entity_id_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        entity_ids: tuple[str, ...],
+        job: _ListenerJobType[_DataT],
+    ) -> None:
+        """Remove a listener of a specific event_type and entity_ids.
+
+        This method must be run in the event loop.
+        """
+        try:
+            entity_id_listeners = self._entity_id_listeners[event_type]
+            for entity_id in entity_ids:
+                jobs = entity_id_listeners[entity_id]
+                jobs.remove(job)
+                if not jobs:
+                    del entity_id_listeners[entity_id]
+            if not entity_id_listeners:
+                del self._entity_id_listeners[event_type]
+        except (KeyError, ValueError):
+            # KeyError is key event_type or entity_id listener did not exist
+            # ValueError if listener did not exist within entity_id
+            _LOGGER.exception("Unable to remove unknown job listener %s", job)
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -1763,6 +1954,7 @@ class State:
         validate_entity_id: bool | None = True,
         state_info: StateInfo | None = None,
         last_updated_timestamp: float | None = None,
+        last_changed_timestamp: float | None = None,
     ) -> None:
         """Initialize a new state."""
         state = str(state)
@@ -1780,16 +1972,39 @@ class State:
         # State only creates and expects a ReadOnlyDict so
         # there is no need to check for subclassing with
         # isinstance here so we can use the faster type check.
-        if type(attributes) is not ReadOnlyDict:
+        attributes_type = type(attributes)
+        if (
+            attributes_type is not ReadOnlyDict
+            and attributes_type is not _InternedAttributes
+        ):
             self.attributes = ReadOnlyDict(attributes or {})
         else:
             self.attributes = attributes
+        self.context = context or Context()
+        self.state_info = state_info
+        # Domains are shared by many states so we intern them to avoid
+        # holding a copy of the same string for every state.
+        self.domain = sys.intern(split_entity_id(entity_id)[0])
+        if last_updated is None and last_updated_timestamp:
+            # The state machine only passes timestamps. The recorder and the
+            # websocket_api only need the timestamps so the datetime objects
+            # are created on first access.
+            self.last_updated_timestamp = last_updated_timestamp
+            if last_reported is None:
+                self.last_reported_timestamp = last_updated_timestamp
+            else:
+                self.last_reported = last_reported
+            if last_changed is not None:
+                self.last_changed = last_changed
+            else:
+                self.last_changed_timestamp = (
+                    last_changed_timestamp or last_updated_timestamp
+                )
+            return
+
         self.last_reported = last_reported or dt_util.utcnow()
         self.last_updated = last_updated or self.last_reported
         self.last_changed = last_changed or self.last_updated
-        self.context = context or Context()
-        self.state_info = state_info
-        self.domain, self.object_id = split_entity_id(self.entity_id)
         # The recorder or the websocket_api will always call the timestamps,
         # so we will set the timestamp values here to avoid the overhead of
         # the function call in the property we know will always be called.
@@ -1798,12 +2013,37 @@ class State:
             last_updated_timestamp = last_updated.timestamp()
         self.last_updated_timestamp = last_updated_timestamp
         if self.last_changed == last_updated:
-            self.__dict__["last_changed_timestamp"] = last_updated_timestamp
+            self.last_changed_timestamp = last_updated_timestamp
         # If last_reported is the same as last_updated async_set will pass
         # the same datetime object for both values so we can use an identity
         # check here.
         if self.last_reported is last_updated:
-            self.__dict__["last_reported_timestamp"] = last_updated_timestamp
+            self.last_reported_timestamp = last_updated_timestamp
+
+    @cached_property
+    def object_id(self) -> str:
+        """Object id of this state."""
+        return split_entity_id(self.entity_id)[1]
+
+    @cached_property
+    def last_changed(self) -> datetime.datetime:
+        """Last time the state was changed."""
+        return dt_util.utc_from_timestamp(self.last_changed_timestamp)
+
+    @cached_property
+    def last_reported(self) -> datetime.datetime:
+        """Last time the state was reported."""
+        return dt_util.utc_from_timestamp(self.last_reported_timestamp)
+
+    @cached_property
+    def last_updated(self) -> datetime.datetime:
+        """Last time the state or attributes were changed."""
+        return dt_util.utc_from_timestamp(self.last_updated_timestamp)
+
+    @cached_property
+    def last_updated_timestamp(self) -> float:
+        """Timestamp of last update."""
+        return self.last_updated.timestamp()
 
     @cached_property
     def name(self) -> str:
@@ -1830,11 +2070,12 @@ class State:
         as it will mutate the cached version.
         """
         last_changed_isoformat = self.last_changed.isoformat()
-        if self.last_changed == self.last_updated:
+        last_changed_timestamp = self.last_changed_timestamp
+        if last_changed_timestamp == self.last_updated_timestamp:
             last_updated_isoformat = last_changed_isoformat
         else:
             last_updated_isoformat = self.last_updated.isoformat()
-        if self.last_changed == self.last_reported:
+        if last_changed_timestamp == self.last_reported_timestamp:
             last_reported_isoformat = last_changed_isoformat
         else:
             last_reported_isoformat = self.last_reported.isoformat()
@@ -1881,6 +2122,11 @@ class State:
     @cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
+        attributes = self.attributes
+        if type(attributes) is _InternedAttributes:
+            # Interned attributes are shared by many states so
+            # their JSON is only generated once.
+            return json_bytes({**self._as_dict, "attributes": attributes.json_fragment})
         return json_bytes(self._as_dict)
 
     @cached_property
@@ -1910,7 +2156,7 @@ class State:
             COMPRESSED_STATE_CONTEXT: context,
             COMPRESSED_STATE_LAST_CHANGED: self.last_changed_timestamp,
         }
-        if self.last_changed != self.last_updated:
+        if self.last_changed_timestamp != self.last_updated_timestamp:
             compressed_state[COMPRESSED_STATE_LAST_UPDATED] = (
                 self.last_updated_timestamp
             )
@@ -1924,7 +2170,16 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        compressed_state = self.as_compressed_state
+        attributes = self.attributes
+        if type(attributes) is _InternedAttributes:
+            # Interned attributes are shared by many states so
+            # their JSON is only generated once.
+            compressed_state = {
+                **compressed_state,
+                COMPRESSED_STATE_ATTRIBUTES: attributes.json_fragment,
+            }
+        return json_bytes({self.entity_id: compressed_state})[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2032,10 +2287,26 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+class _InternedAttributes(ReadOnlyDict[str, Any]):
+    """State attributes that are shared between states."""
+
+    @cached_property
+    def json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of the attributes."""
+        return json_fragment(json_bytes(self))
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_interned_attributes",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2046,6 +2317,9 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._interned_attributes: LRU[
+            tuple[tuple[str, Any], ...], _InternedAttributes
+        ] = LRU(MAX_INTERNED_ATTRIBUTES)
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2251,6 +2525,35 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @callback
+    def _async_intern_attributes(
+        self, attributes: Mapping[str, Any] | None
+    ) -> Mapping[str, Any] | None:
+        """Return a shared copy of attributes equal to the given attributes.
+
+        Attributes with values that are not of a plain JSON scalar type are
+        returned as is.
+        """
+        if type(attributes) is _InternedAttributes:
+            return attributes
+        if not attributes:
+            key: tuple[tuple[str, Any], ...] = ()
+        else:
+            for value in attributes.values():
+                if type(value) not in _INTERNABLE_ATTRIBUTE_TYPES:
+                    return attributes
+            key = tuple(attributes.items())
+        interned = self._interned_attributes.get(key)
+        # 1, 1.0 and True are equal but do not serialize the same way
+        if interned is not None and all(
+            type(value) is type(interned_value)
+            for (_, value), interned_value in zip(key, interned.values(), strict=True)
+        ):
+            return interned
+        interned = _InternedAttributes(key)
+        self._interned_attributes[key] = interned
+        return interned
+
     @callback
     def async_set_internal(
         self,
@@ -2282,24 +2585,16 @@ class StateMachine:
             old_state = None
             same_state = False
             same_attr = False
-            last_changed = None
+            last_changed_timestamp = None
         else:
+            # Reuse the entity_id string of the old state to avoid
+            # holding a copy of it for every state that is written
+            entity_id = old_state.entity_id
             same_state = old_state.state == new_state and not force_update
             same_attr = old_state.attributes == attributes
-            last_changed = old_state.last_changed if same_state else None
-
-        # It is much faster to convert a timestamp to a utc datetime object
-        # than converting a utc datetime object to a timestamp since cpython
-        # does not have a fast path for handling the UTC timezone and has to do
-        # multiple local timezone conversions.
-        #
-        # from_timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
-        #
-        # timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
+            last_changed_timestamp = (
+                old_state.last_changed_timestamp if same_state else None
+            )
 
         if context is None:
             context = Context(id=ulid_at_time(timestamp))
@@ -2307,7 +2602,18 @@ class StateMachine:
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
-            old_state.last_reported = now  # type: ignore[union-attr]
+            # It is much faster to convert a timestamp to a utc datetime object
+            # than converting a utc datetime object to a timestamp since cpython
+            # does not have a fast path for handling the UTC timezone and has to do
+            # multiple local timezone conversions.
+            #
+            # from_timestamp implementation:
+            # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
+            #
+            # timestamp implementation:
+            # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
+            # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
+            old_state.last_reported = dt_util.utc_from_timestamp(timestamp)  # type: ignore[union-attr]
             old_state.last_reported_timestamp = timestamp  # type: ignore[union-attr]
             # Avoid creating an EventStateReportedData
             self._bus.async_fire_internal(  # type: ignore[misc]
@@ -2326,6 +2632,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        else:
+            attributes = self._async_intern_attributes(attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2333,13 +2641,14 @@ class StateMachine:
             entity_id,
             new_state,
             attributes,
-            last_changed,
-            now,
-            now,
+            None,
+            None,
+            None,
             context,
             old_state is None,
             state_info,
             timestamp,
+            last_changed_timestamp,
         )
         if old_state is not None:
             old_state.expire()
@@ -2356,6 +2665,166 @@ class StateMachine:
             time_fired=timestamp,
         )
 
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of multiple entities, add entities if they do not exist.
+
+        states is an iterable of (entity_id, new_state, attributes) tuples.
+
+        All states are written before any state_changed listener is called
+        and listeners are dispatched once for the whole batch.
+
+        This method must be run in the event loop.
+        """
+        self.async_set_many_internal(
+            [
+                (
+                    entity_id.lower(),
+                    str(new_state),
+                    attributes or {},
+                    force_update,
+                    context,
+                    None,
+                )
+                for entity_id, new_state, attributes in states
+            ],
+            timestamp or time.time(),
+        )
+
+    @callback
+    def async_set_many_internal(
+        self,
+        states: Iterable[
+            tuple[
+                str,
+                str,
+                Mapping[str, Any] | None,
+                bool,
+                Context | None,
+                StateInfo | None,
+            ]
+        ],
+        timestamp: float,
+    ) -> None:
+        """Set the state of multiple entities, add entities if they do not exist.
+
+        states is an iterable of
+        (entity_id, new_state, attributes, force_update, context, state_info)
+        tuples which are all written with the same timestamp.
+
+        If a state is invalid, the states that were already written are still
+        dispatched before the exception is raised.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        states_data = self._states_data
+        now: datetime.datetime | None = None
+        changed: list[tuple[EventStateChangedData, Context | None]] = []
+        reported: list[tuple[EventStateReportedData, Context | None]] = []
+
+        try:
+            for (
+                entity_id,
+                new_state,
+                attributes,
+                force_update,
+                context,
+                state_info,
+            ) in states:
+                old_state: State | None
+                try:
+                    old_state = states_data[entity_id]
+                except KeyError:
+                    old_state = None
+                    same_state = False
+                    same_attr = False
+                    last_changed_timestamp = None
+                else:
+                    entity_id = old_state.entity_id
+                    same_state = old_state.state == new_state and not force_update
+                    same_attr = old_state.attributes == attributes
+                    last_changed_timestamp = (
+                        old_state.last_changed_timestamp if same_state else None
+                    )
+
+                if context is None:
+                    # Each state gets its own context like async_set_internal
+                    context = Context(id=ulid_at_time(timestamp))
+
+                if same_state and same_attr:
+                    if TYPE_CHECKING:
+                        assert old_state is not None
+                    old_last_reported = old_state.last_reported
+                    if now is None:
+                        now = dt_util.utc_from_timestamp(timestamp)
+                    old_state.last_reported = now
+                    old_state.last_reported_timestamp = timestamp
+                    reported.append(
+                        (
+                            {
+                                "entity_id": entity_id,
+                                "old_last_reported": old_last_reported,
+                                "new_state": old_state,
+                            },
+                            context,
+                        )
+                    )
+                    continue
+
+                if same_attr:
+                    if TYPE_CHECKING:
+                        assert old_state is not None
+                    attributes = old_state.attributes
+                else:
+                    attributes = self._async_intern_attributes(attributes)
+
+                state = State(
+                    entity_id,
+                    new_state,
+                    attributes,
+                    None,
+                    None,
+                    None,
+                    context,
+                    old_state is None,
+                    state_info,
+                    timestamp,
+                    last_changed_timestamp,
+                )
+                if old_state is not None:
+                    old_state.expire()
+                self._states[entity_id] = state
+                changed.append(
+                    (
+                        {
+                            "entity_id": entity_id,
+                            "old_state": old_state,
+                            "new_state": state,
+                        },
+                        context,
+                    )
+                )
+        finally:
+            if changed:
+                self._bus.async_fire_many_internal(
+                    EVENT_STATE_CHANGED, changed, time_fired=timestamp
+                )
+            if reported:
+                self._bus.async_fire_many_internal(
+                    EVENT_STATE_REPORTED, reported, time_fired=timestamp
+                )
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
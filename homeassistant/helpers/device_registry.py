@@ -648,6 +648,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
 
     @callback
@@ -1233,6 +1234,19 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             ],
         }
 
+    @callback
+    def _records_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the records of device registry by collection and id."""
+        return {
+            "devices": {
+                entry.id: entry.as_storage_fragment for entry in self.devices.values()
+            },
+            "deleted_devices": {
+                entry.id: entry.as_storage_fragment
+                for entry in self.deleted_devices.values()
+            },
+        }
+
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
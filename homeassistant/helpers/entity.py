@@ -48,6 +48,7 @@ from homeassistant.core import (
     callback,
     get_hassjob_callable_job_type,
     get_release_channel,
+    validate_state,
 )
 from homeassistant.exceptions import (
     HomeAssistantError,
@@ -196,6 +197,42 @@ def get_unit_of_measurement(hass: HomeAssistant, entity_id: str) -> str | None:
     return entry.unit_of_measurement
 
 
+@callback
+def async_write_ha_states(hass: HomeAssistant, entities: Iterable[Entity]) -> None:
+    """Write the state of multiple entities to the state machine in one batch.
+
+    All states are written with the same timestamp and the state_changed
+    listeners are dispatched once for the whole batch.
+
+    Entities which override _async_write_ha_state are written one by one
+    after the batch so their hooks keep running. An entity that fails to
+    write its state is logged and does not prevent the others from being
+    written.
+    """
+    states: list[
+        tuple[str, str, dict[str, Any], bool, Context | None, StateInfo | None]
+    ] = []
+    unbatched: list[Entity] = []
+    for entity in entities:
+        if type(entity)._async_write_ha_state is not Entity._async_write_ha_state:  # noqa: SLF001
+            unbatched.append(entity)
+            continue
+        try:
+            state_write = entity._async_calculate_state_write_for_batch()  # noqa: SLF001
+        except Exception:
+            _LOGGER.exception("Failed to write state for %s", entity.entity_id)
+            continue
+        if state_write is not None:
+            states.append(state_write)
+    if states:
+        hass.states.async_set_many_internal(states, timer())
+    for entity in unbatched:
+        try:
+            entity._async_write_ha_state_from_call_soon_threadsafe()  # noqa: SLF001
+        except Exception:
+            _LOGGER.exception("Failed to write state for %s", entity.entity_id)
+
+
 ENTITY_CATEGORIES_SCHEMA: Final = vol.Coerce(EntityCategory)
 
 
@@ -1105,9 +1142,71 @@ class Entity(
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if (calculated := self._async_calculate_state_for_write()) is None:
+            return
+
+        hass = self.hass
+        entity_id = self.entity_id
+        state, attr, time_now = calculated
+        try:
+            hass.states.async_set_internal(
+                entity_id,
+                state,
+                attr,
+                self.force_update,
+                self._context,
+                self._state_info,
+                time_now,
+            )
+        except InvalidStateError:
+            _LOGGER.exception(
+                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
+            )
+            hass.states.async_set(
+                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
+            )
+
+    @callback
+    def _async_calculate_state_write_for_batch(
+        self,
+    ) -> tuple[str, str, dict[str, Any], bool, Context | None, StateInfo | None] | None:
+        """Calculate the state to write with async_write_ha_states."""
+        if not self.hass or not self._verified_state_writable:
+            self._async_verify_state_writable()
+        if (calculated := self._async_calculate_state_for_write()) is None:
+            return None
+        state, attr, _ = calculated
+        try:
+            validate_state(state)
+        except InvalidStateError:
+            _LOGGER.exception(
+                "Failed to set state for %s, fall back to %s",
+                self.entity_id,
+                STATE_UNKNOWN,
+            )
+            state = STATE_UNKNOWN
+            attr = {}
+        return (
+            self.entity_id,
+            state,
+            attr,
+            self.force_update,
+            self._context,
+            self._state_info,
+        )
+
+    @callback
+    def _async_calculate_state_for_write(
+        self,
+    ) -> tuple[str, dict[str, Any], float] | None:
+        """Calculate the state to write to the state machine.
+
+        Returns a tuple of the state, the attributes and the time the state
+        was calculated, or None if the state should not be written.
+        """
         if self._platform_state is EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
-            return
+            return None
 
         hass = self.hass
         entity_id = self.entity_id
@@ -1123,7 +1222,7 @@ class Entity(
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
@@ -1205,23 +1304,7 @@ class Entity(
             self._context = None
             self._context_set = None
 
-        try:
-            hass.states.async_set_internal(
-                entity_id,
-                state,
-                attr,
-                self.force_update,
-                self._context,
-                self._state_info,
-                time_now,
-            )
-        except InvalidStateError:
-            _LOGGER.exception(
-                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
-            )
-            hass.states.async_set(
-                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
-            )
+        return (state, attr, time_now)
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
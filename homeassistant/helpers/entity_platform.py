@@ -7,7 +7,7 @@ from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
 from datetime import timedelta
 from logging import Logger, getLogger
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import Any, Protocol
 
 from homeassistant import config_entries
 from homeassistant.const import (
@@ -44,15 +44,12 @@ from . import (
     service,
     translation,
 )
+from .entity import Entity, async_write_ha_states
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
-from .event import async_call_later
+from .event import TimerWheelHandle, async_call_later, async_get_timer_wheel
 from .issue_registry import IssueSeverity, async_create_issue
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
 
-if TYPE_CHECKING:
-    from .entity import Entity
-
-
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 60
 SLOW_ADD_ENTITY_MAX_WAIT = 15  # Per Entity
@@ -67,6 +64,9 @@ DATA_DOMAIN_PLATFORM_ENTITIES: HassKey[dict[tuple[str, str], dict[str, Entity]]]
     HassKey("domain_platform_entities")
 )
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
+# Polled entities that finish updating within this time of each other
+# write their states in one batch, slower ones write them when done
+BATCH_UPDATE_MAX_WAIT = 1  # seconds
 
 _LOGGER = getLogger(__name__)
 
@@ -145,7 +145,10 @@ class EntityPlatform:
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
         # Method to cancel the state change listener
-        self._async_polling_timer: asyncio.TimerHandle | None = None
+        self._async_polling_timer: asyncio.TimerHandle | TimerWheelHandle | None = None
+        # Platforms can opt in to share the polling timer with other
+        # platforms whose polls are due in the same timer wheel tick
+        self._coarse_polling: bool = getattr(platform, "COARSE_POLLING", False)
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
@@ -659,18 +662,26 @@ class EntityPlatform:
         ):
             return
 
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
-        )
+        self._async_schedule_polling()
+
+    @callback
+    def _async_schedule_polling(self) -> None:
+        """Schedule the next poll of the entities."""
+        if self._coarse_polling:
+            self._async_polling_timer = async_get_timer_wheel(
+                self.hass
+            ).async_call_later(
+                self.scan_interval_seconds, self._async_handle_interval_callback
+            )
+        else:
+            self._async_polling_timer = self.hass.loop.call_later(
+                self.scan_interval_seconds, self._async_handle_interval_callback
+            )
 
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
-        )
+        self._async_schedule_polling()
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
@@ -1037,14 +1048,60 @@ class EntityPlatform:
                         await entity.async_update_ha_state(True)
                 return
 
-            if tasks := [
-                create_eager_task(
-                    entity.async_update_ha_state(True), loop=self.hass.loop
+            # Entities which override async_update_ha_state are updated
+            # through it, the others are updated in parallel and write
+            # their states in batches.
+            tasks: dict[asyncio.Task[bool], Entity] = {}
+            for entity in self.entities.values():
+                if not entity.should_poll:
+                    continue
+                if (
+                    type(entity).async_update_ha_state
+                    is not Entity.async_update_ha_state
+                ):
+                    task = create_eager_task(
+                        entity.async_update_ha_state(True), loop=self.hass.loop
+                    )
+                else:
+                    task = create_eager_task(
+                        self._async_device_update_for_batch(entity),
+                        loop=self.hass.loop,
+                    )
+                tasks[task] = entity
+            if not tasks:
+                return
+
+            done, pending = await asyncio.wait(tasks, timeout=BATCH_UPDATE_MAX_WAIT)
+            while True:
+                entities: list[Entity] = []
+                for task, entity in tasks.items():
+                    if task not in done:
+                        continue
+                    if (err := task.exception()) is not None:
+                        self.logger.error(
+                            "Update for %s fails", entity.entity_id, exc_info=err
+                        )
+                    elif task.result() is True:
+                        entities.append(entity)
+                async_write_ha_states(self.hass, entities)
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+
+    async def _async_device_update_for_batch(self, entity: Entity) -> bool:
+        """Update an entity and return if its state should be written."""
+        if entity.hass is None:
+            # The task starts eagerly, so the entity was removed by
+            # an entity updated before it in this pass
+            return False
+        try:
+            await entity.async_device_update()
+        except Exception:
+            self.logger.exception("Update for %s fails", entity.entity_id)
+            return False
+        return True
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
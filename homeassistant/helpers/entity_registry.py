@@ -704,6 +704,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -1358,6 +1359,19 @@ class EntityRegistry(BaseRegistry):
             ],
         }
 
+    @callback
+    def _records_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the records of entity registry by collection and id."""
+        return {
+            "entities": {
+                entry.id: entry.as_storage_fragment for entry in self.entities.values()
+            },
+            "deleted_entities": {
+                entry.id: entry.as_storage_fragment
+                for entry in self.deleted_entities.values()
+            },
+        }
+
     @callback
     def async_clear_category_id(self, scope: str, category_id: str) -> None:
         """Clear category id from registry entries."""
@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
 
 from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
     EVENT_STATE_REPORTED,
     MATCH_ALL,
@@ -76,6 +77,8 @@ _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
 
+_TIMER_WHEEL: HassKey[TimerWheel] = HassKey("timer_wheel")
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -89,6 +92,9 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# Coarse timers are aggregated into ticks of this many seconds
+TIMER_WHEEL_RESOLUTION = 1.0
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _StateEventDataT = TypeVar("_StateEventDataT", bound=EventStateEventData)
 
@@ -1554,6 +1560,149 @@ def async_track_point_in_utc_time(
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
 
 
+class TimerWheelHandle:
+    """Handle for an action scheduled on the timer wheel."""
+
+    __slots__ = ("_wheel", "_tick", "_action", "_args", "_cancelled")
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        tick: int,
+        action: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        """Initialize the handle."""
+        self._wheel = wheel
+        self._tick = tick
+        self._action = action
+        self._args = args
+        self._cancelled = False
+
+    def __repr__(self) -> str:
+        """Return the representation of the handle."""
+        return f"<TimerWheelHandle tick={self._tick} action={self._action!r}>"
+
+    def when(self) -> float:
+        """Return the loop time the action is scheduled for."""
+        return self._tick * self._wheel.resolution
+
+    def cancelled(self) -> bool:
+        """Return if the action was cancelled."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel the action."""
+        if not self._cancelled:
+            self._cancelled = True
+            self._wheel._async_remove(self)  # noqa: SLF001
+
+
+class TimerWheel:
+    """Aggregate coarse timers that expire in the same tick.
+
+    All actions that round to the same tick share a single loop timer,
+    which keeps the asyncio timer heap small when thousands of polling
+    timers are scheduled. Actions run up to half a tick early or late, but
+    never in the tick that is running or has already passed.
+    """
+
+    __slots__ = ("hass", "resolution", "_buckets")
+
+    def __init__(self, hass: HomeAssistant, resolution: float) -> None:
+        """Initialize the timer wheel."""
+        self.hass = hass
+        self.resolution = resolution
+        self._buckets: dict[
+            int, tuple[asyncio.TimerHandle, dict[TimerWheelHandle, None]]
+        ] = {}
+
+    @property
+    def timer_count(self) -> int:
+        """Return the number of loop timers used by the wheel."""
+        return len(self._buckets)
+
+    @callback
+    def async_call_at(
+        self, when: float, action: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Schedule action to run in the tick closest to loop time when."""
+        loop = self.hass.loop
+        # The bucket of the current tick may already have run, so the
+        # earliest tick an action can be added to is the next one
+        tick = max(
+            round(when / self.resolution), int(loop.time() / self.resolution) + 1
+        )
+        handle = TimerWheelHandle(self, tick, action, args)
+        if (bucket := self._buckets.get(tick)) is None:
+            timer = loop.call_at(tick * self.resolution, self._async_run_tick, tick)
+            bucket = self._buckets[tick] = (timer, {})
+        bucket[1][handle] = None
+        return handle
+
+    @callback
+    def async_call_later(
+        self, delay: float, action: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Schedule action to run in the tick closest to delay from now."""
+        return self.async_call_at(self.hass.loop.time() + delay, action, *args)
+
+    @callback
+    def _async_remove(self, handle: TimerWheelHandle) -> None:
+        """Remove a cancelled handle and release its tick when empty."""
+        if (bucket := self._buckets.get(handle._tick)) is None:  # noqa: SLF001
+            # The tick is running
+            return
+        timer, handles = bucket
+        handles.pop(handle, None)
+        if not handles:
+            timer.cancel()
+            del self._buckets[handle._tick]  # noqa: SLF001
+
+    @callback
+    def _async_run_tick(self, tick: int) -> None:
+        """Run all actions scheduled for a tick."""
+        if (bucket := self._buckets.pop(tick, None)) is None:
+            return
+        for handle in bucket[1]:
+            if handle._cancelled:  # noqa: SLF001
+                continue
+            handle._cancelled = True  # noqa: SLF001
+            try:
+                handle._action(*handle._args)  # noqa: SLF001
+            except Exception as ex:  # noqa: BLE001
+                self.hass.loop.call_exception_handler(
+                    {
+                        "message": f"Exception in timer wheel callback {handle!r}",
+                        "exception": ex,
+                    }
+                )
+
+    @callback
+    def _async_cancel_on_shutdown(self, _: Event) -> None:
+        """Cancel timers of jobs marked to be cancelled on shutdown."""
+        for _timer, handles in list(self._buckets.values()):
+            for handle in list(handles):
+                if (
+                    (args := handle._args)  # noqa: SLF001
+                    and type(job := args[0]) is HassJob
+                    and job.cancel_on_shutdown
+                ):
+                    handle.cancel()
+
+
+@callback
+def async_get_timer_wheel(hass: HomeAssistant) -> TimerWheel:
+    """Return the coarse timer wheel for hass."""
+    if (wheel := hass.data.get(_TIMER_WHEEL)) is None:
+        wheel = hass.data[_TIMER_WHEEL] = TimerWheel(hass, TIMER_WHEEL_RESOLUTION)
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP,
+            wheel._async_cancel_on_shutdown,  # noqa: SLF001
+        )
+    return wheel
+
+
 def _run_async_call_action(
     hass: HomeAssistant, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
 ) -> None:
@@ -1588,10 +1737,15 @@ def async_call_later(
     delay: float | timedelta,
     action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     | Callable[[datetime], Coroutine[Any, Any, None] | None],
+    *,
+    coarse: bool = False,
 ) -> CALLBACK_TYPE:
     """Add a listener that fires at or after <delay>.
 
     The listener is passed the time it fires in UTC time.
+
+    If coarse is True, the listener shares a timer with other coarse listeners
+    and may fire up to half of TIMER_WHEEL_RESOLUTION early or late.
     """
     if isinstance(delay, timedelta):
         delay = delay.total_seconds()
@@ -1600,6 +1754,12 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
+    if coarse:
+        return (
+            async_get_timer_wheel(hass)
+            .async_call_later(delay, _run_async_call_action, hass, job)
+            .cancel
+        )
     loop = hass.loop
     return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
 
@@ -1616,9 +1776,10 @@ class _TrackTimeInterval:
     job_name: str
     action: Callable[[datetime], Coroutine[Any, Any, None] | None]
     cancel_on_shutdown: bool | None
+    coarse: bool = False
     _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
-    _timer_handle: asyncio.TimerHandle | None = None
+    _timer_handle: asyncio.TimerHandle | TimerWheelHandle | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
@@ -1640,6 +1801,11 @@ class _TrackTimeInterval:
         if TYPE_CHECKING:
             assert self._track_job is not None
         hass = self.hass
+        if self.coarse:
+            self._timer_handle = async_get_timer_wheel(hass).async_call_later(
+                self.seconds, self._interval_listener, self._track_job
+            )
+            return
         loop = hass.loop
         self._timer_handle = loop.call_at(
             loop.time() + self.seconds, self._interval_listener, self._track_job
@@ -1670,16 +1836,22 @@ def async_track_time_interval(
     *,
     name: str | None = None,
     cancel_on_shutdown: bool | None = None,
+    coarse: bool = False,
 ) -> CALLBACK_TYPE:
     """Add a listener that fires repetitively at every timedelta interval.
 
     The listener is passed the time it fires in UTC time.
+
+    If coarse is True, the listener shares a timer with other coarse listeners
+    and may fire up to half of TIMER_WHEEL_RESOLUTION early or late.
     """
     seconds = interval.total_seconds()
     job_name = f"track time interval {seconds} {action}"
     if name:
         job_name = f"{name}: {job_name}"
-    track = _TrackTimeInterval(hass, seconds, job_name, action, cancel_on_shutdown)
+    track = _TrackTimeInterval(
+        hass, seconds, job_name, action, cancel_on_shutdown, coarse
+    )
     track.async_attach()
     return track.async_cancel
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections import UserDict, defaultdict
 from collections.abc import Mapping, Sequence, ValuesView
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from homeassistant.core import CoreState, HomeAssistant, callback
 
@@ -75,9 +75,27 @@ class BaseRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](ABC):
         # Schedule the save past startup to avoid writing
         # the file while the system is starting.
         delay = SAVE_DELAY if self.hass.state is CoreState.running else SAVE_DELAY_LONG
-        self._store.async_delay_save(self._data_to_save, delay)
+        if self._store.journal:
+            self._store.async_delay_save_records(self._records_to_save, delay)
+        else:
+            self._store.async_delay_save(self._data_to_save, delay)
 
     @callback
     @abstractmethod
     def _data_to_save(self) -> _StoreDataT:
         """Return data of registry to store in a file."""
+
+    @callback
+    def _records_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the records of registry by collection and id.
+
+        Registries with a journaled store only write the changed records.
+        The default builds the records from the lists of items with an id
+        returned by _data_to_save, registries which keep the stored form
+        of their items override this to avoid rebuilding every record.
+        """
+        data = cast(Mapping[str, list[dict[str, Any]]], self._data_to_save())
+        return {
+            collection: {record["id"]: record for record in records}
+            for collection, records in data.items()
+        }
@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
+from collections import defaultdict
 from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
 
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
+from homeassistant.core import (
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+    valid_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 from homeassistant.util.hass_dict import HassKey
@@ -27,7 +35,9 @@ DATA_RESTORE_STATE: HassKey[RestoreStateData] = HassKey("restore_state")
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
+# The states of each domain are stored in a shard of their own
+SHARD_STORAGE_VERSION = 1
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
@@ -35,6 +45,12 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long an unchanged shard is kept before it is written again to
+# refresh when its states were last seen
+SHARD_REFRESH_INTERVAL = timedelta(days=1)
+
+type _ShardSignature = dict[str, tuple[State, dict[str, Any] | None]]
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -96,6 +112,39 @@ class StoredState:
         )
 
 
+class RestoreStateStore(Store[list[dict[str, Any]] | dict[str, Any]]):
+    """Store the index of the restore state shards."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: list[dict[str, Any]] | dict[str, Any],
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """Migrate to the new version."""
+        if old_major_version == 1:
+            # Version 2 stores the states in shards, the states of version 1
+            # are loaded and written to the shards by the next dump
+            return old_data
+        raise NotImplementedError
+
+
+def _shard_storage_key(domain: str) -> str:
+    """Return the storage key of the shard of a domain."""
+    return f"{STORAGE_KEY}.{domain}"
+
+
+def _signature(stored_states: list[StoredState]) -> _ShardSignature:
+    """Return what is written for the stored states of a shard."""
+    return {
+        stored_state.state.entity_id: (
+            stored_state.state,
+            stored_state.extra_data.as_dict() if stored_state.extra_data else None,
+        )
+        for stored_state in stored_states
+    }
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -134,11 +183,18 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store = Store[list[dict[str, Any]]](
+        self.store = RestoreStateStore(
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self._shards: dict[str, Store[list[dict[str, Any]]]] = {}
+        # The domains with a shard on disk, and the ones not loaded yet
+        self._domains: set[str] = set()
+        self._unloaded_domains: set[str] = set()
+        self._index_outdated = False
+        # What was last written to each shard and when
+        self._written: dict[str, tuple[datetime, _ShardSignature]] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -152,23 +208,70 @@ class RestoreStateData:
         start.async_at_start(self.hass, hass_start)
 
     async def async_load(self) -> None:
-        """Load the instance of this data helper."""
+        """Load the instance of this data helper.
+
+        Only the index of the shards is loaded, the stored states of a domain
+        are loaded when the first entity of the domain asks for them.
+        """
         try:
-            stored_states = await self.store.async_load()
+            index = await self.store.async_load()
         except HomeAssistantError as exc:
             _LOGGER.error("Error loading last states", exc_info=exc)
-            stored_states = None
+            index = None
 
-        if stored_states is None:
+        self.last_states = {}
+        self._written = {}
+        if index is None:
             _LOGGER.debug("Not creating cache - no saved states found")
-            self.last_states = {}
-        else:
-            self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
-                if valid_entity_id(item["state"]["entity_id"])
-            }
+            self._domains = set()
+        elif isinstance(index, list):
+            # The states of version 1 are not sharded
+            self._domains = set()
+            self._async_add_stored_states(index)
             _LOGGER.debug("Created cache with %s", list(self.last_states))
+        else:
+            self._domains = set(index["domains"])
+        self._index_outdated = isinstance(index, list)
+        self._unloaded_domains = set(self._domains)
+
+    @callback
+    def _async_add_stored_states(self, stored_states: list[dict[str, Any]]) -> None:
+        """Add loaded stored states that were not replaced in this run."""
+        last_states = self.last_states
+        for item in stored_states:
+            if (
+                entity_id := item["state"]["entity_id"]
+            ) not in last_states and valid_entity_id(entity_id):
+                last_states[entity_id] = StoredState.from_dict(item)
+
+    @callback
+    def _async_get_shard(self, domain: str) -> Store[list[dict[str, Any]]]:
+        """Return the store of the shard of a domain."""
+        if (shard := self._shards.get(domain)) is None:
+            shard = self._shards[domain] = Store(
+                self.hass,
+                SHARD_STORAGE_VERSION,
+                _shard_storage_key(domain),
+                encoder=JSONEncoder,
+            )
+        return shard
+
+    async def async_load_domain(self, domain: str) -> None:
+        """Load the stored states of a domain if they are not loaded yet."""
+        if domain not in self._unloaded_domains:
+            return
+        try:
+            stored_states = await self._async_get_shard(domain).async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading last states of %s", domain, exc_info=exc)
+            stored_states = None
+        # Concurrent loads of a shard share the result of the store
+        if domain not in self._unloaded_domains:
+            return
+        self._unloaded_domains.discard(domain)
+        if stored_states:
+            self._async_add_stored_states(stored_states)
+            _LOGGER.debug("Loaded stored states of %s", domain)
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -215,15 +318,45 @@ class RestoreStateData:
         return stored_states
 
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only the shards with changed states are written, as well as the
+        unchanged shards that were written more than a day ago.
+        """
         _LOGGER.debug("Dumping states")
-        try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+        if self._unloaded_domains:
+            # Stored states of shards that are not loaded would be lost
+            await asyncio.gather(
+                *(
+                    self.async_load_domain(domain)
+                    for domain in list(self._unloaded_domains)
+                )
             )
+        now = dt_util.utcnow()
+        shards: defaultdict[str, list[StoredState]] = defaultdict(list)
+        for stored_state in self.async_get_stored_states():
+            shards[stored_state.state.domain].append(stored_state)
+        try:
+            for domain, stored_states in shards.items():
+                signature = _signature(stored_states)
+                if domain in self._written:
+                    written_at, written_signature = self._written[domain]
+                    if (
+                        written_signature == signature
+                        and now - written_at < SHARD_REFRESH_INTERVAL
+                    ):
+                        continue
+                await self._async_get_shard(domain).async_save(
+                    [stored_state.as_dict() for stored_state in stored_states]
+                )
+                self._written[domain] = (now, signature)
+            if (domains := set(shards)) != self._domains or self._index_outdated:
+                await self.store.async_save({"domains": sorted(domains)})
+                self._index_outdated = False
+                for domain in self._domains - domains:
+                    self._written.pop(domain, None)
+                    await self._async_get_shard(domain).async_remove()
+                self._domains = domains
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
@@ -310,15 +443,23 @@ class RestoreEntity(Entity):
             return None
         return async_get(self.hass).last_states.get(self.entity_id)
 
+    async def _async_load_restored_data(self) -> StoredState | None:
+        """Load the stored states of the domain and get data stored for entity."""
+        if self.hass is not None and self.entity_id is not None:
+            await async_get(self.hass).async_load_domain(
+                split_entity_id(self.entity_id)[0]
+            )
+        return self._async_get_restored_data()
+
     async def async_get_last_state(self) -> State | None:
         """Get the entity state from the previous run."""
-        if (stored_state := self._async_get_restored_data()) is None:
+        if (stored_state := await self._async_load_restored_data()) is None:
             return None
         return stored_state.state
 
     async def async_get_last_extra_data(self) -> ExtraStoredData | None:
         """Get the entity specific state data from the previous run."""
-        if (stored_state := self._async_get_restored_data()) is None:
+        if (stored_state := await self._async_load_restored_data()) is None:
             return None
         return stored_state.extra_data
 
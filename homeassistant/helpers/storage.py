@@ -12,7 +12,7 @@ from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
@@ -33,6 +33,7 @@ from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.uuid import random_uuid_hex
 
 from . import json as json_helper
 
@@ -48,6 +49,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into the base file once it grows larger
+# than this fraction of the base file
+JOURNAL_COMPACT_RATIO = 0.5
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -241,8 +247,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        A journaled store appends the records that changed since the last
+        write to a journal next to the base file, see async_delay_save_records.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,12 +269,25 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self.journal = journal
+        # The records of the last write, the journal is only appended to
+        # when they are known
+        self._journal_records: dict[str, dict[str, Any]] | None = None
+        self._journal_token: str | None = None
+        self._journal_size = 0
+        self._journal_base_size = 0
+        self._compact_journal = False
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the journal path."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -317,6 +341,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             # If we didn't generate data yet, do it now.
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
+            elif "records_func" in data:
+                # Keep the records function to write only the changed records
+                data = {
+                    **data,
+                    "data": _records_to_data(data["records_func"]()),
+                }
+                del data["records_func"]
 
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
@@ -325,11 +356,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
-        else:
-            try:
+            if self.journal:
                 data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
+                    self._replay_journal, data
                 )
+        else:
+            try:
+                data = await self.hass.async_add_executor_job(self._load_data)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -420,6 +453,76 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         return stored
 
+    def _load_data(self) -> json_util.JsonValueType:
+        """Load the data from the base file and the journal."""
+        data = json_util.load_json(self.path)
+        if self.journal:
+            return self._replay_journal(data)
+        return data
+
+    def _replay_journal(self, data: Any) -> Any:
+        """Apply the changed records of the journal to the loaded data.
+
+        The journal is only replayed when it was started after the base file
+        was written, the journal of an earlier base file is stale. A replayed
+        journal is folded into the base file right away, so readers of the
+        base file alone, like an older version, do not miss any record.
+        """
+        if not isinstance(data, dict) or (token := data.get("journal")) is None:
+            return data
+        try:
+            with open(self.journal_path, "rb") as journal:
+                lines = journal.read().splitlines()
+        except FileNotFoundError:
+            return data
+        try:
+            header = json_util.json_loads_object(lines[0])
+        except (IndexError, ValueError):
+            header = {}
+        if header.get("journal") != token:
+            _LOGGER.debug("Ignoring stale journal of %s", self.key)
+            return data
+
+        collections: dict[str, dict[str, Any]] = {
+            collection: {record["id"]: record for record in records}
+            for collection, records in data["data"].items()
+        }
+        for line in lines[1:]:
+            try:
+                change = json_util.json_loads_object(line)
+            except ValueError:
+                # The last write was interrupted
+                _LOGGER.warning("Ignoring incomplete journal entry of %s", self.key)
+                break
+            records = collections.setdefault(change["c"], {})
+            if (record := change["r"]) is None:
+                records.pop(change["id"], None)
+            else:
+                records[change["id"]] = record
+        del data["journal"]
+        data["data"] = _records_to_data(collections)
+        if not self._read_only:
+            self._fold_journal(data)
+        return data
+
+    def _fold_journal(self, data: dict[str, Any]) -> None:
+        """Write the data with the replayed journal as the base file."""
+        _LOGGER.debug("Folding the journal of %s into %s", self.key, self.path)
+        try:
+            json_helper.save_json(
+                self.path,
+                data,
+                self._private,
+                encoder=self._encoder,
+                atomic_writes=self._atomic_writes,
+            )
+        except (json_util.SerializationError, WriteError) as err:
+            # The journal still matches the base file and is replayed next time
+            _LOGGER.error("Error writing config for %s: %s", self.key, err)
+            return
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -442,12 +545,20 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         delay: float = 0,
     ) -> None:
         """Save data with an optional delay."""
-        self._data = {
-            "version": self.version,
-            "minor_version": self.minor_version,
-            "key": self.key,
-            "data_func": data_func,
-        }
+        self._async_delay_save(
+            {
+                "version": self.version,
+                "minor_version": self.minor_version,
+                "key": self.key,
+                "data_func": data_func,
+            },
+            delay,
+        )
+
+    @callback
+    def _async_delay_save(self, data: dict[str, Any], delay: float) -> None:
+        """Schedule writing data with a delay."""
+        self._data = data
 
         next_when = self.hass.loop.time() + delay
         if self._delay_handle and self._delay_handle.when() < next_when:
@@ -463,6 +574,39 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         # We use call_later directly here to avoid a circular import
         self._async_reschedule_delayed_write(next_when)
 
+    @callback
+    def async_delay_save_records(
+        self,
+        records_func: Callable[[], dict[str, dict[str, Any]]],
+        delay: float = 0,
+    ) -> None:
+        """Save records with an optional delay.
+
+        The records are returned by collection and by the id of the record,
+        which has to be stored in the id key of the record. The data of the
+        store is a dict with a list of records for each collection.
+
+        A journaled store only appends the records that changed since the
+        last write to the journal. Records are compared by identity and
+        equality, a changed record has to be replaced instead of mutated.
+        The first write after loading rewrites the base file, and so does
+        the write that finds the journal too large compared to the base file.
+        """
+        if not self.journal:
+            self.async_delay_save(
+                lambda: cast(_T, _records_to_data(records_func())), delay
+            )
+            return
+        self._async_delay_save(
+            {
+                "version": self.version,
+                "minor_version": self.minor_version,
+                "key": self.key,
+                "records_func": records_func,
+            },
+            delay,
+        )
+
     @callback
     def _async_reschedule_delayed_write(self, when: float) -> None:
         """Reschedule a delayed write."""
@@ -517,6 +661,20 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if self.journal:
+            # Leave every record in the base file when Home Assistant stops
+            self._compact_journal = True
+            if (
+                self._data is None
+                and self._journal_size
+                and (records := self._journal_records) is not None
+            ):
+                self._data = {
+                    "version": self.version,
+                    "minor_version": self.minor_version,
+                    "key": self.key,
+                    "records_func": lambda: records,
+                }
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -541,6 +699,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self.journal and self._journal_size:
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -548,6 +709,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        if "records_func" in data:
+            self._write_records(path, data, data.pop("records_func")())
+            return
+
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
@@ -559,6 +724,90 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if self.journal:
+            self._journal_records = None
+            with suppress(FileNotFoundError):
+                os.unlink(self.journal_path)
+
+    def _write_records(
+        self, path: str, data: dict, records: dict[str, dict[str, Any]]
+    ) -> None:
+        """Write the changed records to the journal or compact it."""
+        previous_records = self._journal_records
+        # Until the write succeeds the next write has to compact the journal
+        self._journal_records = None
+        if (
+            previous_records is None
+            or self._compact_journal
+            or self._journal_size > self._journal_base_size * JOURNAL_COMPACT_RATIO
+        ):
+            _LOGGER.debug("Writing data for %s to %s", self.key, path)
+            token = random_uuid_hex()
+            data["journal"] = token
+            data["data"] = _records_to_data(records)
+            json_helper.save_json(
+                path,
+                data,
+                self._private,
+                encoder=self._encoder,
+                atomic_writes=self._atomic_writes,
+            )
+            with suppress(FileNotFoundError):
+                os.unlink(self.journal_path)
+            self._journal_token = token
+            self._journal_base_size = os.path.getsize(path)
+            self._journal_size = 0
+            self._journal_records = records
+            return
+
+        changes = [
+            json_helper.json_bytes({"c": collection, "id": record_id, "r": record})
+            for collection, collection_records in records.items()
+            for record_id, record in collection_records.items()
+            if (
+                (previous := previous_records.get(collection, {}).get(record_id))
+                is not record
+                and previous != record
+            )
+        ]
+        changes.extend(
+            json_helper.json_bytes({"c": collection, "id": record_id, "r": None})
+            for collection, collection_records in previous_records.items()
+            for record_id in collection_records
+            if record_id not in records.get(collection, {})
+        )
+        if changes:
+            if not self._journal_size:
+                changes.insert(
+                    0, json_helper.json_bytes({"journal": self._journal_token})
+                )
+            _LOGGER.debug(
+                "Writing %s changed records for %s to %s",
+                len(changes),
+                self.key,
+                self.journal_path,
+            )
+            self._append_journal(b"".join(change + b"\n" for change in changes))
+        self._journal_records = records
+
+    def _append_journal(self, journal_data: bytes) -> None:
+        """Append data to the journal."""
+        try:
+            fd = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fd, journal_data)
+                if self._atomic_writes:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as error:
+            _LOGGER.exception("Saving file failed: %s", self.journal_path)
+            raise WriteError(error) from error
+        self._journal_size += len(journal_data)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -572,3 +821,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self.journal:
+            self._journal_records = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+def _records_to_data(records: dict[str, dict[str, Any]]) -> dict[str, list[Any]]:
+    """Return the data of the records by collection."""
+    return {
+        collection: list(collection_records.values())
+        for collection, collection_records in records.items()
+    }
@@ -11,9 +11,11 @@ from contextlib import AbstractContextManager
 from contextvars import ContextVar
 from datetime import date, datetime, time, timedelta
 from functools import cache, cached_property, lru_cache, partial, wraps
+import hashlib
 import json
 import logging
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -21,6 +23,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
@@ -28,7 +31,7 @@ import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import nodes, pass_context, pass_environment, pass_eval_context
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -47,6 +50,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as ha_version,
 )
 from homeassistant.core import (
     Context,
@@ -83,6 +87,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -100,6 +105,36 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
+# Generated code is only valid for the jinja and Home Assistant
+# version that created it
+BYTECODE_CACHE_RUNTIME = f"{jinja2.__version__}-{ha_version}"
+# Maximum size of the generated code kept in the cache
+MAX_BYTECODE_CACHE_BYTES = 8 * 1024 * 1024
+# Options of the environment the compiled code depends on
+_BYTECODE_ENVIRONMENT_OPTIONS = (
+    "autoescape",
+    "block_end_string",
+    "block_start_string",
+    "comment_end_string",
+    "comment_start_string",
+    "finalize",
+    "is_async",
+    "keep_trailing_newline",
+    "line_comment_prefix",
+    "line_statement_prefix",
+    "lstrip_blocks",
+    "newline_sequence",
+    "optimized",
+    "trim_blocks",
+    "undefined",
+    "variable_end_string",
+    "variable_start_string",
+)
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -368,6 +403,333 @@ def _cached_parse_result(render_result: str) -> Any:
     return render_result
 
 
+# Functions, filters and tests that read the entity passed as first argument
+_ENTITY_ID_FUNCTIONS = {
+    "has_value",
+    "is_state",
+    "is_state_attr",
+    "state_attr",
+    "state_translated",
+    "states",
+}
+# Names that read the state machine in ways that can not be derived statically
+_STATE_READING_NAMES = {*_ENTITY_ID_FUNCTIONS, "closest", "distance", "expand"}
+# Filters that apply the filter or test named by one of their arguments
+_HIGHER_ORDER_FILTERS = {"map", "reject", "rejectattr", "select", "selectattr"}
+
+
+def _const_entity_id(node: nodes.Node) -> str | None:
+    """Return the entity_id if the node is a constant string."""
+    if isinstance(node, nodes.Const) and isinstance(node.value, str):
+        return node.value.lower()
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _template_static_dependencies(
+    template: str,
+) -> tuple[frozenset[str], frozenset[str]] | None:
+    """Derive the entities and domains a template can read from its source.
+
+    Returns None if the template reads the state machine in a way that
+    can not be derived statically, for example by iterating all states
+    or passing a variable as entity_id.
+    """
+    try:
+        tree = _NO_HASS_ENV.parse(template)
+    except jinja2.TemplateSyntaxError:
+        return None
+    entities: set[str] = set()
+    domains: set[str] = set()
+    stack: list[nodes.Node] = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (nodes.Import, nodes.FromImport, nodes.Include)):
+            # Imported macros can read any state
+            return None
+        if (
+            isinstance(node, nodes.Call)
+            and isinstance(node.node, nodes.Name)
+            and node.node.name in _STATE_READING_NAMES
+        ):
+            # states('sensor.x'), is_state('sensor.x', 'on')
+            if node.node.name not in _ENTITY_ID_FUNCTIONS or not (
+                node.args and (entity_id := _const_entity_id(node.args[0]))
+            ):
+                return None
+            entities.add(entity_id)
+            stack.extend(node.args[1:])
+            stack.extend(node.kwargs)
+            if node.dyn_args or node.dyn_kwargs:
+                return None
+            continue
+        if (
+            isinstance(node, (nodes.Filter, nodes.Test))
+            and node.name in _STATE_READING_NAMES
+        ):
+            # 'sensor.x' | states, 'sensor.x' is is_state('on')
+            if node.name not in _ENTITY_ID_FUNCTIONS or not (
+                node.node and (entity_id := _const_entity_id(node.node))
+            ):
+                return None
+            entities.add(entity_id)
+            stack.extend(node.args)
+            stack.extend(node.kwargs)
+            if node.dyn_args or node.dyn_kwargs:
+                return None
+            continue
+        if (
+            isinstance(node, nodes.Filter)
+            and node.name in _HIGHER_ORDER_FILTERS
+            and any(
+                isinstance(arg, nodes.Const)
+                and isinstance(arg.value, str)
+                and arg.value in _STATE_READING_NAMES
+                for arg in node.args
+            )
+        ):
+            # ['sensor.x'] | map('states'), [...] | select('is_state', 'on')
+            return None
+        if isinstance(node, nodes.Getattr):
+            # states.sensor.x
+            if (
+                isinstance(domain_node := node.node, nodes.Getattr)
+                and isinstance(domain_node.node, nodes.Name)
+                and domain_node.node.name == "states"
+            ):
+                entities.add(f"{domain_node.attr}.{node.attr}")
+                continue
+            # states.sensor
+            if isinstance(node.node, nodes.Name) and node.node.name == "states":
+                domains.add(node.attr)
+                continue
+        if isinstance(node, nodes.Name) and node.name in _STATE_READING_NAMES:
+            return None
+        stack.extend(node.iter_child_nodes())
+    return frozenset(entities), frozenset(domains)
+
+
+# Globals the fast path can call; the hass functions are wrapped with
+# pass_context but ignore the context
+_FAST_RENDER_HASS_FUNCTIONS = {"has_value", "is_state", "is_state_attr", "state_attr"}
+_FAST_RENDER_GLOBALS = {*_FAST_RENDER_HASS_FUNCTIONS, "bool", "float", "int", "states"}
+# The states filter is left out as Jinja folds it for constant entity ids
+_FAST_RENDER_FILTERS = {
+    *_FAST_RENDER_HASS_FUNCTIONS,
+    "abs",
+    "bool",
+    "float",
+    "int",
+    "lower",
+    "round",
+    "upper",
+}
+_FAST_RENDER_BINOPS: dict[type[nodes.BinExpr], Callable[[Any, Any], Any]] = {
+    nodes.Add: operator.add,
+    nodes.Sub: operator.sub,
+    nodes.Mul: operator.mul,
+    nodes.Div: operator.truediv,
+    nodes.FloorDiv: operator.floordiv,
+    nodes.Mod: operator.mod,
+}
+_FAST_RENDER_UNARYOPS: dict[type[nodes.UnaryExpr], Callable[[Any], Any]] = {
+    nodes.Neg: operator.neg,
+    nodes.Not: operator.not_,
+    nodes.Pos: operator.pos,
+}
+_FAST_RENDER_COMPARE_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "in": lambda left, right: left in right,
+    "notin": lambda left, right: left not in right,
+}
+
+
+class _FastRenderUnsupported(Exception):
+    """Raised when a template is outside the fast path subset."""
+
+
+class _FastRender:
+    """A template compiled to plain Python callables."""
+
+    __slots__ = ("names", "render")
+
+    def __init__(self, names: frozenset[str], render: Callable[[], str]) -> None:
+        """Initialise the fast render."""
+        self.names = names
+        self.render = render
+
+
+@lru_cache(maxsize=1024)
+def _parse_fast_render(template: str) -> nodes.Output | None:
+    """Return the single output node of a template with one expression."""
+    # Avoid parsing templates that can never qualify
+    if template.count("{{") != 1 or "{%" in template or "{#" in template:
+        return None
+    try:
+        tree = _NO_HASS_ENV.parse(template)
+    except jinja2.TemplateSyntaxError:
+        return None
+    if len(tree.body) != 1 or not isinstance(output := tree.body[0], nodes.Output):
+        return None
+    return output
+
+
+class _FastRenderCompiler:
+    """Compile a single template expression to nested Python callables."""
+
+    __slots__ = ("_env", "names")
+
+    def __init__(self, env: TemplateEnvironment) -> None:
+        """Initialise the compiler."""
+        self._env = env
+        self.names: set[str] = set()
+
+    def _resolve(self, name: str, allowed: set[str], functions: dict[str, Any]) -> Any:
+        """Return the function or filter with name if it is supported."""
+        if name not in allowed or (func := functions.get(name)) is None:
+            raise _FastRenderUnsupported
+        if name in _FAST_RENDER_HASS_FUNCTIONS:
+            return partial(func, None)
+        if getattr(func, "jinja_pass_arg", None) is not None:
+            raise _FastRenderUnsupported
+        return func
+
+    def _call(
+        self,
+        func: Callable[..., Any],
+        args: list[Callable[[], Any]],
+        kwargs: list[nodes.Keyword],
+    ) -> Callable[[], Any]:
+        """Compile a function or filter call."""
+        if kwargs:
+            keywords = [(kwarg.key, self.compile(kwarg.value)) for kwarg in kwargs]
+            return lambda: func(
+                *[arg() for arg in args], **{key: value() for key, value in keywords}
+            )
+        if len(args) == 1:
+            arg = args[0]
+            return lambda: func(arg())
+        return lambda: func(*[arg() for arg in args])
+
+    def _compile_compare(self, node: nodes.Compare) -> Callable[[], Any]:
+        """Compile a possibly chained comparison."""
+        first = self.compile(node.expr)
+        ops: list[tuple[Callable[[Any, Any], Any], Callable[[], Any]]] = []
+        for operand in node.ops:
+            if (compare := _FAST_RENDER_COMPARE_OPS.get(operand.op)) is None:
+                raise _FastRenderUnsupported
+            ops.append((compare, self.compile(operand.expr)))
+        if len(ops) == 1:
+            compare, second = ops[0]
+            return lambda: compare(first(), second())
+
+        def _chained() -> Any:
+            # Chained comparisons short-circuit like in Python
+            left = first()
+            result: Any = True
+            for compare, expr in ops:
+                right = expr()
+                if not (result := compare(left, right)):
+                    return result
+                left = right
+            return result
+
+        return _chained
+
+    def _compile_call(self, node: nodes.Call | nodes.Filter) -> Callable[[], Any]:
+        """Compile a call to a global function or a filter."""
+        if node.dyn_args or node.dyn_kwargs:
+            raise _FastRenderUnsupported
+        if isinstance(node, nodes.Filter):
+            if node.node is None:
+                raise _FastRenderUnsupported
+            func = self._resolve(node.name, _FAST_RENDER_FILTERS, self._env.filters)
+            args = [self.compile(node.node)]
+        else:
+            if not isinstance(node.node, nodes.Name):
+                raise _FastRenderUnsupported
+            self.names.add(node.node.name)
+            func = self._resolve(
+                node.node.name, _FAST_RENDER_GLOBALS, self._env.globals
+            )
+            args = []
+        args.extend(self.compile(arg) for arg in node.args)
+        return self._call(func, args, node.kwargs)
+
+    def compile(self, node: nodes.Node) -> Callable[[], Any]:
+        """Compile an expression node."""
+        if isinstance(node, nodes.Const):
+            value = node.value
+            return lambda: value
+        if isinstance(node, (nodes.List, nodes.Tuple)):
+            items = [self.compile(item) for item in node.items]
+            factory = list if isinstance(node, nodes.List) else tuple
+            return lambda: factory([item() for item in items])
+        if isinstance(node, (nodes.Call, nodes.Filter)):
+            return self._compile_call(node)
+        if isinstance(node, nodes.And):
+            left, right = self.compile(node.left), self.compile(node.right)
+            return lambda: left() and right()
+        if isinstance(node, nodes.Or):
+            left, right = self.compile(node.left), self.compile(node.right)
+            return lambda: left() or right()
+        if (binop := _FAST_RENDER_BINOPS.get(type(node))) is not None:
+            assert isinstance(node, nodes.BinExpr)
+            left, right = self.compile(node.left), self.compile(node.right)
+            return lambda: binop(left(), right())
+        if (unaryop := _FAST_RENDER_UNARYOPS.get(type(node))) is not None:
+            assert isinstance(node, nodes.UnaryExpr)
+            operand = self.compile(node.node)
+            return lambda: unaryop(operand())
+        if isinstance(node, nodes.Compare):
+            return self._compile_compare(node)
+        if isinstance(node, nodes.Concat):
+            parts = [self.compile(part) for part in node.nodes]
+            return lambda: "".join([str(part()) for part in parts])
+        if isinstance(node, nodes.CondExpr) and node.expr2 is not None:
+            test = self.compile(node.test)
+            expr1, expr2 = self.compile(node.expr1), self.compile(node.expr2)
+            return lambda: expr1() if test() else expr2()
+        raise _FastRenderUnsupported
+
+
+def _compile_fast_render(env: TemplateEnvironment, template: str) -> _FastRender | None:
+    """Compile a trivial template to Python callables bypassing Jinja.
+
+    Only a single expression built from constants, arithmetic, comparisons,
+    boolean logic and a few state functions and filters is supported.
+    Everything else returns None and is rendered by Jinja.
+    """
+    if (output := _parse_fast_render(template)) is None:
+        return None
+    compiler = _FastRenderCompiler(env)
+    try:
+        parts: list[str | Callable[[], Any]] = [
+            child.data
+            if isinstance(child, nodes.TemplateData)
+            else compiler.compile(child)
+            for child in output.nodes
+        ]
+    except _FastRenderUnsupported:
+        return None
+    names = frozenset(compiler.names)
+
+    if len(parts) == 1 and not isinstance(expr := parts[0], str):
+        return _FastRender(names, lambda: str(expr()))
+
+    def _render() -> str:
+        return "".join(
+            [part if isinstance(part, str) else str(part()) for part in parts]
+        )
+
+    return _FastRender(names, _render)
+
+
 class RenderInfo:
     """Holds information about a template render."""
 
@@ -460,15 +822,33 @@ class RenderInfo:
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
     def _freeze(self) -> None:
+        # A render that failed may not have collected everything the
+        # template reads, unless it can be derived from the source.
+        # Templates that fail to compile are never narrowed.
+        untracked_exception = False
+        if self.exception:
+            if (
+                self.template._compiled_code is not None  # noqa: SLF001
+                and (
+                    dependencies := _template_static_dependencies(
+                        self.template.template
+                    )
+                )
+            ):
+                self.entities = self.entities | dependencies[0]
+                self.domains = self.domains | dependencies[1]
+            else:
+                untracked_exception = True
+
         self._freeze_sets()
 
         if self.rate_limit is None:
-            if self.all_states or self.exception:
+            if self.all_states or untracked_exception:
                 self.rate_limit = ALL_STATES_RATE_LIMIT
             elif self.domains or self.domains_lifecycle:
                 self.rate_limit = DOMAIN_STATES_RATE_LIMIT
 
-        if self.exception:
+        if untracked_exception:
             return
 
         if not self.all_states_lifecycle:
@@ -498,6 +878,7 @@ class Template:
         "is_static",
         "_compiled_code",
         "_compiled",
+        "_fast_render",
         "_exc_info",
         "_limited",
         "_strict",
@@ -530,6 +911,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._fast_render: _FastRender | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: sys._OptExcInfo | None = None
@@ -628,7 +1010,14 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (fast_render := self._fast_render) is not None and (
+                not kwargs or fast_render.names.isdisjoint(kwargs)
+            ):
+                render_result = _fast_render_with_context(
+                    self.template, fast_render.render
+                )
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -849,6 +1238,8 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        if not limited and not strict and log_fn is None:
+            self._fast_render = _compile_fast_render(env, self.template)
 
         return self._compiled
 
@@ -2727,6 +3118,13 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+def _fast_render_with_context(template_str: str, render: Callable[[], str]) -> str:
+    """Store template being rendered in a ContextVar and render the fast path."""
+    with _template_context_manager as cm:
+        cm.set_template(template_str, "rendering")
+        return render()
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2805,6 +3203,82 @@ def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
 
 
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the compiled template code persisted by the previous run."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+
+class TemplateBytecodeCache:
+    """Persistent cache of the python code generated for templates.
+
+    The cache keeps the python source jinja generates and not code
+    objects, the source is compiled again when it is used so a broken
+    or crafted store can not make marshal load an invalid code object.
+
+    Entries are keyed by a hash of the template source and the
+    environment that generated them, and evicted least recently used
+    first once their code is larger than MAX_BYTECODE_CACHE_BYTES.
+
+    The entries are stored in a collection named after the runtime that
+    compiled them, and the store is journaled so a compile only appends
+    the new entry instead of rewriting the whole cache.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._store = Store[dict[str, Any]](
+            hass,
+            BYTECODE_CACHE_STORAGE_VERSION,
+            BYTECODE_CACHE_STORAGE_KEY,
+            journal=True,
+        )
+        # Records by key, in least recently used order
+        self._bytecode: dict[str, dict[str, str]] = {}
+        self._size = 0
+
+    async def async_load(self) -> None:
+        """Load the cache from storage."""
+        if (data := await self._store.async_load()) and (
+            records := data.get(BYTECODE_CACHE_RUNTIME)
+        ):
+            self._bytecode = {record["id"]: record for record in records}
+            self._size = sum(len(record["code"]) for record in records)
+
+    @callback
+    def async_get(self, key: str) -> str | None:
+        """Return the generated code for key if it is cached."""
+        if (record := self._bytecode.pop(key, None)) is None:
+            return None
+        self._bytecode[key] = record
+        return record["code"]
+
+    @callback
+    def async_discard(self, key: str) -> None:
+        """Discard the generated code for key."""
+        if (record := self._bytecode.pop(key, None)) is not None:
+            self._size -= len(record["code"])
+
+    @callback
+    def async_set(self, key: str, code: str) -> None:
+        """Cache the generated code for key."""
+        bytecode = self._bytecode
+        if (previous := bytecode.pop(key, None)) is not None:
+            self._size -= len(previous["code"])
+        bytecode[key] = {"id": key, "code": code}
+        self._size += len(code)
+        while self._size > MAX_BYTECODE_CACHE_BYTES and len(bytecode) > 1:
+            self._size -= len(bytecode.pop(next(iter(bytecode)))["code"])
+        self._store.async_delay_save_records(
+            self._records_to_save, BYTECODE_CACHE_SAVE_DELAY
+        )
+
+    def _records_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the records to store by collection and key."""
+        return {BYTECODE_CACHE_RUNTIME: self._bytecode.copy()}
+
+
 class HassLoader(jinja2.BaseLoader):
     """An in-memory jinja loader that keeps track of templates that need to be reloaded."""
 
@@ -3201,9 +3675,58 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            type(source) is str  # noqa: E721
+            and (hass := self.hass) is not None
+            and hass.loop_thread_id == threading.get_ident()
+            and (bytecode_cache := hass.data.get(_BYTECODE_CACHE)) is not None
+        ):
+            key = hashlib.sha256(
+                f"{self._bytecode_fingerprint()}\0{source}".encode()
+            ).hexdigest()
+            compiled = None
+            if (generated := bytecode_cache.async_get(key)) is not None:
+                try:
+                    compiled = self._compile(generated, "<template>")
+                except (SyntaxError, ValueError):
+                    _LOGGER.debug("Discarding invalid cached template code %s", key)
+                    bytecode_cache.async_discard(key)
+            if compiled is None:
+                generated = super().compile(source, raw=True)
+                compiled = self._compile(generated, "<template>")
+                bytecode_cache.async_set(key, generated)
+        else:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
+    def _bytecode_fingerprint(self) -> str:
+        """Return a fingerprint of what the generated code depends on.
+
+        The compiler checks that filters and tests exist and passes
+        the context to the ones that ask for it, and the options of the
+        environment change the generated code, so cached code must
+        be discarded when they change. Filters, tests and globals can
+        be added at any time, so the fingerprint is not cached.
+        """
+        fingerprint = (
+            [
+                (option, getattr(value, "__qualname__", value))
+                for option in _BYTECODE_ENVIRONMENT_OPTIONS
+                for value in (getattr(self, option),)
+            ],
+            sorted(self.extensions),
+            sorted(self.globals),
+            sorted(
+                (name, repr(getattr(func, "jinja_pass_arg", None)))
+                for name, func in self.filters.items()
+            ),
+            sorted(
+                (name, repr(getattr(func, "jinja_pass_arg", None)))
+                for name, func in self.tests.items()
+            ),
+        )
+        return hashlib.sha256(repr(fingerprint).encode()).hexdigest()
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Hashable
 from datetime import datetime, timedelta
 from functools import cached_property
 import logging
@@ -26,13 +28,32 @@ from homeassistant.exceptions import (
     ConfigEntryNotReady,
 )
 from homeassistant.util.dt import utcnow
+from homeassistant.util.hass_dict import HassKey
 
 from . import entity, event
 from .debounce import Debouncer
+from .singleton import singleton
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+# Upper bounds in seconds of the buckets of the refresh latency histogram
+REFRESH_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# With adaptive polling the update interval is multiplied by the backoff
+# factor after a refresh that returned the same data, and by the tighten
+# factor after a refresh that returned changed data
+ADAPTIVE_BACKOFF_FACTOR = 1.5
+ADAPTIVE_TIGHTEN_FACTOR = 0.5
+# The update interval is kept at least this many times the refresh latency
+ADAPTIVE_LATENCY_FACTOR = 10
+# Adaptive refreshes are staggered over this fraction of the update interval
+ADAPTIVE_STAGGER_RATIO = 0.1
+ADAPTIVE_STAGGER_MAX_SECONDS = 60
+
+DATA_REFRESH_SLOTS: HassKey[_RefreshSlots] = HassKey("update_coordinator_slots")
+DATA_SHARED_FETCHES: HassKey[SharedFetches] = HassKey("update_coordinator_fetches")
+
 _DataT = TypeVar("_DataT", default=dict[str, Any])
 _DataUpdateCoordinatorT = TypeVar(
     "_DataUpdateCoordinatorT",
@@ -45,6 +66,119 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+class RefreshLatencyHistogram:
+    """Histogram of the time the refreshes of a coordinator take."""
+
+    __slots__ = ("count", "counts", "total")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        # The last bucket counts the refreshes slower than all bounds
+        self.counts = [0] * (len(REFRESH_LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, latency: float) -> None:
+        """Add the latency of a refresh in seconds."""
+        self.counts[bisect_left(REFRESH_LATENCY_BUCKETS, latency)] += 1
+        self.count += 1
+        self.total += latency
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dict."""
+        return {
+            "buckets": dict(
+                zip(
+                    (*map(str, REFRESH_LATENCY_BUCKETS), "inf"),
+                    self.counts,
+                    strict=True,
+                )
+            ),
+            "count": self.count,
+            "sum": self.total,
+        }
+
+
+class _RefreshSlots:
+    """Track how many adaptive refreshes are scheduled in each second."""
+
+    __slots__ = ("_counts",)
+
+    def __init__(self) -> None:
+        """Initialize the slots."""
+        self._counts: defaultdict[int, int] = defaultdict(int)
+
+    def reserve(self, earliest: int, spread: int) -> int:
+        """Reserve the least busy second in earliest..earliest + spread."""
+        counts = self._counts
+        slot = min(
+            range(earliest, earliest + spread + 1),
+            key=lambda second: counts.get(second, 0),
+        )
+        counts[slot] += 1
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Release a second reserved with reserve."""
+        if count := self._counts[slot] - 1:
+            self._counts[slot] = count
+        else:
+            del self._counts[slot]
+
+
+@singleton(DATA_REFRESH_SLOTS)
+def _async_get_refresh_slots(hass: HomeAssistant) -> _RefreshSlots:
+    """Return the refresh slots shared by the adaptive coordinators."""
+    return _RefreshSlots()
+
+
+class SharedFetches:
+    """Collapse concurrent fetches with the same fetch key into one."""
+
+    __slots__ = ("_in_flight", "coalesced", "fetches", "hass")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shared fetches."""
+        self.hass = hass
+        self._in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+        self.fetches = 0
+        self.coalesced = 0
+
+    async def async_fetch[_T](
+        self, fetch_key: Hashable, fetch: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Return the result of the fetch in flight for the key or start one.
+
+        The fetch is shielded so a cancelled caller does not cancel it for
+        the other callers waiting on it.
+        """
+        if (task := self._in_flight.get(fetch_key)) is not None:
+            self.coalesced += 1
+            return await asyncio.shield(task)
+
+        async def _fetch() -> _T:
+            return await fetch()
+
+        self.fetches += 1
+        task = self.hass.async_create_task(
+            _fetch(), f"update coordinator fetch {fetch_key}"
+        )
+        if not task.done():
+            self._in_flight[fetch_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(fetch_key, None))
+        return await asyncio.shield(task)
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the number of fetches and of fetches saved by coalescing."""
+        return {"fetches": self.fetches, "coalesced": self.coalesced}
+
+
+@singleton(DATA_SHARED_FETCHES)
+def async_get_shared_fetches(hass: HomeAssistant) -> SharedFetches:
+    """Return the fetches shared by the coordinators with a fetch key."""
+    return SharedFetches(hass)
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -61,6 +195,17 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting :attr:`min_update_interval` or :attr:`max_update_interval` enables
+    adaptive polling. The update interval then grows while the data stays the
+    same and shrinks when it changes, within those bounds, and the scheduled
+    refreshes are staggered with the ones of other adaptive coordinators.
+    This also requires that the data implements ``__eq__``.
+
+    Coordinators created with the same :attr:`fetch_key` share their fetches:
+    a refresh that starts while another one with the same key is fetching
+    waits for that fetch and uses its data instead of fetching again. Only
+    coordinators that fetch the same data should share a fetch key.
     """
 
     def __init__(
@@ -74,6 +219,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        min_update_interval: timedelta | None = None,
+        max_update_interval: timedelta | None = None,
+        fetch_key: Hashable | None = None,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -83,9 +231,27 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self.setup_method = setup_method
         self._update_interval_seconds: float | None = None
         self.update_interval = update_interval
+        self._adaptive = (
+            min_update_interval is not None or max_update_interval is not None
+        )
+        if self._adaptive:
+            if update_interval is None:
+                raise ValueError("Adaptive polling requires an update interval")
+            self.min_update_interval = min_update_interval or update_interval
+            self.max_update_interval = max_update_interval or update_interval
+            if not (
+                self.min_update_interval <= update_interval <= self.max_update_interval
+            ):
+                raise ValueError(
+                    "The update interval must be between the minimum and maximum"
+                    " update interval"
+                )
+        self._refresh_slot: int | None = None
+        self.refresh_latency = RefreshLatencyHistogram()
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self.fetch_key = fetch_key
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -191,6 +357,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._unsub_refresh:
             self._unsub_refresh()
             self._unsub_refresh = None
+        self._async_release_refresh_slot()
+
+    def _async_release_refresh_slot(self) -> None:
+        """Release the second reserved for the scheduled adaptive refresh."""
+        if self._refresh_slot is not None:
+            _async_get_refresh_slots(self.hass).release(self._refresh_slot)
+            self._refresh_slot = None
 
     def _async_unsub_shutdown(self) -> None:
         """Cancel any scheduled call."""
@@ -228,9 +401,21 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         hass = self.hass
         loop = hass.loop
 
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
-        )
+        if self._adaptive:
+            # Spread the adaptive refreshes over the seconds after the
+            # interval to flatten the load when many are due at once
+            self._refresh_slot = _async_get_refresh_slots(hass).reserve(
+                int(loop.time() + self._update_interval_seconds),
+                min(
+                    int(self._update_interval_seconds * ADAPTIVE_STAGGER_RATIO),
+                    ADAPTIVE_STAGGER_MAX_SECONDS,
+                ),
+            )
+            next_refresh = self._refresh_slot + self._microsecond
+        else:
+            next_refresh = (
+                int(loop.time()) + self._microsecond + self._update_interval_seconds
+            )
         self._unsub_refresh = loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
         ).cancel
@@ -255,6 +440,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
+        self._async_release_refresh_slot()
         await self._async_refresh(log_failures=True, scheduled=True)
 
     async def async_request_refresh(self) -> None:
@@ -343,15 +529,18 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._shutdown_requested or scheduled and self.hass.is_stopping:
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
-            start = monotonic()
-
+        start = monotonic()
         auth_failed = False
         previous_update_success = self.last_update_success
         previous_data = self.data
 
         try:
-            self.data = await self._async_update_data()
+            if self.fetch_key is None:
+                self.data = await self._async_update_data()
+            else:
+                self.data = await async_get_shared_fetches(self.hass).async_fetch(
+                    self.fetch_key, self._async_update_data
+                )
 
         except (TimeoutError, requests.exceptions.Timeout) as err:
             self.last_exception = err
@@ -430,12 +619,17 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
-            if log_timing:
-                self.logger.debug(
-                    "Finished fetching %s data in %.3f seconds (success: %s)",
-                    self.name,
-                    monotonic() - start,  # pylint: disable=possibly-used-before-assignment
-                    self.last_update_success,
+            latency = monotonic() - start
+            self.refresh_latency.add(latency)
+            self.logger.debug(
+                "Finished fetching %s data in %.3f seconds (success: %s)",
+                self.name,
+                latency,
+                self.last_update_success,
+            )
+            if self._adaptive and scheduled:
+                self._async_adapt_update_interval(
+                    self.last_update_success and previous_data != self.data, latency
                 )
             if not auth_failed and self._listeners and not self.hass.is_stopping:
                 self._schedule_refresh()
@@ -452,6 +646,20 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         ):
             self.async_update_listeners()
 
+    @callback
+    def _async_adapt_update_interval(self, changed: bool, latency: float) -> None:
+        """Adapt the update interval to how often the data changes."""
+        assert self._update_interval_seconds is not None
+        seconds = max(
+            self._update_interval_seconds
+            * (ADAPTIVE_TIGHTEN_FACTOR if changed else ADAPTIVE_BACKOFF_FACTOR),
+            latency * ADAPTIVE_LATENCY_FACTOR,
+        )
+        self.update_interval = min(
+            max(timedelta(seconds=seconds), self.min_update_interval),
+            self.max_update_interval,
+        )
+
     @callback
     def _async_refresh_finished(self) -> None:
         """Handle when a refresh has finished.
@@ -6,17 +6,29 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+import gc
 import logging
+import os
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
+import tracemalloc
 
-from homeassistant import core
+from homeassistant import config_entries, core, loader
+from homeassistant.components import recorder
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import recorder as recorder_helper
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
+    async_track_time_interval,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.template import Template
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from homeassistant.util.async_ import get_scheduled_timer_handles
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -116,6 +128,74 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_with_entity_id_filters(hass):
+    """Fire a million events with 1000 listeners filtering on entity_id."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**6
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+        hass.bus.async_listen(
+            event_name,
+            listener,
+            event_filter=core.callback(
+                lambda event_data, entity_id=f"light.kitchen{idx}": (
+                    event_data["entity_id"] == entity_id
+                )
+            ),
+        )
+
+    event_data = {"entity_id": "light.kitchen0"}
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(event_name, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def fire_events_with_entity_id_index(hass):
+    """Fire a million events with 1000 listeners indexed by entity_id."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**6
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+        hass.bus.async_listen_entity_ids(event_name, f"light.kitchen{idx}", listener)
+
+    event_data = {"entity_id": "light.kitchen0"}
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(event_name, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -308,3 +388,266 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def state_machine_memory(hass):
+    """Write 20k states twice and print the memory used per entity."""
+    entities = 20000
+    entity_ids = [f"sensor.temperature_{idx}" for idx in range(entities)]
+    attributes = [
+        {
+            "unit_of_measurement": "°C",
+            "device_class": "temperature",
+            "state_class": "measurement",
+            "friendly_name": f"Temperature {idx}",
+        }
+        for idx in range(entities)
+    ]
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    start = timer()
+    for value in (1, 2):
+        for idx, entity_id in enumerate(entity_ids):
+            hass.states.async_set(entity_id, str(idx * value), attributes[idx])
+    runtime = timer() - start
+
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    used = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print(f"State machine uses {used / entities:.0f} bytes per entity")
+
+    return runtime
+
+
+@benchmark
+async def template_render(hass):
+    """Render simple templates 100k times each with and without the fast path."""
+    hass.states.async_set("sensor.temperature", "21.5")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.dining_room", "off")
+    template_strs = [
+        "{{ states('sensor.temperature') | float(0) * 2 }}",
+        "{{ is_state('light.kitchen', 'on') and is_state('light.dining_room', 'on') }}",
+        "{{ 'on' if states('sensor.temperature') | float(0) > 20 else 'off' }}",
+    ]
+
+    def _render_all(templates):
+        start = timer()
+        for tpl in templates:
+            for _ in range(10**5):
+                tpl.async_render()
+        return timer() - start
+
+    templates = [Template(template_str, hass) for template_str in template_strs]
+    jinja_templates = [Template(template_str, hass) for template_str in template_strs]
+    for tpl in (*templates, *jinja_templates):
+        tpl.async_render()
+    for tpl in jinja_templates:
+        tpl._fast_render = None  # noqa: SLF001
+
+    print(f"Jinja rendering done in {_render_all(jinja_templates)}s")
+    return _render_all(templates)
+
+
+@benchmark
+async def schedule_polling_intervals(hass):
+    """Schedule and cancel 10k polling intervals and print the timer heap size."""
+    intervals = 10**4
+
+    @core.callback
+    def listener(_):
+        """Handle interval."""
+
+    def _active_timers():
+        return sum(
+            not handle.cancelled() for handle in get_scheduled_timer_handles(hass.loop)
+        )
+
+    def _schedule(coarse):
+        start = timer()
+        before = _active_timers()
+        unsubs = [
+            async_track_time_interval(
+                hass, listener, timedelta(seconds=30 + idx % 60), coarse=coarse
+            )
+            for idx in range(intervals)
+        ]
+        after = _active_timers()
+        for unsub in unsubs:
+            unsub()
+        print(f"Timer heap size {before} -> {after} with coarse={coarse}")
+        return timer() - start
+
+    print(f"Scheduling loop timers done in {_schedule(False)}s")
+    return _schedule(True)
+
+
+@benchmark
+async def recorder_state_writes(hass):
+    """Record 50k state changes with and without bulk inserts.
+
+    Uses a SQLite database unless RECORDER_BENCHMARK_DB_URL points to a
+    MySQL or PostgreSQL database.
+    """
+    entities = 1000
+    rounds = 50
+
+    async def _write_rounds(instance, first_round):
+        start = timer()
+        for value in range(first_round, first_round + rounds):
+            for idx in range(entities):
+                hass.states.async_set(
+                    f"sensor.power_{idx}", str(value), {"unit_of_measurement": "W"}
+                )
+            await hass.async_block_till_done()
+            instance._async_commit(dt_util.utcnow())  # noqa: SLF001
+        await instance.async_block_till_done()
+        runtime = timer() - start
+        print(f"{entities * rounds / runtime:.0f} rows/s")
+        return runtime
+
+    with TemporaryDirectory() as tmpdir:
+        db_url = os.environ.get(
+            "RECORDER_BENCHMARK_DB_URL", f"sqlite:///{tmpdir}/benchmark.db"
+        )
+        hass.config.config_dir = tmpdir
+        hass.config.skip_pip = True
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        loader.async_setup(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        await async_setup_component(
+            hass, recorder.DOMAIN, {recorder.DOMAIN: {"db_url": db_url}}
+        )
+        await hass.async_start()
+        instance = recorder.get_instance(hass)
+        await instance.async_db_ready
+        # Allocate the metadata and attributes of the entities
+        await _write_rounds(instance, 0)
+
+        bulk_insert_states = instance._bulk_insert_states  # noqa: SLF001
+        instance._bulk_insert_states = False  # noqa: SLF001
+        print("ORM inserts: ", end="")
+        await _write_rounds(instance, rounds)
+        instance._bulk_insert_states = bulk_insert_states  # noqa: SLF001
+        print(f"Bulk inserts ({bulk_insert_states=}): ", end="")
+        runtime = await _write_rounds(instance, 2 * rounds)
+        await hass.async_stop()
+
+    return runtime
+
+
+@benchmark
+async def sensor_compile_statistics(hass):
+    """Compile 5-minute statistics of 3k sensors with 20 states each.
+
+    Run it before and after a change of the sensor statistics to compare
+    the compile times.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor.recorder import compile_statistics
+
+    entities = 3000
+    states_per_entity = 20
+    compiles = 10
+
+    with TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        hass.config.skip_pip = True
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        loader.async_setup(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        await async_setup_component(
+            hass,
+            recorder.DOMAIN,
+            {recorder.DOMAIN: {"db_url": f"sqlite:///{tmpdir}/benchmark.db"}},
+        )
+        await hass.async_start()
+        instance = recorder.get_instance(hass)
+        await instance.async_db_ready
+
+        start = dt_util.utcnow() - timedelta(minutes=5)
+        for value in range(states_per_entity):
+            for idx in range(entities):
+                state_class = "total_increasing" if idx % 3 == 0 else "measurement"
+                unit = "Wh" if idx % 3 == 0 else ("W" if idx % 2 else "kW")
+                hass.states.async_set(
+                    f"sensor.power_{idx}",
+                    str(value + idx % 7),
+                    {"state_class": state_class, "unit_of_measurement": unit},
+                )
+            await hass.async_block_till_done()
+        await instance.async_block_till_done()
+        end = dt_util.utcnow() + timedelta(seconds=1)
+
+        def _compile():
+            compile_start = timer()
+            for _ in range(compiles):
+                with recorder.util.session_scope(hass=hass, read_only=True) as session:
+                    compiled = compile_statistics(hass, session, start, end)
+            assert len(compiled.platform_stats) == entities
+            return timer() - compile_start
+
+        runtime = await instance.async_add_executor_job(_compile)
+        print(f"{runtime / compiles * 1000:.0f}ms per compile")
+        await hass.async_stop()
+
+    return runtime
+
+
+@benchmark
+async def entity_registry_store(hass):
+    """Write and load entity registries with 10k and 50k entities.
+
+    Prints the time of the full write, of the write after renaming a
+    single entity and of loading the base file and the journal.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import entity_registry as er
+
+    runtime = 0.0
+    with TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        for entities in (10**4, 5 * 10**4):
+            registry = er.EntityRegistry(hass)
+            await registry.async_load()
+            for idx in range(entities):
+                registry.async_get_or_create("sensor", "benchmark", f"{idx}")
+            store = registry._store  # noqa: SLF001
+
+            start = timer()
+            registry.async_schedule_save()
+            await store._async_handle_write_data()  # noqa: SLF001
+            full_write = timer() - start
+
+            start = timer()
+            registry.async_update_entity(
+                "sensor.benchmark_0", new_entity_id="sensor.renamed"
+            )
+            await store._async_handle_write_data()  # noqa: SLF001
+            changed_write = timer() - start
+
+            start = timer()
+            await er.EntityRegistryStore(
+                hass,
+                er.STORAGE_VERSION_MAJOR,
+                er.STORAGE_KEY,
+                minor_version=er.STORAGE_VERSION_MINOR,
+                journal=True,
+            ).async_load()
+            load = timer() - start
+
+            print(
+                f"{entities} entities: full write {full_write * 1000:.0f}ms,"
+                f" write of a rename {changed_write * 1000:.0f}ms,"
+                f" load {load * 1000:.0f}ms"
+            )
+            await store.async_remove()
+            runtime += full_write + changed_write + load
+
+    return runtime
@@ -1381,6 +1381,11 @@ def mock_storage(data: dict[str, Any] | None = None) -> Generator[dict[str, Any]
 
         if "data_func" in data_to_write:
             data_to_write["data"] = data_to_write.pop("data_func")()
+        elif "records_func" in data_to_write:
+            data_to_write["data"] = {
+                collection: list(records.values())
+                for collection, records in data_to_write.pop("records_func")().items()
+            }
 
         encoder = store._encoder
         if encoder and encoder is not JSONEncoder:
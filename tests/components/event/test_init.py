@@ -226,10 +226,10 @@ async def test_saving_state(hass: HomeAssistant, hass_storage: dict[str, Any]) -
 
     await async_mock_restore_state_shutdown_restart(hass)
 
-    assert len(hass_storage[RESTORE_STATE_KEY]["data"]) == 1
-    state = hass_storage[RESTORE_STATE_KEY]["data"][0]["state"]
+    assert len(hass_storage[f"{RESTORE_STATE_KEY}.event"]["data"]) == 1
+    state = hass_storage[f"{RESTORE_STATE_KEY}.event"]["data"][0]["state"]
     assert state["entity_id"] == "event.doorbell"
-    extra_data = hass_storage[RESTORE_STATE_KEY]["data"][0]["extra_data"]
+    extra_data = hass_storage[f"{RESTORE_STATE_KEY}.event"]["data"][0]["extra_data"]
     assert extra_data == restore_data
 
 
@@ -543,6 +543,86 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_columnar(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream with the columnar format."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr", "new": 1})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"new": 1})
+    sensor_one_last_updated_timestamp = hass.states.get(
+        "sensor.one"
+    ).last_updated_timestamp
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.two", "off")
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == "result"
+
+    response = await client.receive_json()
+    event = response["event"]
+    assert "states" not in event
+    assert event["start_time"] == pytest.approx(now.timestamp())
+    state_table = event["state_table"]
+    assert sorted(state_table) == ["off", "on"]
+    sensor_one = event["columns"]["sensor.one"]
+    assert [state_table[idx] for idx in sensor_one["s"]] == ["on", "on", "off"]
+    assert sensor_one["lu"][-1] == pytest.approx(sensor_one_last_updated_timestamp)
+    assert len(sensor_one["lc"]) == 3
+    assert sensor_one["a"] == [
+        {"any": "attr"},
+        {"+": {"new": 1}},
+        {"-": ["any"]},
+    ]
+    sensor_two = event["columns"]["sensor.two"]
+    assert [state_table[idx] for idx in sensor_two["s"]] == ["off"]
+    assert sensor_two["a"] == [{}]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "minimal_response": True,
+            "no_attributes": True,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    event = response["event"]
+    sensor_one = event["columns"]["sensor.one"]
+    assert [event["state_table"][idx] for idx in sensor_one["s"]] == ["on", "off"]
+    assert "a" not in sensor_one
+    assert "lc" not in sensor_one
+
+
 async def test_history_stream_significant_domain_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
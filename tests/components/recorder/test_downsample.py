@@ -0,0 +1,152 @@
+"""The tests for the recorder downsampled states."""
+
+from datetime import datetime, timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from sqlalchemy import select
+
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.db_schema import StatesDownsampled
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done, do_adhoc_statistics
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+@pytest.mark.parametrize(
+    ("span", "points", "tier"),
+    [
+        (timedelta(hours=1), 1000, None),
+        (timedelta(days=1), 1000, 1),
+        (timedelta(days=30), 1000, 15),
+        (timedelta(days=30), 100000, None),
+    ],
+)
+def test_select_downsample_tier(span: timedelta, points: int, tier: int | None) -> None:
+    """Test the tier is selected by the time per point."""
+    start = dt_util.utcnow()
+    assert history.select_downsample_tier(start, start + span, points) == tier
+
+
+async def _async_record_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> datetime:
+    """Record some states and compile them, return the start of the hour."""
+    zero = (dt_util.utcnow() + timedelta(hours=1)).replace(
+        minute=0, second=0, microsecond=0
+    )
+    for offset, entity_id, state in (
+        (timedelta(seconds=10), "sensor.power", "10"),
+        (timedelta(seconds=20), "binary_sensor.door", "on"),
+        (timedelta(seconds=40), "sensor.power", "30"),
+        (timedelta(seconds=90), "sensor.power", "unavailable"),
+        (timedelta(minutes=3), "sensor.power", "20"),
+        (timedelta(minutes=3, seconds=30), "sensor.power", "20"),
+    ):
+        freezer.move_to(zero + offset)
+        hass.states.async_set(entity_id, state, {"unit_of_measurement": "W"})
+        await async_wait_recording_done(hass)
+
+    freezer.move_to(zero + timedelta(minutes=16))
+    for minutes in (0, 5, 10):
+        do_adhoc_statistics(hass, start=zero + timedelta(minutes=minutes))
+    await async_wait_recording_done(hass)
+    return zero
+
+
+async def test_compile_downsampled_states(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the buckets of each tier are compiled with the statistics."""
+    zero = await _async_record_states(hass, freezer)
+    zero_ts = zero.timestamp()
+
+    def _fetch_buckets() -> list[tuple]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                tuple(row)
+                for row in session.execute(
+                    select(
+                        StatesDownsampled.tier,
+                        StatesDownsampled.start_ts,
+                        StatesDownsampled.state,
+                        StatesDownsampled.last_updated_ts,
+                        StatesDownsampled.min,
+                        StatesDownsampled.max,
+                    ).order_by(
+                        StatesDownsampled.tier,
+                        StatesDownsampled.metadata_id,
+                        StatesDownsampled.start_ts,
+                    )
+                )
+            ]
+
+    buckets = await recorder_mock.async_add_executor_job(_fetch_buckets)
+    assert buckets == [
+        (1, zero_ts, "30", pytest.approx(zero_ts + 40), 10.0, 30.0),
+        (1, zero_ts + 60, "unavailable", pytest.approx(zero_ts + 90), None, None),
+        (1, zero_ts + 180, "20", pytest.approx(zero_ts + 210), 20.0, 20.0),
+        (1, zero_ts, "on", pytest.approx(zero_ts + 20), None, None),
+        (15, zero_ts, "20", pytest.approx(zero_ts + 210), 10.0, 30.0),
+        (15, zero_ts, "on", pytest.approx(zero_ts + 20), None, None),
+    ]
+
+
+async def test_get_significant_states_downsampled(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test history is served from the buckets of a tier."""
+    zero = await _async_record_states(hass, freezer)
+    zero_ts = zero.timestamp()
+
+    states = await recorder_mock.async_add_executor_job(
+        history.get_significant_states_downsampled,
+        hass,
+        zero,
+        zero + timedelta(minutes=15),
+        ["sensor.power", "binary_sensor.door"],
+        1,
+    )
+    assert states == {
+        "sensor.power": [
+            {"s": "30", "lu": pytest.approx(zero_ts + 40), "mn": 10.0, "mx": 30.0},
+            {"s": "unavailable", "lu": pytest.approx(zero_ts + 90)},
+            {"s": "20", "lu": pytest.approx(zero_ts + 210), "mn": 20.0, "mx": 20.0},
+        ],
+        "binary_sensor.door": [{"s": "on", "lu": pytest.approx(zero_ts + 20)}],
+    }
+
+    # The period after the last compiled statistics run comes from the states
+    freezer.move_to(zero + timedelta(minutes=17))
+    hass.states.async_set("sensor.power", "50", {"unit_of_measurement": "W"})
+    await async_wait_recording_done(hass)
+    states = await recorder_mock.async_add_executor_job(
+        history.get_significant_states_downsampled,
+        hass,
+        zero,
+        zero + timedelta(minutes=20),
+        ["sensor.power"],
+        15,
+        False,
+    )
+    assert states == {
+        "sensor.power": [
+            {"s": "20", "lu": pytest.approx(zero_ts + 210), "mn": 10.0, "mx": 30.0},
+            {
+                "s": "50",
+                "a": {"unit_of_measurement": "W"},
+                "lu": pytest.approx(zero_ts + 17 * 60),
+            },
+        ],
+    }
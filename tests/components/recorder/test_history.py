@@ -1272,3 +1272,47 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+async def test_plan_history_queries_small_request(hass: HomeAssistant) -> None:
+    """Test a small history request is not split."""
+    start = dt_util.utcnow()
+    end = start + timedelta(hours=1)
+    plan = history.plan_history_queries(start, end, ["sensor.one"], True)
+    assert plan == [[history.HistoryQueryChunk(start, end, ["sensor.one"], True)]]
+
+
+async def test_plan_history_queries_few_entities_long_range(
+    hass: HomeAssistant,
+) -> None:
+    """Test a long history request for a few entities is not split."""
+    start = dt_util.utcnow()
+    end = start + timedelta(days=30)
+    entity_ids = ["sensor.one", "sensor.two"]
+    plan = history.plan_history_queries(start, end, entity_ids, True)
+    assert plan == [[history.HistoryQueryChunk(start, end, entity_ids, True)]]
+
+
+async def test_plan_history_queries_many_entities_long_range(
+    hass: HomeAssistant,
+) -> None:
+    """Test a large history request is split by entities and time."""
+    start = dt_util.utcnow()
+    end = start + timedelta(days=14)
+    entity_ids = [f"sensor.test_{idx}" for idx in range(120)]
+    plan = history.plan_history_queries(start, end, entity_ids, True)
+
+    assert len(plan) == 7
+    for idx, window in enumerate(plan):
+        assert [len(chunk.entity_ids) for chunk in window] == [50, 50, 20]
+        assert [
+            entity_id for chunk in window for entity_id in chunk.entity_ids
+        ] == entity_ids
+        # Only the first window includes the start time state
+        assert {chunk.include_start_time_state for chunk in window} == {idx == 0}
+
+    assert plan[0][0].start_time == start
+    assert plan[-1][0].end_time == end
+    # Windows overlap by one microsecond since start and end are exclusive
+    for previous, window in zip(plan, plan[1:], strict=False):
+        assert window[0].start_time == previous[0].end_time - timedelta(microseconds=1)
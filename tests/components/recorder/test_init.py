@@ -14,6 +14,7 @@ from unittest.mock import MagicMock, Mock, patch
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
+from sqlalchemy.orm.session import Session
 from sqlalchemy.pool import QueuePool
 
 from homeassistant.components import recorder
@@ -61,6 +62,7 @@ from homeassistant.components.recorder.table_managers import (
     state_attributes as state_attributes_table_manager,
     states_meta as states_meta_table_manager,
 )
+from homeassistant.components.recorder.table_managers.states import StatesManager
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     EVENT_COMPONENT_LOADED,
@@ -1469,6 +1471,102 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+async def test_saving_bulk_inserts_states(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test states referencing known metadata and attributes are bulk inserted."""
+    inserted_rows: list[int] = []
+    original_insert_pending_rows = StatesManager.insert_pending_rows
+
+    def _insert_pending_rows(self: StatesManager, session: Session) -> None:
+        inserted_rows.append(len(self._pending_rows))
+        original_insert_pending_rows(self, session)
+
+    hass.states.async_set("test.one", "s1", {"a": 1})
+    hass.states.async_set("test.two", "s2", {"a": 1})
+    await async_wait_recording_done(hass)
+
+    with patch.object(StatesManager, "insert_pending_rows", _insert_pending_rows):
+        hass.states.async_set("test.one", "s3", {"a": 1})
+        hass.states.async_set("test.one", "s4", {"a": 1})
+        hass.states.async_set("test.two", "s5", {"a": 2})
+        await async_wait_recording_done(hass)
+        hass.states.async_set("test.two", "s6", {"a": 2})
+        hass.states.async_remove("test.one")
+        await async_wait_recording_done(hass)
+
+    # s3, s6 and the removal of test.one
+    assert sum(inserted_rows) == 3
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 7
+        states_by_state = {state.state: state for state in states}
+
+    assert states_by_state["s3"].entity_id == "test.one"
+    assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+    assert states_by_state["s3"].attributes_id == states_by_state["s1"].attributes_id
+    # s4 was added with the ORM and linked to the bulk inserted s3
+    assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+    assert states_by_state["s4"].state_id > states_by_state["s3"].state_id
+    assert states_by_state["s5"].old_state_id == states_by_state["s2"].state_id
+    assert states_by_state["s5"].attributes_id != states_by_state["s2"].attributes_id
+    assert states_by_state["s6"].old_state_id == states_by_state["s5"].state_id
+    assert states_by_state["s6"].attributes_id == states_by_state["s5"].attributes_id
+    assert states_by_state[None].entity_id == "test.one"
+    assert states_by_state[None].old_state_id == states_by_state["s4"].state_id
+
+
+async def test_saving_bulk_inserted_states_retry(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test retrying a rolled back commit inserts the bulk inserted states once."""
+    hass.states.async_set("test.one", "s1", {"a": 1})
+    await async_wait_recording_done(hass)
+
+    session = get_instance(hass).event_session
+    original_commit = session.commit
+    failed = False
+
+    def _fail_first_commit() -> None:
+        nonlocal failed
+        if not failed:
+            failed = True
+            session.rollback()
+            raise OperationalError("commit", "fake params", "forced to fail")
+        original_commit()
+
+    with (
+        patch("time.sleep"),
+        patch.object(session, "commit", side_effect=_fail_first_commit),
+    ):
+        hass.states.async_set("test.one", "s2", {"a": 1})
+        await async_wait_recording_done(hass)
+
+    assert failed
+    hass.states.async_set("test.one", "s3", {"a": 1})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = {
+            state: (state_id, old_state_id)
+            for state, state_id, old_state_id in session.query(
+                States.state, States.state_id, States.old_state_id
+            )
+        }
+    assert list(states) == ["s1", "s2", "s3"]
+    assert states["s2"][1] == states["s1"][0]
+    assert states["s3"][1] == states["s2"][0]
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -1889,6 +1987,7 @@ async def test_database_lock_and_overflow(
         patch.object(
             recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", sys.maxsize
         ),
+        patch.object(recorder.core.Recorder, "_async_start_spilling"),
     ):
         await async_setup_recorder_instance(hass, config)
         await hass.async_block_till_done()
@@ -1978,6 +2077,7 @@ async def test_database_lock_and_overflow_checks_available_memory(
             "_available_memory",
             side_effect=_get_available_memory,
         ),
+        patch.object(recorder.core.Recorder, "_async_start_spilling"),
     ):
         instance = get_instance(hass)
 
@@ -2027,6 +2127,169 @@ async def test_database_lock_and_overflow_checks_available_memory(
     assert start_time.count(":") == 2
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_database_lock_and_overflow_spills_events(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test events are spilled to disk when the queue overflows during lock.
+
+    This test is specific for SQLite: Locking is not implemented for other engines.
+
+    Use file DB, in memory DB cannot do write locks.
+    """
+    config = {
+        recorder.CONF_COMMIT_INTERVAL: 0,
+    }
+    entity_id = "test.spill"
+    event_type = "EVENT_TEST"
+
+    def _get_db_events():
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(
+                session.query(Events).filter(
+                    Events.event_type_id.in_(select_event_type_ids((event_type,)))
+                )
+            )
+
+    def _get_db_states():
+        with session_scope(hass=hass, read_only=True) as session:
+            db_states = []
+            for db_state, db_state_attributes, states_meta in (
+                session.query(States, StateAttributes, StatesMeta)
+                .outerjoin(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == entity_id)
+                .order_by(States.state_id)
+            ):
+                db_state.entity_id = states_meta.entity_id
+                state = db_state.to_native()
+                state.attributes = db_state_attributes.to_native()
+                db_states.append((db_state.state_id, db_state.old_state_id, state))
+            return db_states
+
+    with (
+        patch.object(recorder.core, "MAX_QUEUE_BACKLOG_MIN_VALUE", 1),
+        patch.object(recorder.core, "DB_LOCK_QUEUE_CHECK_TIMEOUT", 0.01),
+        patch.object(
+            recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", sys.maxsize
+        ),
+    ):
+        await async_setup_recorder_instance(hass, config)
+        await hass.async_block_till_done()
+        instance = get_instance(hass)
+
+        assert await instance.lock_database()
+        hass.bus.async_fire(event_type, {"test_attr": 1})
+        async with asyncio.timeout(5):
+            while not instance._spilling:
+                await asyncio.sleep(0.01)
+        assert "new events will be written to" in caplog.text
+
+        hass.bus.async_fire(event_type, {"test_attr": 2})
+        hass.states.async_set(entity_id, "on", {"test_attr": 5})
+        hass.states.async_set(entity_id, "off", {"test_attr": 6})
+        hass.bus.async_fire(event_type, {"test_attr": object()})
+        await hass.async_block_till_done()
+        assert len(instance._spill_queue) == 3
+        assert "Event is not JSON serializable" in caplog.text
+        assert instance.backlog >= 4
+
+        # The queue overflowing does not release the lock
+        def _wait_database_unlocked():
+            return instance._database_lock_task.database_unlock.wait(0.2)
+
+        assert not await hass.async_add_executor_job(_wait_database_unlocked)
+        assert await instance.async_add_executor_job(_get_db_events) == []
+        assert instance.unlock_database()
+
+        await async_wait_recording_done(hass)
+        await async_wait_recording_done(hass)
+
+    assert not instance._spilling
+    assert len(instance._spill_queue) == 0
+
+    def _get_db_event_data():
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                json_loads(event_data.shared_data)
+                for event_data in session.query(EventData)
+                .join(Events, Events.data_id == EventData.data_id)
+                .filter(Events.event_type_id.in_(select_event_type_ids((event_type,))))
+                .order_by(Events.event_id)
+            ]
+
+    assert await instance.async_add_executor_job(_get_db_event_data) == [
+        {"test_attr": 1},
+        {"test_attr": 2},
+    ]
+    (
+        (first_id, _, first),
+        (_, old_state_id, second),
+    ) = await instance.async_add_executor_job(_get_db_states)
+    assert old_state_id == first_id
+    assert first.state == "on"
+    assert first.attributes == {"test_attr": 5}
+    assert second.as_dict() == _state_with_context(hass, entity_id).as_dict()
+
+    # New events are put into the in-memory queue again
+    hass.bus.async_fire(event_type, {"test_attr": 3})
+    await hass.async_block_till_done()
+    assert len(instance._spill_queue) == 0
+    await async_wait_recording_done(hass)
+    assert len(await instance.async_add_executor_job(_get_db_events)) == 3
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.parametrize("recorder_config", [{CONF_COMMIT_INTERVAL: 0}])
+async def test_failed_spill_queue_falls_back_to_memory(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test events are put into the in-memory queue once the spill queue failed.
+
+    This test is specific for SQLite: Locking is not implemented for other engines.
+    """
+    event_type = "EVENT_TEST"
+    instance = get_instance(hass)
+    assert await instance.lock_database()
+    instance._async_start_spilling()
+    assert instance._spilling
+
+    hass.bus.async_fire(event_type, {"test_attr": 1})
+    assert len(instance._spill_queue) == 1
+    instance._spill_queue.failed = True
+    hass.bus.async_fire(event_type, {"test_attr": 2})
+    assert not instance._spilling
+    assert len(instance._spill_queue) == 1
+
+    assert instance.unlock_database()
+    await async_wait_recording_done(hass)
+    assert len(instance._spill_queue) == 0
+
+    def _get_db_event_data():
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                json_loads(event_data.shared_data)
+                for event_data in session.query(EventData)
+                .join(Events, Events.data_id == EventData.data_id)
+                .filter(Events.event_type_id.in_(select_event_type_ids((event_type,))))
+                .order_by(Events.event_id)
+            ]
+
+    assert await instance.async_add_executor_job(_get_db_event_data) == [
+        {"test_attr": 1},
+        {"test_attr": 2},
+    ]
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("skip_by_db_engine")
 async def test_database_lock_timeout(
@@ -501,6 +501,7 @@ async def test_events_during_migration_queue_exhausted(
         patch.object(
             recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", sys.maxsize
         ),
+        patch.object(recorder.core.Recorder, "_async_start_spilling"),
     ):
         await async_setup_recorder_instance(
             hass, {"commit_interval": 0}, wait_recorder=False, wait_recorder_setup=False
@@ -533,6 +534,54 @@ async def test_events_during_migration_queue_exhausted(
     assert len(db_states) == 2
 
 
+async def test_events_during_migration_are_spilled(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    instrument_migration: InstrumentedMigration,
+) -> None:
+    """Test that events are spilled to disk when the queue is exhausted during migration."""
+
+    assert recorder.util.async_migration_in_progress(hass) is False
+
+    with (
+        patch(
+            "homeassistant.components.recorder.core.create_engine",
+            new=create_engine_test,
+        ),
+        patch.object(recorder.core, "MAX_QUEUE_BACKLOG_MIN_VALUE", 1),
+        patch.object(
+            recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", sys.maxsize
+        ),
+    ):
+        await async_setup_recorder_instance(
+            hass, {"commit_interval": 0}, wait_recorder=False, wait_recorder_setup=False
+        )
+        await hass.async_add_executor_job(instrument_migration.migration_started.wait)
+        assert recorder.util.async_migration_in_progress(hass) is True
+        hass.states.async_set("my.entity", "on", {})
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(hours=2))
+        await hass.async_block_till_done()
+        instance = recorder.get_instance(hass)
+        assert instance.recording is True
+        hass.states.async_set("my.entity", "off", {})
+        await hass.async_block_till_done()
+        assert len(instance._spill_queue) == 1
+
+        # Let migration finish
+        instrument_migration.migration_stall.set()
+        await instance.async_recorder_ready.wait()
+        await async_wait_recording_done(hass)
+        await async_wait_recording_done(hass)
+
+    assert recorder.util.async_migration_in_progress(hass) is False
+    assert len(instance._spill_queue) == 0
+    db_states = await instance.async_add_executor_job(
+        _get_native_states, hass, "my.entity"
+    )
+    assert [state.state for state in db_states] == ["on", "off"]
+
+
 @pytest.mark.parametrize(
     ("start_version", "live"),
     [
@@ -0,0 +1,148 @@
+"""The tests for the recorder states partitioning."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from homeassistant.components.recorder import CONF_PARTITION_STATES, Recorder, partition
+from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.db_schema import States
+from homeassistant.components.recorder.tasks import StatesPartitionTask
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_recorder_block_till_done, async_wait_recording_done
+
+
+def test_partitioned_states_table() -> None:
+    """Test the partitioned states table is range partitioned by last_updated_ts."""
+    table = partition.partitioned_states_table()
+    ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+    assert "PARTITION BY RANGE (last_updated_ts)" in ddl
+    assert "PRIMARY KEY (state_id, last_updated_ts)" in ddl
+    assert "GENERATED BY DEFAULT AS IDENTITY" in ddl
+    assert "FOREIGN KEY" not in ddl
+    assert {index.name for index in table.indexes} >= {
+        "ix_states_last_updated_ts",
+        "ix_states_metadata_id_last_updated_ts",
+    }
+
+
+def test_partition_names() -> None:
+    """Test the partitions are named after their day."""
+    day = datetime(2024, 3, 9, tzinfo=dt_util.UTC)
+    name = partition.partition_name(day)
+    assert name == "states_p20240309"
+    assert partition._partition_day(name) == day
+    assert partition._partition_day(partition.DEFAULT_PARTITION) is None
+    assert partition._create_partition_sql(day) == (
+        "CREATE TABLE IF NOT EXISTS states_p20240309 PARTITION OF states"
+        " FOR VALUES FROM (1709942400.0) TO (1710028800.0)"
+    )
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_setup_partitioned_states_not_postgresql(
+    enabled: bool, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test other databases keep a plain states table."""
+    engine = MagicMock()
+    engine.dialect.name = SupportedDialect.SQLITE
+    assert partition.setup_partitioned_states(engine, enabled) is False
+    engine.connect.assert_not_called()
+    assert (
+        "Partitioning the states table is only supported with PostgreSQL" in caplog.text
+    ) is enabled
+
+
+async def test_recorder_states_not_partitioned(recorder_mock: Recorder) -> None:
+    """Test the states table is not partitioned by default."""
+    assert recorder_mock.partition_states is False
+    assert recorder_mock.states_partitioned is False
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("recorder_config", [{CONF_PARTITION_STATES: True}])
+async def test_rotate_states_partitions(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test partitions are created and dropped and queries are pruned.
+
+    This test is specific for PostgreSQL: Partitioning is not implemented
+    for other engines.
+    """
+    assert recorder_mock.states_partitioned
+    today = dt_util.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    old_day = today - timedelta(days=5)
+
+    # Record states in the partition of a past day
+    freezer.move_to(old_day + timedelta(hours=12))
+    recorder_mock.queue_task(StatesPartitionTask(None))
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.a", "old")
+    await async_wait_recording_done(hass)
+
+    freezer.move_to(today + timedelta(hours=12))
+    recorder_mock.queue_task(StatesPartitionTask(None))
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.a", "new")
+    await async_wait_recording_done(hass)
+
+    def _list_partitions() -> dict[datetime, str]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return partition._list_partitions(session)
+
+    partitions = await recorder_mock.async_add_executor_job(_list_partitions)
+    assert set(partitions) >= {
+        old_day,
+        *(
+            today + timedelta(days=days)
+            for days in range(partition.PARTITIONS_AHEAD + 1)
+        ),
+    }
+
+    def _explain_today() -> str:
+        with session_scope(hass=hass, read_only=True) as session:
+            return "\n".join(
+                session.execute(
+                    text(
+                        "EXPLAIN SELECT state_id FROM states"
+                        " WHERE last_updated_ts >= :start AND last_updated_ts < :end"
+                    ),
+                    {
+                        "start": today.timestamp(),
+                        "end": (today + timedelta(days=1)).timestamp(),
+                    },
+                ).scalars()
+            )
+
+    # Only the partition of the queried day is scanned
+    plan = await recorder_mock.async_add_executor_job(_explain_today)
+    assert partition.partition_name(today) in plan
+    assert partition.partition_name(old_day) not in plan
+    assert partition.partition_name(today + timedelta(days=1)) not in plan
+    assert partition.DEFAULT_PARTITION not in plan
+
+    recorder_mock.queue_task(StatesPartitionTask(today - timedelta(days=3)))
+    await async_recorder_block_till_done(hass)
+
+    partitions = await recorder_mock.async_add_executor_job(_list_partitions)
+    assert old_day not in partitions
+    assert today in partitions
+
+    def _fetch_states() -> list[tuple[str, int | None]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                tuple(row)
+                for row in session.execute(select(States.state, States.old_state_id))
+            ]
+
+    # The state that followed a dropped state is disconnected from it
+    assert await recorder_mock.async_add_executor_job(_fetch_states) == [("new", None)]
@@ -12,7 +12,7 @@ from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
 
-from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder
+from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder, purge
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
     Events,
@@ -25,7 +25,13 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    DEFAULT_EVENTS_BATCHES_PER_PURGE,
+    DEFAULT_STATES_BATCHES_PER_PURGE,
+    PURGE_CYCLE_TARGET_SECONDS,
+    PurgeProgress,
+    purge_old_data,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -103,6 +109,17 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
         )
         assert not finished
 
+        with session_scope(hass=hass) as session:
+            states = session.query(States)
+            state_attributes = session.query(StateAttributes)
+            assert states.count() == 24
+            # The attributes last used before purge_before are purged
+            # once all the states before purge_before are purged
+            assert state_attributes.count() == 3
+
+        finished = purge_old_data(recorder_mock, purge_before, repack=False)
+        assert finished
+
         with session_scope(hass=hass) as session:
             states = session.query(States)
             state_attributes = session.query(StateAttributes)
@@ -145,7 +162,9 @@ async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) ->
         states = session.query(States)
         state_attributes = session.query(StateAttributes)
         assert states.count() == 2
-        assert state_attributes.count() == 1
+        # The attributes last used before purge_before are purged
+        # once all the states before purge_before are purged
+        assert state_attributes.count() == 3
 
     assert "test.recorder2" in recorder_mock.states_manager._last_committed_id
 
@@ -206,6 +225,148 @@ async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert state_attributes.count() == 3
 
 
+async def test_purge_unused_attributes_by_last_used(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test attributes are purged by their last use without scanning the states."""
+    now = dt_util.utcnow()
+    ten_days_ago = now - timedelta(days=10)
+    with freeze_time(ten_days_ago) as freezer:
+        hass.states.async_set("sensor.a", "1", {"attr": 1})
+        await async_wait_recording_done(hass)
+        freezer.move_to(ten_days_ago + timedelta(minutes=1))
+        hass.states.async_set("sensor.a", "2", {"attr": 2})
+        await async_wait_recording_done(hass)
+        freezer.move_to(now)
+        hass.states.async_set("sensor.a", "3", {"attr": 2})
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert {
+            attributes.shared_attrs: attributes.last_used_ts
+            for attributes in session.query(StateAttributes)
+        } == {
+            '{"attr":1}': ten_days_ago.timestamp(),
+            '{"attr":2}': now.timestamp(),
+        }
+
+    purge_before = now - timedelta(days=4)
+    with patch(
+        "homeassistant.components.recorder.purge._select_unused_attributes_ids",
+        wraps=purge._select_unused_attributes_ids,
+    ) as select_unused:
+        while not purge_old_data(recorder_mock, purge_before, repack=False):
+            pass
+    assert all(not call.args[2] for call in select_unused.mock_calls)
+
+    with session_scope(hass=hass) as session:
+        assert [state.state for state in session.query(States)] == ["3"]
+        assert [
+            attributes.shared_attrs for attributes in session.query(StateAttributes)
+        ] == ['{"attr":2}']
+
+
+async def test_last_used_never_moves_backwards(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test an older use does not move the last_used_ts marker backwards."""
+    now = dt_util.utcnow()
+    with freeze_time(now) as freezer:
+        hass.states.async_set("sensor.a", "1", {"attr": 1})
+        await async_wait_recording_done(hass)
+
+        # Forget the cached markers like after a restart
+        recorder_mock.state_attributes_manager._last_used.clear()
+        freezer.move_to(now - timedelta(days=10))
+        hass.states.async_set("sensor.b", "1", {"attr": 1})
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert [
+            attributes.last_used_ts for attributes in session.query(StateAttributes)
+        ] == [now.timestamp()]
+
+
+async def test_purge_task_tracks_progress(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the purge task tracks its progress."""
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    recorder_mock.queue_task(PurgeTask(purge_before, repack=False, apply_filter=False))
+    await async_recorder_block_till_done(hass)
+    await async_wait_purge_done(hass)
+
+    progress = recorder_mock.purge_progress.as_dict()
+    assert progress["purge_before"] == purge_before.isoformat()
+    assert progress["finished"] is not None
+    assert progress["progress"] == 1.0
+    assert progress["cycles"] >= 1
+    assert progress["states_purged"] == 4
+    assert progress["events_purged"] == 0
+    assert progress["high_water_mark"] is not None
+    assert progress["rows_per_second"] > 0
+
+
+async def test_purge_removes_oldest_states_first(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a partial purge leaves no state before the high-water mark."""
+    now = dt_util.utcnow()
+    # Record the newest states first so their state_ids are the lowest
+    with freeze_time(now) as freezer:
+        for days in range(10, 0, -1):
+            freezer.move_to(now - timedelta(days=days))
+            hass.states.async_set("sensor.purge", str(days))
+            await async_wait_recording_done(hass)
+
+    purge_before = now
+    progress = PurgeProgress(purge_before)
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 2),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 2),
+    ):
+        assert not await recorder_mock.async_add_executor_job(
+            purge_old_data, recorder_mock, purge_before, False, False, 1, 2, progress
+        )
+
+    assert progress.states_purged == 4
+    assert progress.oldest_ts == (now - timedelta(days=10)).timestamp()
+    assert progress.high_water_mark_ts == (now - timedelta(days=7)).timestamp()
+    with session_scope(hass=hass) as session:
+        assert sorted(int(state.state) for state in session.query(States)) == [
+            1,
+            2,
+            3,
+            4,
+            5,
+            6,
+        ]
+
+
+def test_purge_progress_adapts_batch_size() -> None:
+    """Test the batches of a purge cycle adapt to the duration of the last one."""
+    progress = PurgeProgress(dt_util.utcnow())
+
+    progress.cycle_done(PURGE_CYCLE_TARGET_SECONDS * 4, False)
+    assert progress.states_batch_size == DEFAULT_STATES_BATCHES_PER_PURGE // 2
+    assert progress.events_batch_size == round(DEFAULT_EVENTS_BATCHES_PER_PURGE / 2)
+
+    progress.cycle_done(PURGE_CYCLE_TARGET_SECONDS / 4, False)
+    assert progress.states_batch_size == DEFAULT_STATES_BATCHES_PER_PURGE
+
+    for _ in range(10):
+        progress.cycle_done(PURGE_CYCLE_TARGET_SECONDS * 10, False)
+    assert progress.states_batch_size == 1
+    assert progress.events_batch_size == 1
+    assert progress.as_dict()["progress"] is None
+
+    progress.cycle_done(0.1, True)
+    assert progress.cycles == 13
+    assert progress.as_dict()["progress"] == 1.0
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("recorder_mock", "skip_by_db_engine")
 async def test_purge_old_states_encouters_database_corruption(
@@ -0,0 +1,190 @@
+"""The tests for the recorder spill queue."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from homeassistant.components.recorder import spill_queue
+from homeassistant.components.recorder.spill_queue import (
+    SpillQueue,
+    decode_event,
+    encode_event,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.util import dt as dt_util
+
+
+def _state_changed_event(old_state: State | None, new_state: State | None) -> Event:
+    """Return a state_changed event."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": "sensor.power",
+            "old_state": old_state,
+            "new_state": new_state,
+        },
+        context=new_state.context if new_state else None,
+    )
+
+
+def test_encode_decode_state_changed_event() -> None:
+    """Test state_changed events survive the round trip."""
+    now = dt_util.utcnow()
+    old_state = State(
+        "sensor.power",
+        "10",
+        {"unit_of_measurement": "W"},
+        last_changed=now,
+        last_reported=now + dt_util.dt.timedelta(seconds=5),
+        last_updated=now,
+        context=Context(user_id="abc"),
+    )
+    new_state = State(
+        "sensor.power",
+        "20",
+        {"unit_of_measurement": "W", "large": [1, 2, 3]},
+        context=Context(parent_id="def"),
+        state_info={"unrecorded_attributes": frozenset({"large"})},
+    )
+    event = _state_changed_event(old_state, new_state)
+
+    frame = encode_event(event)
+    decoded = decode_event(frame[4:])
+
+    assert decoded.event_type == EVENT_STATE_CHANGED
+    assert decoded.time_fired_timestamp == event.time_fired_timestamp
+    assert decoded.origin is EventOrigin.local
+    assert decoded.context.as_dict() == event.context.as_dict()
+    assert decoded.data["entity_id"] == "sensor.power"
+    for decoded_state, state in (
+        (decoded.data["old_state"], old_state),
+        (decoded.data["new_state"], new_state),
+    ):
+        assert decoded_state.as_dict() == state.as_dict()
+        assert decoded_state.last_reported_timestamp == state.last_reported_timestamp
+    assert decoded.data["old_state"].state_info is None
+    assert decoded.data["new_state"].state_info == {
+        "unrecorded_attributes": frozenset({"large"})
+    }
+
+    removed = decode_event(encode_event(_state_changed_event(new_state, None))[4:])
+    assert removed.data["new_state"] is None
+
+
+def test_encode_decode_event() -> None:
+    """Test events survive the round trip."""
+    event = Event(
+        "test_event",
+        {"value": 1, "nested": {"when": dt_util.utc_from_timestamp(0)}},
+        EventOrigin.remote,
+    )
+
+    decoded = decode_event(encode_event(event)[4:])
+
+    assert decoded.event_type == "test_event"
+    assert decoded.data == {"value": 1, "nested": {"when": "1970-01-01T00:00:00+00:00"}}
+    assert decoded.origin is EventOrigin.remote
+    assert decoded.time_fired_timestamp == event.time_fired_timestamp
+    assert decoded.context.as_dict() == event.context.as_dict()
+
+
+def test_encode_unserializable_event() -> None:
+    """Test events that cannot be serialized raise TypeError."""
+    with pytest.raises(TypeError):
+        encode_event(Event("test_event", {"value": object()}))
+
+
+def test_spill_queue(tmp_path: Path) -> None:
+    """Test events are read back in order and the file is truncated."""
+    path = tmp_path / "spill"
+    queue = SpillQueue(str(path))
+    assert queue.get_batch(10) == []
+    assert not path.exists()
+
+    for idx in range(5):
+        assert queue.put(Event("test_event", {"idx": idx})) is False
+    assert len(queue) == 5
+    queue.flush()
+    assert path.stat().st_size > 0
+    queue.put(Event("test_event", {"idx": 5}))
+    assert len(queue) == 6
+
+    assert [event.data["idx"] for event in queue.get_batch(4)] == [0, 1, 2, 3]
+    assert len(queue) == 2
+    queue.put(Event("test_event", {"idx": 6}))
+    assert [event.data["idx"] for event in queue.get_batch(4)] == [4, 5, 6]
+    assert len(queue) == 0
+    assert path.stat().st_size == 0
+
+    queue.put(Event("test_event", {"idx": 7}))
+    assert [event.data["idx"] for event in queue.get_batch(4)] == [7]
+
+    queue.close()
+    assert not path.exists()
+
+
+def test_spill_queue_flush_size(tmp_path: Path) -> None:
+    """Test put returns True once the buffer should be flushed."""
+    queue = SpillQueue(str(tmp_path / "spill"))
+    with patch.object(spill_queue, "SPILL_QUEUE_FLUSH_SIZE", 300):
+        assert queue.put(Event("test_event", {"value": "x" * 10})) is False
+        assert queue.put(Event("test_event", {"value": "x" * 200})) is True
+    queue.close()
+
+
+def test_spill_queue_write_error(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test events that cannot be written are read from memory."""
+    queue = SpillQueue(str(tmp_path / "missing" / "spill"))
+    queue.put(Event("test_event", {"idx": 0}))
+    queue.flush()
+
+    assert queue.failed
+    assert len(queue) == 1
+    assert (
+        "Error writing to the recorder spill queue, 1 events will be read from memory"
+        in caplog.text
+    )
+    queue.put(Event("test_event", {"idx": 1}))
+    assert [event.data["idx"] for event in queue.get_batch(10)] == [0, 1]
+    assert len(queue) == 0
+
+
+def test_spill_queue_partial_write_error(tmp_path: Path) -> None:
+    """Test a partially written buffer is truncated and no events are lost."""
+    path = tmp_path / "spill"
+    queue = SpillQueue(str(path))
+    for idx in range(3):
+        queue.put(Event("test_event", {"idx": idx}))
+    queue.flush()
+    written_size = path.stat().st_size
+    for idx in range(3, 6):
+        queue.put(Event("test_event", {"idx": idx}))
+
+    file = queue._file
+    assert file is not None
+
+    def _write_half(data: bytes) -> None:
+        file.write(data[: len(data) // 2])
+        file.flush()
+        raise OSError("No space left on device")
+
+    with patch.object(queue, "_file", Mock(wraps=file, write=_write_half)):
+        queue.flush()
+
+    assert queue.failed
+    assert path.stat().st_size == written_size
+    assert len(queue) == 6
+    # Nothing is written to the file once the queue has failed
+    queue.put(Event("test_event", {"idx": 6}))
+    queue.flush()
+    assert path.stat().st_size == written_size
+
+    assert [event.data["idx"] for event in queue.get_batch(2)] == [0, 1]
+    assert [event.data["idx"] for event in queue.get_batch(3)] == [2, 3, 4]
+    assert [event.data["idx"] for event in queue.get_batch(10)] == [5, 6]
+    assert len(queue) == 0
+    queue.close()
@@ -1293,6 +1293,116 @@ async def test_daily_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+async def test_statistics_during_period_cache(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test reduced statistics are cached until statistics are written."""
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2022-10-04 00:00:00"))
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        (
+            {"start": period1, "state": 0, "sum": 2},
+            {"start": period2, "state": 1, "sum": 3},
+        ),
+    )
+    await async_wait_recording_done(hass)
+
+    def _sums() -> list[float | None]:
+        stats = statistics_during_period(
+            hass, period1, period="day", statistic_ids={"test:total_energy_import"}
+        )
+        rows = stats["test:total_energy_import"]
+        sums = [row["sum"] for row in rows]
+        # Callers may modify the rows of the result
+        for row in rows:
+            row["sum"] = None
+        return sums
+
+    with patch.object(
+        statistics,
+        "_sorted_statistics_to_dict",
+        wraps=statistics._sorted_statistics_to_dict,
+    ) as sorted_statistics_to_dict:
+        assert _sums() == [2.0, 3.0]
+        assert _sums() == [2.0, 3.0]
+        assert sorted_statistics_to_dict.call_count == 1
+
+        # Adjusting the second day invalidates the cached result
+        recorder_mock.async_adjust_statistics(
+            "test:total_energy_import", period2, 10, "kWh"
+        )
+        await async_wait_recording_done(hass)
+        assert _sums() == [2.0, 13.0]
+        assert sorted_statistics_to_dict.call_count == 2
+
+        # Importing statistics invalidates the cached result
+        async_add_external_statistics(
+            hass, external_metadata, ({"start": period1, "state": 0, "sum": 5},)
+        )
+        await async_wait_recording_done(hass)
+        assert _sums() == [5.0, 13.0]
+        assert sorted_statistics_to_dict.call_count == 3
+
+        # Results that end before the adjusted statistics are kept
+        statistics_during_period(
+            hass,
+            period1,
+            period1 + timedelta(hours=1),
+            period="day",
+            statistic_ids={"test:total_energy_import"},
+        )
+        recorder_mock.async_adjust_statistics(
+            "test:total_energy_import", period2, 10, "kWh"
+        )
+        await async_wait_recording_done(hass)
+        statistics_during_period(
+            hass,
+            period1,
+            period1 + timedelta(hours=1),
+            period="day",
+            statistic_ids={"test:total_energy_import"},
+        )
+        assert sorted_statistics_to_dict.call_count == 4
+
+
+def test_statistics_during_period_cache_is_bounded() -> None:
+    """Test the least recently used results are evicted."""
+    cache = statistics.StatisticsDuringPeriodCache()
+
+    def _key(start_ts: float) -> statistics.StatisticsDuringPeriodKey:
+        return statistics.StatisticsDuringPeriodKey(
+            frozenset({"sensor.test"}), "day", None, frozenset(), start_ts, None, ()
+        )
+
+    half = statistics.MAX_CACHED_STATISTICS_ROWS // 2
+    result = {"sensor.test": [{"start": 0.0}] * half}
+    cache.set(_key(1), cache.generation, result)
+    cache.set(_key(2), cache.generation, result)
+    assert cache.get(_key(1)) is not None
+    cache.set(_key(3), cache.generation, result)
+    assert cache.get(_key(1)) is not None
+    assert cache.get(_key(2)) is None
+    assert cache.get(_key(3)) is not None
+
+    # A result queried before an invalidation is not cached
+    generation = cache.generation
+    cache.invalidate({"sensor.other"})
+    cache.set(_key(4), generation, result)
+    assert cache.get(_key(4)) is None
+    assert cache.get(_key(3)) is not None
+
+
 @pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
 @pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
 async def test_weekly_statistics_mean(
@@ -2481,6 +2481,29 @@ async def test_recorder_info(
     }
 
 
+async def test_recorder_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the progress of the purge."""
+    client = await hass_ws_client()
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    await hass.services.async_call(
+        recorder.DOMAIN, "purge", {"keep_days": 0}, blocking=True
+    )
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["finished"] is not None
+    assert response["result"]["progress"] == 1.0
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2554,6 +2577,7 @@ async def test_recorder_info_migration_queue_exhausted(
         patch.object(
             recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", sys.maxsize
         ),
+        patch.object(recorder.core.Recorder, "_async_start_spilling"),
     ):
         async with async_test_recorder(
             hass, wait_recorder=False, wait_recorder_setup=False
@@ -413,10 +413,10 @@ async def test_restore_sensor_save_state(
     # Trigger saving state
     await async_mock_restore_state_shutdown_restart(hass)
 
-    assert len(hass_storage[RESTORE_STATE_KEY]["data"]) == 1
-    state = hass_storage[RESTORE_STATE_KEY]["data"][0]["state"]
+    assert len(hass_storage[f"{RESTORE_STATE_KEY}.sensor"]["data"]) == 1
+    state = hass_storage[f"{RESTORE_STATE_KEY}.sensor"]["data"][0]["state"]
     assert state["entity_id"] == entity0.entity_id
-    extra_data = hass_storage[RESTORE_STATE_KEY]["data"][0]["extra_data"]
+    extra_data = hass_storage[f"{RESTORE_STATE_KEY}.sensor"]["data"][0]["extra_data"]
     assert extra_data == expected_extra_data
     assert type(extra_data["native_value"]) is native_value_type
 
@@ -858,10 +858,10 @@ async def test_restore_weather_save_state(
     # Trigger saving state
     await async_mock_restore_state_shutdown_restart(hass)
 
-    assert len(hass_storage[RESTORE_STATE_KEY]["data"]) == 1
-    state = hass_storage[RESTORE_STATE_KEY]["data"][0]["state"]
+    assert len(hass_storage[f"{RESTORE_STATE_KEY}.weather"]["data"]) == 1
+    state = hass_storage[f"{RESTORE_STATE_KEY}.weather"]["data"][0]["state"]
     assert state["entity_id"] == entity.entity_id
-    extra_data = hass_storage[RESTORE_STATE_KEY]["data"][0]["extra_data"]
+    extra_data = hass_storage[f"{RESTORE_STATE_KEY}.weather"]["data"][0]["extra_data"]
     assert extra_data == snapshot
 
 
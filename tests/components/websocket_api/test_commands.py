@@ -1310,6 +1310,62 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_share_state_changed_listener(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe_entities subscriptions share one state_changed listener."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("switch.pump", "off")
+    init_count = sum(hass.bus.async_listeners().values())
+
+    for msg_id, extra in (
+        (7, {}),
+        (8, {"entity_ids": ["light.kitchen"]}),
+        (9, {"include": {"domains": ["switch"]}}),
+        (10, {"entity_ids": ["light.kitchen"], "exclude": {"domains": ["light"]}}),
+    ):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "subscribe_entities", **extra}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["type"] == "event"
+
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.states.async_set("light.kitchen", "on")
+    received = {}
+    for _ in range(2):
+        msg = await websocket_client.receive_json()
+        received[msg["id"]] = msg["event"]
+    assert received == {
+        7: {"c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}},
+        8: {"c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}},
+    }
+
+    hass.states.async_set("switch.pump", "on")
+    received = {}
+    for _ in range(2):
+        msg = await websocket_client.receive_json()
+        received[msg["id"]] = msg["event"]
+    assert received == {
+        7: {"c": {"switch.pump": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}},
+        9: {"c": {"switch.pump": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}},
+    }
+
+    for msg_id in (7, 8, 9, 10):
+        await websocket_client.send_json(
+            {"id": msg_id + 10, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2727,6 +2783,78 @@ async def test_message_coalescing(
     await hass.async_block_till_done()
 
 
+async def test_message_coalescing_frame_budget(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test coalesced frames are split when they exceed the byte budget."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = json_loads(await websocket_client.receive_str())
+    assert msg["success"]
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msgs = json_loads(await websocket_client.receive_str())
+    assert [msg["id"] for msg in msgs] == [7, 7]
+
+    with patch(
+        "homeassistant.components.websocket_api.http.MAX_COALESCED_FRAME_BYTES", 300
+    ):
+        for color in ("yellow", "green", "blue"):
+            hass.states.async_set("light.permitted", "on", {"color": color})
+
+        msgs = json_loads(await websocket_client.receive_str())
+        assert [msg["event"] for msg in msgs] == [
+            {
+                "a": {
+                    "light.permitted": {
+                        "a": {"color": "yellow"},
+                        "c": ANY,
+                        "lc": ANY,
+                        "s": "on",
+                    }
+                }
+            },
+            {
+                "c": {
+                    "light.permitted": {
+                        "+": {"a": {"color": "green"}, "c": ANY, "lu": ANY}
+                    }
+                }
+            },
+        ]
+        msgs = json_loads(await websocket_client.receive_str())
+        assert [msg["event"] for msg in msgs] == [
+            {
+                "c": {
+                    "light.permitted": {
+                        "+": {"a": {"color": "blue"}, "c": ANY, "lu": ANY}
+                    }
+                }
+            },
+        ]
+
+    await websocket_client.send_json({"id": 8, "type": "connection_stats"})
+    msg = json_loads(await websocket_client.receive_str())
+    assert msg["id"] == 8
+    assert msg["success"]
+    assert msg["result"] == {
+        "messages_sent": 6,
+        "frames_sent": 4,
+        "bytes_sent": ANY,
+        "queue_size": 0,
+        "max_queue_size": 3,
+        "total_queue_latency": ANY,
+        "max_queue_latency": ANY,
+    }
+
+
 async def test_message_coalescing_not_supported_by_websocket_client(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -345,6 +345,45 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_queue_latency_of_each_frame(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test the queue latency of a frame is measured from its oldest message."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    stats = instance._stats
+    stats.total_queue_latency = stats.max_queue_latency = 0.0
+
+    for msg_id in range(3):
+        instance._send_message({"id": msg_id})
+    # Pretend the messages have been waiting for a while
+    now = hass.loop.time()
+    instance._message_times.clear()
+    instance._message_times.extend((now - 30, now - 20, now - 10))
+
+    for msg_id in range(3):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+
+    assert stats.max_queue_latency >= 30
+    assert stats.total_queue_latency >= 60
+    assert not instance._message_times
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
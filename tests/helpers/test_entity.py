@@ -21,6 +21,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
@@ -44,6 +45,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
     mock_integration,
     mock_registry,
 )
@@ -1719,6 +1721,83 @@ async def test_invalid_state(
     assert hass.states.get("test.test").state == "x" * 255
 
 
+async def test_async_write_ha_states(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test writing the state of multiple entities in one batch."""
+    hooked_writes: list[str] = []
+
+    class HookedEntity(entity.Entity):
+        """Entity which hooks into writing the state."""
+
+        @callback
+        def _async_write_ha_state(self) -> None:
+            super()._async_write_ha_state()
+            hooked_writes.append(self.entity_id)
+
+    entities = [entity.Entity() for _ in range(3)]
+    entities.append(HookedEntity())
+    for idx, ent in enumerate(entities):
+        ent.entity_id = f"test.test_{idx}"
+        ent.hass = hass
+        ent._attr_state = "on"
+    entities[1]._attr_state = "x" * 256
+
+    state_changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    entity.async_write_ha_states(hass, entities)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("test.test_0").state == "on"
+    assert hass.states.get("test.test_1").state == STATE_UNKNOWN
+    assert hass.states.get("test.test_2").state == "on"
+    assert hass.states.get("test.test_3").state == "on"
+    assert (
+        "homeassistant.helpers.entity",
+        logging.ERROR,
+        f"Failed to set state for test.test_1, fall back to {STATE_UNKNOWN}",
+    ) in caplog.record_tuples
+    assert hooked_writes == ["test.test_3"]
+    assert [event.data["entity_id"] for event in state_changed_events] == [
+        "test.test_0",
+        "test.test_1",
+        "test.test_2",
+        "test.test_3",
+    ]
+    assert (
+        state_changed_events[0].time_fired
+        == state_changed_events[1].time_fired
+        == state_changed_events[2].time_fired
+    )
+
+
+async def test_async_write_ha_states_entity_fails(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an entity failing to write its state doesn't stop the batch."""
+
+    class BrokenEntity(entity.Entity):
+        """Entity which fails to calculate its state."""
+
+        @property
+        def state(self) -> str:
+            raise ValueError("Broken state")
+
+    entities = [entity.Entity(), BrokenEntity(), entity.Entity()]
+    for idx, ent in enumerate(entities):
+        ent.entity_id = f"test.test_{idx}"
+        ent.hass = hass
+        ent._attr_state = "on"
+
+    entity.async_write_ha_states(hass, entities)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("test.test_0").state == "on"
+    assert hass.states.get("test.test_1") is None
+    assert hass.states.get("test.test_2").state == "on"
+    assert "Failed to write state for test.test_1" in caplog.text
+
+
 async def test_suggest_report_issue_built_in(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
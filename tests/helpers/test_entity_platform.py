@@ -11,9 +11,16 @@ import pytest
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE, EntityCategory
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+    PERCENTAGE,
+    EntityCategory,
+)
 from homeassistant.core import (
     CoreState,
+    Event,
+    EventStateChangedData,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
@@ -36,6 +43,7 @@ from homeassistant.helpers.entity_component import (
     EntityComponent,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import TimerWheel
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 import homeassistant.util.dt as dt_util
 
@@ -243,6 +251,34 @@ async def test_set_scan_interval_via_platform(hass: HomeAssistant) -> None:
     assert mock_track.call_args[0][0] == 30.0
 
 
+async def test_coarse_polling_via_platform(hass: HomeAssistant) -> None:
+    """Test platforms can opt in to poll through the timer wheel."""
+
+    def platform_setup(
+        hass: HomeAssistant,
+        config: ConfigType,
+        add_entities: entity_platform.AddEntitiesCallback,
+        discovery_info: DiscoveryInfoType | None = None,
+    ) -> None:
+        """Test the platform setup."""
+        add_entities([MockEntity(should_poll=True)])
+
+    platform = MockPlatform(setup_platform=platform_setup)
+    platform.SCAN_INTERVAL = timedelta(seconds=30)
+    platform.COARSE_POLLING = True
+
+    mock_platform(hass, "platform.test_domain", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+
+    with patch.object(TimerWheel, "async_call_later") as mock_track:
+        await component.async_setup({DOMAIN: {"platform": "platform"}})
+
+        await hass.async_block_till_done()
+    assert mock_track.called
+    assert mock_track.call_args[0][0] == 30.0
+
+
 async def test_adding_entities_with_generator_and_thread_callback(
     hass: HomeAssistant,
 ) -> None:
@@ -511,6 +547,187 @@ async def test_parallel_updates_async_platform_updates_in_parallel(
     assert peak_update_count > 1
 
 
+async def test_parallel_updates_async_platform_batch_updates_in_parallel(
+    hass: HomeAssistant,
+) -> None:
+    """Test entities written in a batch are updated in parallel."""
+    platform = MockPlatform()
+
+    mock_platform(hass, "async_platform.test_domain", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "async_platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    updating = []
+    peak_update_count = 0
+
+    class AsyncEntity(MockEntity):
+        """Mock entity that has async_update."""
+
+        async def async_update(self):
+            nonlocal peak_update_count
+            updating.append(self.entity_id)
+            await asyncio.sleep(0)
+            peak_update_count = max(len(updating), peak_update_count)
+            await asyncio.sleep(0)
+            updating.remove(self.entity_id)
+
+    entity1 = AsyncEntity()
+    entity2 = AsyncEntity()
+    entity3 = AsyncEntity()
+
+    await handle.async_add_entities([entity1, entity2, entity3])
+
+    assert entity1.parallel_updates is None
+    assert entity2.parallel_updates is None
+    assert entity3.parallel_updates is None
+
+    assert handle._update_in_sequence is False
+
+    await handle._async_update_entity_states()
+    assert peak_update_count > 1
+
+
+async def test_parallel_updates_async_platform_writes_states_in_batch(
+    hass: HomeAssistant,
+) -> None:
+    """Test an async platform writes the polled states in one batch."""
+    platform = MockPlatform()
+
+    mock_platform(hass, "async_platform.test_domain", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "async_platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+
+    class AsyncEntity(MockEntity):
+        """Mock entity that has async_update."""
+
+        async def async_update(self):
+            if self.name == "fails":
+                raise HomeAssistantError("Update failed")
+            self._attr_state = "updated"
+
+    entity1 = AsyncEntity(name="one", unique_id="one")
+    entity2 = AsyncEntity(name="two", unique_id="two")
+    entity3 = AsyncEntity(name="fails", unique_id="fails")
+
+    await handle.async_add_entities([entity1, entity2, entity3])
+
+    state_changes: list[Event[EventStateChangedData]] = []
+
+    @callback
+    def _state_changed(event: Event[EventStateChangedData]) -> None:
+        state_changes.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+
+    await handle._async_update_entity_states()
+
+    assert [event.data["entity_id"] for event in state_changes] == [
+        entity1.entity_id,
+        entity2.entity_id,
+    ]
+    # Both states are written in the same batch, each with its own context
+    assert state_changes[0].time_fired == state_changes[1].time_fired
+    assert state_changes[0].context is not state_changes[1].context
+    assert hass.states.get(entity1.entity_id).state == "updated"
+    assert hass.states.get(entity2.entity_id).state == "updated"
+    assert hass.states.get(entity3.entity_id).state != "updated"
+
+
+async def test_parallel_updates_slow_update_written_separately(
+    hass: HomeAssistant,
+) -> None:
+    """Test a slow update doesn't delay writing the states of the others."""
+    platform = MockPlatform()
+
+    mock_platform(hass, "async_platform.test_domain", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "async_platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    slow_update_done = asyncio.Event()
+
+    class AsyncEntity(MockEntity):
+        """Mock entity that has async_update."""
+
+        async def async_update(self):
+            if self.name == "slow":
+                await slow_update_done.wait()
+            self._attr_state = "updated"
+
+    fast_entity = AsyncEntity(name="fast", unique_id="fast")
+    slow_entity = AsyncEntity(name="slow", unique_id="slow")
+
+    await handle.async_add_entities([fast_entity, slow_entity])
+
+    with patch.object(entity_platform, "BATCH_UPDATE_MAX_WAIT", 0):
+        update_task = hass.async_create_task(handle._async_update_entity_states())
+        # Let the wait for the batch time out
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert hass.states.get(fast_entity.entity_id).state == "updated"
+        assert hass.states.get(slow_entity.entity_id).state != "updated"
+
+        slow_update_done.set()
+        await update_task
+    assert hass.states.get(slow_entity.entity_id).state == "updated"
+
+
+async def test_parallel_updates_failing_update_ha_state_override(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an override of async_update_ha_state failing doesn't block the others."""
+    platform = MockPlatform()
+
+    mock_platform(hass, "async_platform.test_domain", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "async_platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+
+    class AsyncEntity(MockEntity):
+        """Mock entity that has async_update."""
+
+        async def async_update(self):
+            self._attr_state = "updated"
+
+    class FailingEntity(MockEntity):
+        """Mock entity that fails to update its state."""
+
+        async def async_update_ha_state(self, *args: Any, **kwargs: Any) -> None:
+            raise HomeAssistantError("Update failed")
+
+    entity1 = AsyncEntity(name="one", unique_id="one")
+    failing_entity = FailingEntity(name="fails", unique_id="fails")
+    entity2 = AsyncEntity(name="two", unique_id="two")
+
+    await handle.async_add_entities([entity1, failing_entity, entity2])
+
+    await handle._async_update_entity_states()
+
+    assert f"Update for {failing_entity.entity_id} fails" in caplog.text
+    assert hass.states.get(entity1.entity_id).state == "updated"
+    assert hass.states.get(entity2.entity_id).state == "updated"
+
+
 async def test_parallel_updates_sync_platform_updates_in_sequence(
     hass: HomeAssistant,
 ) -> None:
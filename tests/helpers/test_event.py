@@ -13,7 +13,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import (
     Event,
@@ -30,6 +30,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_timer_wheel,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -3612,6 +3613,134 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
     await hass.async_block_till_done()
 
 
+async def test_track_time_interval_coarse(hass: HomeAssistant) -> None:
+    """Test coarse time intervals share the timers of the timer wheel."""
+    specific_runs = []
+    wheel = async_get_timer_wheel(hass)
+    scheduled = getattr(hass.loop, "_scheduled")
+    timers_before = len(scheduled)
+
+    utc_now = dt_util.utcnow()
+    unsubs = [
+        async_track_time_interval(
+            hass,
+            # pylint: disable-next=unnecessary-lambda
+            callback(lambda x: specific_runs.append(x)),
+            timedelta(seconds=10),
+            coarse=True,
+        )
+        for _ in range(100)
+    ]
+    assert wheel.timer_count <= 2
+    assert len(scheduled) - timers_before == wheel.timer_count
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 0
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 100
+
+    for unsub in unsubs:
+        unsub()
+    assert wheel.timer_count == 0
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=30))
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 100
+
+
+async def test_timer_wheel(hass: HomeAssistant) -> None:
+    """Test actions in the same tick share a loop timer."""
+    calls = []
+    wheel = async_get_timer_wheel(hass)
+    when = round(hass.loop.time()) + 5
+
+    def _fail() -> None:
+        raise ValueError("boom")
+
+    handles = [
+        wheel.async_call_at(when, calls.append, 1),
+        wheel.async_call_at(when + 0.2, _fail),
+        wheel.async_call_at(when + 0.4, calls.append, 2),
+        wheel.async_call_at(when + 0.6, calls.append, 3),
+    ]
+    assert wheel.timer_count == 2
+    assert handles[0].when() == handles[2].when() == when
+
+    handles[3].cancel()
+    assert handles[3].cancelled()
+    assert wheel.timer_count == 1
+
+    with patch.object(hass.loop, "call_exception_handler") as mock_handler:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=6))
+        await hass.async_block_till_done()
+    # An action raising does not prevent the others from running
+    assert calls == [1, 2]
+    assert isinstance(mock_handler.call_args[0][0]["exception"], ValueError)
+    assert wheel.timer_count == 0
+    handles[0].cancel()
+
+
+async def test_timer_wheel_schedules_in_next_tick(hass: HomeAssistant) -> None:
+    """Test actions are never added to the running or a past tick."""
+    calls = []
+    wheel = async_get_timer_wheel(hass)
+    now = hass.loop.time()
+    current_tick = int(now / wheel.resolution)
+
+    in_past = wheel.async_call_at(now - 10, calls.append, 1)
+    soon = wheel.async_call_later(0, calls.append, 2)
+    assert in_past.when() == soon.when() == (current_tick + 1) * wheel.resolution
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert calls == [1, 2]
+    assert wheel.timer_count == 0
+
+
+async def test_timer_wheel_remove_unknown_handle(hass: HomeAssistant) -> None:
+    """Test removing a handle that is not in its tick anymore does not fail."""
+    wheel = async_get_timer_wheel(hass)
+    first = wheel.async_call_later(5, lambda: None)
+    second = wheel.async_call_later(5, lambda: None)
+
+    wheel._async_remove(first)
+    wheel._async_remove(first)
+    assert wheel.timer_count == 1
+    second.cancel()
+    assert wheel.timer_count == 0
+
+
+async def test_timer_wheel_cancel_on_shutdown(hass: HomeAssistant) -> None:
+    """Test coarse intervals marked to be cancelled on shutdown are cancelled."""
+    specific_runs = []
+    wheel = async_get_timer_wheel(hass)
+
+    async_track_time_interval(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: specific_runs.append(x)),
+        timedelta(seconds=10),
+        cancel_on_shutdown=True,
+        coarse=True,
+    )
+    unsub = async_track_time_interval(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: specific_runs.append(x)),
+        timedelta(seconds=20),
+        coarse=True,
+    )
+    assert wheel.timer_count == 2
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert wheel.timer_count == 1
+    unsub()
+
+
 async def test_track_sunrise(hass: HomeAssistant) -> None:
     """Test track the sunrise."""
     latitude = 32.87336
@@ -4468,6 +4597,27 @@ async def test_async_call_later_cancel(hass: HomeAssistant) -> None:
             assert await future, "callback not canceled"
 
 
+async def test_async_call_later_coarse(hass: HomeAssistant) -> None:
+    """Test calling an action later on the timer wheel."""
+    calls = []
+    wheel = async_get_timer_wheel(hass)
+
+    @callback
+    def action(__utcnow: datetime):
+        calls.append(__utcnow)
+
+    remove = async_call_later(hass, 5, action, coarse=True)
+    remove_cancelled = async_call_later(hass, 5, action, coarse=True)
+    assert wheel.timer_count == 1
+    remove_cancelled()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert wheel.timer_count == 0
+    remove()
+
+
 async def test_track_state_change_event_chain_multple_entity(
     hass: HomeAssistant,
 ) -> None:
@@ -69,3 +69,33 @@ async def test_async_schedule_save(
     async_fire_time_changed(hass)
     await hass.async_block_till_done()
     assert registry.save_calls == 2
+
+
+async def test_default_records_to_save(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the records of a journaled registry default to its saved data."""
+
+    class JournaledRegistry(SampleRegistry):
+        """Registry with a journaled store."""
+
+        def __init__(self, hass: HomeAssistant) -> None:
+            """Initialize the registry."""
+            super().__init__(hass)
+            self._store = storage.Store(hass, 1, "test", journal=True)
+
+        def _data_to_save(self) -> dict[str, Any]:
+            """Return data of registry to save."""
+            super()._data_to_save()
+            return {"items": [{"id": "a", "name": "A"}, {"id": "b", "name": "B"}]}
+
+    registry = JournaledRegistry(hass)
+    assert registry._records_to_save() == {
+        "items": {"a": {"id": "a", "name": "A"}, "b": {"id": "b", "name": "B"}}
+    }
+
+    registry.async_schedule_save()
+    await hass.async_stop(force=True)
+    assert hass_storage["test"]["data"] == {
+        "items": [{"id": "a", "name": "A"}, {"id": "b", "name": "B"}]
+    }
@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -17,6 +18,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    SHARD_REFRESH_INTERVAL,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -131,6 +133,9 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    # Only changed states are written
+    data.async_restore_entity_added(entity)
+    hass.states.async_set("input_boolean.b1", "on")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -139,6 +144,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -180,6 +186,10 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     # Startup Save
     assert mock_write_data.called
 
+    # Only changed states are written
+    data.async_restore_entity_added(entity)
+    hass.states.async_set("input_boolean.b1", "on")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -197,6 +207,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -205,6 +216,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     # Verify still saving
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "on")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -358,6 +370,66 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_shards(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test shards are loaded when needed and only written when changed."""
+    now = dt_util.utcnow()
+    data = async_get(hass)
+    data.last_states = {
+        "input_boolean.b0": StoredState(State("input_boolean.b0", "on"), None, now),
+        "light.l0": StoredState(State("light.l0", "on"), None, now),
+    }
+    await data.async_dump_states()
+    assert hass_storage[STORAGE_KEY]["data"] == {"domains": ["input_boolean", "light"]}
+    assert len(hass_storage[f"{STORAGE_KEY}.input_boolean"]["data"]) == 1
+    assert len(hass_storage[f"{STORAGE_KEY}.light"]["data"]) == 1
+
+    # Emulate a fresh load, only the index is loaded
+    data = RestoreStateData(hass)
+    async_get.cache_clear()
+    hass.data[DATA_RESTORE_STATE] = data
+    await data.async_load()
+    assert data.last_states == {}
+
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "light.l0"
+    state = await entity.async_get_last_state()
+    assert state is not None
+    assert state.state == "on"
+    assert list(data.last_states) == ["light.l0"]
+
+    # The remaining shards are loaded before dumping
+    await data.async_dump_states()
+    assert list(data.last_states) == ["light.l0", "input_boolean.b0"]
+
+    data.last_states["light.l0"] = StoredState(State("light.l0", "off"), None, now)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+    assert len(mock_write_data.mock_calls) == 1
+    written_states = json_round_trip(mock_write_data.mock_calls[0][1][0])
+    assert written_states[0]["state"]["entity_id"] == "light.l0"
+
+    # Unchanged shards are refreshed once a day
+    freezer.tick(SHARD_REFRESH_INTERVAL)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+    assert len(mock_write_data.mock_calls) == 2
+
+    # Empty shards are removed
+    del data.last_states["input_boolean.b0"]
+    await data.async_dump_states()
+    assert hass_storage[STORAGE_KEY]["data"] == {"domains": ["light"]}
+    assert f"{STORAGE_KEY}.input_boolean" not in hass_storage
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -531,7 +603,7 @@ async def test_restore_entity_end_to_end(
     await data.async_dump_states()
     await hass.async_block_till_done()
 
-    storage_data = hass_storage[STORAGE_KEY]["data"]
+    storage_data = hass_storage[f"{STORAGE_KEY}.{DOMAIN}"]["data"]
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
@@ -546,7 +618,7 @@ async def test_restore_entity_end_to_end(
     await data.async_dump_states()
     await hass.async_block_till_done()
 
-    storage_data = hass_storage[STORAGE_KEY]["data"]
+    storage_data = hass_storage[f"{STORAGE_KEY}.{DOMAIN}"]["data"]
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
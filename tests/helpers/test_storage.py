@@ -28,6 +28,7 @@ from tests.common import (
     async_fire_time_changed,
     async_fire_time_changed_exact,
     async_test_home_assistant,
+    flush_store,
 )
 
 MOCK_VERSION = 1
@@ -667,6 +668,152 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test a journaled store only appends the changed records."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        records = {"items": {"a": {"id": "a", "v": 1}, "b": {"id": "b", "v": 2}}}
+
+        def _records() -> dict[str, dict[str, Any]]:
+            return {collection: dict(items) for collection, items in records.items()}
+
+        def _read(path: str) -> bytes:
+            with open(path, "rb") as file:
+                return file.read()
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        store.async_delay_save_records(_records)
+        await flush_store(store)
+        assert not os.path.exists(store.journal_path)
+        base = await hass.async_add_executor_job(_read, store.path)
+        assert json.loads(base)["data"] == {
+            "items": [{"id": "a", "v": 1}, {"id": "b", "v": 2}]
+        }
+
+        # Nothing changed
+        store.async_delay_save_records(_records)
+        await flush_store(store)
+        assert not os.path.exists(store.journal_path)
+
+        del records["items"]["a"]
+        records["items"]["b"] = {"id": "b", "v": 3}
+        records["items"]["c"] = {"id": "c", "v": 4}
+        store.async_delay_save_records(_records)
+        await flush_store(store)
+        assert await hass.async_add_executor_job(_read, store.path) == base
+        journal = await hass.async_add_executor_job(_read, store.journal_path)
+        assert [json.loads(line) for line in journal.splitlines()[1:]] == [
+            {"c": "items", "id": "b", "r": {"id": "b", "v": 3}},
+            {"c": "items", "id": "c", "r": {"id": "c", "v": 4}},
+            {"c": "items", "id": "a", "r": None},
+        ]
+
+        # The journal is replayed when loading and folded into the base file
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == {
+            "items": [{"id": "b", "v": 3}, {"id": "c", "v": 4}]
+        }
+        assert not os.path.exists(store2.journal_path)
+        base = json.loads(await hass.async_add_executor_job(_read, store.path))
+        assert "journal" not in base
+        assert base["data"] == {"items": [{"id": "b", "v": 3}, {"id": "c", "v": 4}]}
+
+        # The first write after loading compacts the journal
+        store2.async_delay_save_records(_records)
+        await flush_store(store2)
+        assert not os.path.exists(store2.journal_path)
+        store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store3.async_load() == {
+            "items": [{"id": "b", "v": 3}, {"id": "c", "v": 4}]
+        }
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test compacting the journal and ignoring incomplete or stale journals."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        records: dict[str, dict[str, Any]] = {"items": {}}
+
+        def _records() -> dict[str, dict[str, Any]]:
+            return {collection: dict(items) for collection, items in records.items()}
+
+        def _append(path: str, data: bytes) -> None:
+            with open(path, "ab") as file:
+                file.write(data)
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        store.async_delay_save_records(_records)
+        await flush_store(store)
+
+        with patch.object(storage, "JOURNAL_COMPACT_RATIO", 0):
+            records["items"]["a"] = {"id": "a", "v": 1}
+            store.async_delay_save_records(_records)
+            await flush_store(store)
+            assert os.path.exists(store.journal_path)
+
+            records["items"]["b"] = {"id": "b", "v": 2}
+            store.async_delay_save_records(_records)
+            await flush_store(store)
+            assert not os.path.exists(store.journal_path)
+
+        records["items"]["c"] = {"id": "c", "v": 3}
+        store.async_delay_save_records(_records)
+        await flush_store(store)
+        await hass.async_add_executor_job(
+            _append, store.journal_path, b'{"c":"items","id":"d","r":{"id":'
+        )
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == {
+            "items": [{"id": "a", "v": 1}, {"id": "b", "v": 2}, {"id": "c", "v": 3}]
+        }
+        assert "Ignoring incomplete journal entry of storage-test" in caplog.text
+
+        # A full write makes the journal stale
+        await store2.async_save({"items": [{"id": "a", "v": 1}]})
+        await hass.async_add_executor_job(
+            _append, store.journal_path, b'{"journal":"stale"}\n'
+        )
+        store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store3.async_load() == {"items": [{"id": "a", "v": 1}]}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_stop(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into the base file when stopping."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        records = {"items": {"a": {"id": "a", "v": 1}}}
+
+        def _records() -> dict[str, dict[str, Any]]:
+            return {collection: dict(items) for collection, items in records.items()}
+
+        def _read(path: str) -> bytes:
+            with open(path, "rb") as file:
+                return file.read()
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        store.async_delay_save_records(_records)
+        await flush_store(store)
+        records["items"]["b"] = {"id": "b", "v": 2}
+        store.async_delay_save_records(_records)
+        await flush_store(store)
+        assert os.path.exists(store.journal_path)
+
+        await hass.async_stop(force=True)
+
+        assert not os.path.exists(store.journal_path)
+        base = json.loads(await hass.async_add_executor_job(_read, store.path))
+        assert base["data"] == {"items": [{"id": "a", "v": 1}, {"id": "b", "v": 2}]}
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -5605,6 +5606,162 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_with_exception_static_dependencies(
+    hass: HomeAssistant,
+) -> None:
+    """Test entities after the exception are tracked if they are known statically."""
+    hass.states.async_set("sensor.a", "unknown")
+    hass.states.async_set("sensor.b", "2")
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.a') | float + states.sensor.b.state | float"
+        " + states.light | count }}",
+    )
+    with pytest.raises(TemplateError, match="no default was specified"):
+        info.result()
+
+    assert info.all_states is False
+    assert info.entities == {"sensor.a", "sensor.b"}
+    assert info.domains == {"light"}
+    assert info.rate_limit == template.DOMAIN_STATES_RATE_LIMIT
+    assert info.filter("sensor.b")
+    assert info.filter("light.kitchen")
+    assert not info.filter("sensor.c")
+
+    # The dependencies of templates iterating all states can not be narrowed
+    info = render_to_info(hass, "{{ (states | first).state | float }}")
+    with pytest.raises(TemplateError):
+        info.result()
+    assert info.rate_limit == template.ALL_STATES_RATE_LIMIT
+    assert info.filter("sensor.c")
+
+
+@pytest.mark.parametrize(
+    ("template_str", "expected"),
+    [
+        ("{{ 1 + 1 }}", (set(), set())),
+        ("{{ states('Sensor.A') }}", ({"sensor.a"}, set())),
+        (
+            "{{ is_state('sensor.a', 'on') and state_attr('sensor.b', 'x') }}",
+            ({"sensor.a", "sensor.b"}, set()),
+        ),
+        ("{{ 'sensor.a' | states }}", ({"sensor.a"}, set())),
+        ("{{ 'sensor.a' is has_value }}", ({"sensor.a"}, set())),
+        ("{{ states.sensor.a.state }}", ({"sensor.a"}, set())),
+        ("{% for s in states.sensor %}{{ s }}{% endfor %}", (set(), {"sensor"})),
+        ("{{ states | count }}", None),
+        ("{{ states(entity) }}", None),
+        ("{{ entity | states }}", None),
+        ("{{ expand('group.a') }}", None),
+        ("{{ states['sensor.a'] }}", None),
+        ("{{ ['sensor.a'] | map('states') | list }}", None),
+        ("{{ ['sensor.a'] | select('is_state', 'on') | list }}", None),
+        ("{{ ['sensor.a'] | reject('has_value') | list }}", None),
+        ("{{ lights | selectattr('entity_id', 'is_state', 'on') | list }}", None),
+        ("{{ lights | rejectattr('entity_id', 'has_value') | list }}", None),
+        ("{{ ['a', 'b'] | map('upper') | list }}", (set(), set())),
+        ("{% import 'macros.jinja' as m %}{{ m.x() }}", None),
+        ("{{ states('sensor.a'", None),
+    ],
+)
+def test_template_static_dependencies(
+    template_str: str, expected: tuple[set[str], set[str]] | None
+) -> None:
+    """Test deriving the dependencies of a template from its source."""
+    assert template._template_static_dependencies(template_str) == expected
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states('sensor.temperature') | float(0) * 2 }}",
+        "{{ is_state('light.a', 'on') and is_state('light.b', 'on') }}",
+        "{{ is_state('light.a', 'on') or has_value('sensor.missing') }}",
+        "{{ state_attr('sensor.temperature', 'unit') | upper }}",
+        "{{ is_state_attr('sensor.temperature', 'unit', 'c') }}",
+        "{{ (states('sensor.temperature') | int - 3) // 2 % 5 }}",
+        "{{ states('sensor.temperature') | float / 4 | round(1) }}",
+        "{{ 1 < states('sensor.temperature') | int < 30 }}",
+        "{{ 30 < states('sensor.temperature') | int < 1 }}",
+        "{{ states('light.a') in ['on', 'off'] }}",
+        "{{ states('light.a') not in ('on',) }}",
+        "{{ 'yes' if is_state('light.a', 'on') else 'no' }}",
+        "{{ not is_state('light.b', 'on') }}",
+        "{{ -(states('sensor.temperature') | float) }}",
+        "{{ float('x', default=1) + int('0x1F', base=16) + bool('on') }}",
+        "Temperature: {{ states('sensor.temperature') ~ ' ' ~ 'C' }}!",
+        "{{ (states('sensor.temperature') | float * -1) | abs }}",
+        "{{ none }}",
+    ],
+)
+async def test_fast_render(hass: HomeAssistant, template_str: str) -> None:
+    """Test the fast path renders the same result as Jinja."""
+    hass.states.async_set("sensor.temperature", "21.5", {"unit": "c"})
+    hass.states.async_set("light.a", "on")
+    hass.states.async_set("light.b", "off")
+
+    tmp = template.Template(template_str, hass)
+    info = tmp.async_render_to_info()
+    assert tmp._fast_render is not None
+
+    jinja_tmp = template.Template(template_str, hass)
+    jinja_tmp.ensure_valid()
+    jinja_tmp._ensure_compiled()
+    jinja_tmp._fast_render = None
+    jinja_info = jinja_tmp.async_render_to_info()
+
+    assert info.result() == jinja_info.result()
+    assert info.entities == jinja_info.entities
+    assert info.domains == jinja_info.domains
+    assert info.all_states == jinja_info.all_states
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states.sensor.temperature.state }}",
+        "{{ states('sensor.temperature') }}{{ states('light.a') }}",
+        "{% if is_state('light.a', 'on') %}on{% endif %}",
+        "{{ states(entity) }}",
+        "{{ states('sensor.temperature') | as_timestamp }}",
+        "{{ now() }}",
+        "{{ 'sensor.temperature' | states }}",
+        "{{ 'yes' if is_state('light.a', 'on') }}",
+        "{{ states('sensor.temperature') ** 2 }}",
+    ],
+)
+async def test_fast_render_unsupported(hass: HomeAssistant, template_str: str) -> None:
+    """Test templates outside the fast path subset are rendered by Jinja."""
+    tmp = template.Template(template_str, hass)
+    tmp.async_render_to_info()
+    assert tmp._fast_render is None
+
+
+async def test_fast_render_fallbacks(hass: HomeAssistant) -> None:
+    """Test the fast path is not used when it can not match Jinja."""
+    hass.states.async_set("sensor.temperature", "21.5")
+
+    tmp = template.Template("{{ states('sensor.temperature') | float * 2 }}", hass)
+    assert tmp.async_render() == 43.0
+    assert tmp._fast_render is not None
+    # Variables shadowing globals used by the template
+    assert tmp.async_render({"states": lambda _: "2"}) == 4.0
+    assert tmp.async_render({"other": "1"}) == 43.0
+
+    # Errors are raised as for Jinja rendering
+    hass.states.async_set("sensor.temperature", "unknown")
+    with pytest.raises(TemplateError, match="float got invalid input 'unknown'"):
+        tmp.async_render()
+
+    # Limited and strict templates always use Jinja
+    tmp = template.Template("{{ 1 + 1 }}", hass)
+    assert tmp.async_render(limited=True) == 2
+    assert tmp._fast_render is None
+    tmp = template.Template("{{ 1 + 1 }}", hass)
+    assert tmp.async_render(strict=True) == 2
+    assert tmp._fast_render is None
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
@@ -5648,6 +5805,106 @@ async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     )
 
 
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled template code is persisted and reused."""
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert list(data) == [template.BYTECODE_CACHE_RUNTIME]
+    assert len(data[template.BYTECODE_CACHE_RUNTIME]) == 1
+
+    # Simulate a restart
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch.object(
+        jinja2.Environment, "compile", side_effect=AssertionError("compiled")
+    ):
+        assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+
+    # Code compiled by another python, jinja or Home Assistant version is discarded
+    hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"] = {
+        "other": data[template.BYTECODE_CACHE_RUNTIME]
+    }
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch.object(
+        jinja2.Environment,
+        "compile",
+        autospec=True,
+        side_effect=jinja2.Environment.compile,
+    ) as mock_compile:
+        assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    assert mock_compile.called
+
+
+async def test_bytecode_fingerprint_environment_options(hass: HomeAssistant) -> None:
+    """Test the options of the environment are part of the bytecode fingerprint."""
+    env = template.TemplateEnvironment(hass)
+    assert (
+        env._bytecode_fingerprint()
+        == template.TemplateEnvironment(hass)._bytecode_fingerprint()
+    )
+    assert (
+        env._bytecode_fingerprint()
+        != template.TemplateEnvironment(hass, strict=True)._bytecode_fingerprint()
+    )
+    other_env = template.TemplateEnvironment(hass)
+    other_env.trim_blocks = True
+    assert env._bytecode_fingerprint() != other_env._bytecode_fingerprint()
+
+
+async def test_bytecode_fingerprint_added_filters(hass: HomeAssistant) -> None:
+    """Test filters and globals added later change the bytecode fingerprint."""
+    env = template.TemplateEnvironment(hass)
+    fingerprint = env._bytecode_fingerprint()
+    env.filters["added_filter"] = str
+    assert env._bytecode_fingerprint() != fingerprint
+    fingerprint = env._bytecode_fingerprint()
+    env.globals["added_global"] = str
+    assert env._bytecode_fingerprint() != fingerprint
+
+
+async def test_bytecode_cache_invalid_code(hass: HomeAssistant) -> None:
+    """Test cached code that does not compile is discarded."""
+    await template.async_load_bytecode_cache(hass)
+    bytecode_cache = hass.data[template._BYTECODE_CACHE]
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    ((key, record),) = bytecode_cache._records_to_save()[
+        template.BYTECODE_CACHE_RUNTIME
+    ].items()
+    assert "def root(" in record["code"]
+
+    bytecode_cache.async_set(key, "def root(:")
+    hass.data.pop(template._ENVIRONMENT)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    assert bytecode_cache.async_get(key) == record["code"]
+
+
+async def test_bytecode_cache_eviction(hass: HomeAssistant) -> None:
+    """Test the least recently used compiled template code is evicted."""
+    await template.async_load_bytecode_cache(hass)
+    bytecode_cache = hass.data[template._BYTECODE_CACHE]
+    template.Template("{{ 0 }}", hass).ensure_valid()
+    entry_size = bytecode_cache._size
+
+    with patch.object(template, "MAX_BYTECODE_CACHE_BYTES", entry_size * 2):
+        for idx in range(1, 3):
+            template.Template(f"{{{{ {idx} }}}}", hass).ensure_valid()
+
+    records = bytecode_cache._records_to_save()[template.BYTECODE_CACHE_RUNTIME]
+    assert len(records) == 2
+    assert bytecode_cache._size == sum(
+        len(record["code"]) for record in records.values()
+    )
+
+
 async def test_floors(
     hass: HomeAssistant,
     floor_registry: fr.FloorRegistry,
@@ -1,5 +1,6 @@
 """Tests for the update coordinator."""
 
+import asyncio
 from datetime import datetime, timedelta
 import logging
 from unittest.mock import AsyncMock, Mock, patch
@@ -795,3 +796,201 @@ async def test_timestamp_date_update_coordinator(hass: HomeAssistant) -> None:
     unsub()
     await crd.async_refresh()
     assert len(last_update_success_times) == 1
+
+
+async def test_adaptive_update_interval(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the update interval adapts to how often the data changes."""
+    value = 1
+
+    async def refresh() -> int:
+        return value
+
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=refresh,
+        update_interval=timedelta(seconds=20),
+        min_update_interval=timedelta(seconds=10),
+        max_update_interval=timedelta(seconds=40),
+    )
+    unsub = crd.async_add_listener(Mock())
+
+    async def _async_scheduled_refresh() -> None:
+        freezer.tick(crd.update_interval + timedelta(seconds=5))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    # The first refresh sees new data
+    await _async_scheduled_refresh()
+    assert crd.data == 1
+    assert crd.update_interval == timedelta(seconds=10)
+
+    # Backs off while the data stays the same, up to the maximum
+    await _async_scheduled_refresh()
+    assert crd.update_interval == timedelta(seconds=15)
+    await _async_scheduled_refresh()
+    assert crd.update_interval == timedelta(seconds=22.5)
+    await _async_scheduled_refresh()
+    assert crd.update_interval == timedelta(seconds=33.75)
+    await _async_scheduled_refresh()
+    assert crd.update_interval == timedelta(seconds=40)
+
+    # Tightens when the data changes, down to the minimum
+    value = 2
+    await _async_scheduled_refresh()
+    assert crd.data == 2
+    assert crd.update_interval == timedelta(seconds=20)
+    value = 3
+    await _async_scheduled_refresh()
+    assert crd.update_interval == timedelta(seconds=10)
+
+    # Manual refreshes don't adapt the interval
+    value = 4
+    await crd.async_refresh()
+    assert crd.update_interval == timedelta(seconds=10)
+
+    assert crd.refresh_latency.count == 8
+    unsub()
+
+
+async def test_adaptive_update_interval_bounds(hass: HomeAssistant) -> None:
+    """Test adaptive polling requires an update interval within its bounds."""
+    with pytest.raises(ValueError, match="requires an update interval"):
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name="test",
+            min_update_interval=timedelta(seconds=10),
+        )
+    with pytest.raises(ValueError, match="must be between"):
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name="test",
+            update_interval=timedelta(seconds=60),
+            max_update_interval=timedelta(seconds=30),
+        )
+
+
+async def test_adaptive_refreshes_staggered(hass: HomeAssistant) -> None:
+    """Test adaptive coordinators spread their refreshes over the seconds."""
+    crds = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name="test",
+            update_method=AsyncMock(return_value=1),
+            update_interval=timedelta(seconds=30),
+            max_update_interval=timedelta(seconds=300),
+        )
+        for _ in range(4)
+    ]
+    unsubs = [crd.async_add_listener(Mock()) for crd in crds]
+    slots = sorted(crd._refresh_slot for crd in crds)
+    # 3 seconds of stagger for an interval of 30 seconds
+    assert slots == list(range(slots[0], slots[0] + 4))
+
+    # The second of a coordinator without listeners is released
+    freed_slot = crds[1]._refresh_slot
+    unsubs[1]()
+    assert crds[1]._refresh_slot is None
+    assert (
+        update_coordinator._async_get_refresh_slots(hass).reserve(slots[0], 3)
+        == freed_slot
+    )
+    for unsub in (unsubs[0], *unsubs[2:]):
+        unsub()
+
+
+def test_refresh_latency_histogram() -> None:
+    """Test the refresh latency histogram."""
+    histogram = update_coordinator.RefreshLatencyHistogram()
+    for latency in (0.05, 0.1, 0.3, 45.0):
+        histogram.add(latency)
+    assert histogram.as_dict() == {
+        "buckets": {
+            "0.1": 2,
+            "0.25": 0,
+            "0.5": 1,
+            "1.0": 0,
+            "2.5": 0,
+            "5.0": 0,
+            "10.0": 0,
+            "30.0": 0,
+            "inf": 1,
+        },
+        "count": 4,
+        "sum": pytest.approx(45.45),
+    }
+
+
+async def test_shared_fetch(hass: HomeAssistant) -> None:
+    """Test concurrent refreshes with the same fetch key share one fetch."""
+    calls = 0
+    fetch_started = asyncio.Event()
+    fetch_done = asyncio.Event()
+
+    async def refresh() -> int:
+        nonlocal calls
+        calls += 1
+        result = calls
+        fetch_started.set()
+        await fetch_done.wait()
+        return result
+
+    crds = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass, _LOGGER, name="test", update_method=refresh, fetch_key="endpoint"
+        )
+        for _ in range(3)
+    ]
+    other_crd = update_coordinator.DataUpdateCoordinator[int](
+        hass, _LOGGER, name="other", update_method=refresh, fetch_key="other"
+    )
+
+    refreshes = [
+        hass.async_create_task(crd.async_refresh()) for crd in (*crds, other_crd)
+    ]
+    await fetch_started.wait()
+    fetch_done.set()
+    await asyncio.gather(*refreshes)
+
+    assert calls == 2
+    assert [crd.data for crd in crds] == [1, 1, 1]
+    assert other_crd.data == 2
+    shared_fetches = update_coordinator.async_get_shared_fetches(hass)
+    assert shared_fetches.as_dict() == {"fetches": 2, "coalesced": 2}
+
+    # Fetches that don't overlap are not shared
+    await crds[0].async_refresh()
+    assert crds[0].data == 3
+    assert shared_fetches.as_dict() == {"fetches": 3, "coalesced": 2}
+
+
+async def test_shared_fetch_failure(hass: HomeAssistant) -> None:
+    """Test a failed shared fetch fails the refresh of every coordinator."""
+    fetch_done = asyncio.Event()
+
+    async def refresh() -> int:
+        await fetch_done.wait()
+        raise update_coordinator.UpdateFailed("Endpoint failed")
+
+    crds = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass, _LOGGER, name="test", update_method=refresh, fetch_key="endpoint"
+        )
+        for _ in range(2)
+    ]
+    refreshes = [hass.async_create_task(crd.async_refresh()) for crd in crds]
+    await asyncio.sleep(0)
+    fetch_done.set()
+    await asyncio.gather(*refreshes)
+
+    assert [crd.last_update_success for crd in crds] == [False, False]
+    assert update_coordinator.async_get_shared_fetches(hass).as_dict() == {
+        "fetches": 1,
+        "coalesced": 1,
+    }
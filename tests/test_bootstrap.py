@@ -3,6 +3,7 @@
 import asyncio
 from collections.abc import Generator, Iterable
 import contextlib
+import gc
 import glob
 import logging
 import os
@@ -130,6 +131,25 @@ async def test_empty_setup(hass: HomeAssistant) -> None:
         assert domain in hass.config.components, domain
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_garbage_collection_paused_while_loading_registries(
+    hass: HomeAssistant,
+) -> None:
+    """Test the garbage collector is paused while the registries load."""
+    gc_enabled: list[bool] = []
+
+    async def _async_load(hass: HomeAssistant) -> None:
+        gc_enabled.append(gc.isenabled())
+
+    with patch(
+        "homeassistant.helpers.entity_registry.async_load", side_effect=_async_load
+    ):
+        await bootstrap.async_load_base_functionality(hass)
+
+    assert gc_enabled == [False]
+    assert gc.isenabled()
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_config_does_not_turn_off_debug(hass: HomeAssistant) -> None:
     """Test that config does not turn off debug if its turned on by runtime config."""
@@ -64,6 +64,7 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -1169,6 +1170,74 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_entity_id_listener(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test listening for events by entity_id."""
+    calls = []
+    other_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def other_listener(event):
+        """Mock listener."""
+        other_calls.append(event)
+
+    listeners_before = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_entity_ids(
+        "test", ["Light.Kitchen", "light.bowl", "light.kitchen"], listener
+    )
+    unsub_other = hass.bus.async_listen_entity_ids("test", "light.bowl", other_listener)
+    assert hass.bus.async_listeners()["test"] == listeners_before + 3
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.porch"})
+    hass.bus.async_fire("test", {"no_entity_id": True})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen", "light.bowl"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other_test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data == {"entity_id": "light.kitchen"}
+    assert len(other_calls) == 0
+
+    hass.bus.async_fire_many_internal(
+        "test",
+        [
+            ({"entity_id": "light.bowl"}, None),
+            ({"entity_id": "x.y"}, None),
+            ({"entity_id": ["light.bowl"]}, None),
+        ],
+    )
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert len(other_calls) == 1
+    assert calls[1] is other_calls[0]
+
+    unsub()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bowl"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert len(other_calls) == 2
+
+    unsub_other()
+    assert hass.bus.async_listeners().get("test", 0) == listeners_before
+
+    unsub_other()
+    assert "Unable to remove unknown job listener" in caplog.text
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_entity_ids(MATCH_ALL, "light.kitchen", listener)
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1564,6 +1633,139 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states in one batch."""
+    attrs = {"some_attr": "attr_value"}
+    hass.states.async_set("light.bowl", "on", attrs)
+    hass.states.async_set("light.kitchen", "on")
+    old_bowl = hass.states.get("light.bowl")
+
+    state_changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    state_reported_events: list[ha.Event] = []
+    states_seen_by_listener: list[list[str | None]] = []
+
+    @ha.callback
+    def state_reported(event: ha.Event) -> None:
+        state_reported_events.append(event)
+
+    @ha.callback
+    def state_changed(event: ha.Event) -> None:
+        # All states in the batch are written before listeners are called
+        states_seen_by_listener.append(
+            [
+                state.state if (state := hass.states.get(entity_id)) else None
+                for entity_id in ("light.bowl", "light.kitchen", "light.porch")
+            ]
+        )
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, state_reported, event_filter=ha.callback(lambda _: True)
+    )
+    hass.bus.async_listen(EVENT_STATE_CHANGED, state_changed)
+
+    hass.states.async_set_many(
+        [
+            ("light.bowl", "off", attrs),
+            ("light.kitchen", "on", None),
+            ("Light.Porch", "on", None),
+        ],
+        timestamp=1234.0,
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in state_changed_events] == [
+        "light.bowl",
+        "light.porch",
+    ]
+    assert [event.data["entity_id"] for event in state_reported_events] == [
+        "light.kitchen"
+    ]
+    assert states_seen_by_listener == [["off", "on", "on"], ["off", "on", "on"]]
+
+    bowl = hass.states.get("light.bowl")
+    assert state_changed_events[0].data["old_state"] is old_bowl
+    assert bowl.attributes is old_bowl.attributes
+    assert bowl.last_updated_timestamp == 1234.0
+    assert hass.states.get("light.porch").last_updated_timestamp == 1234.0
+    assert hass.states.get("light.kitchen").last_reported_timestamp == 1234.0
+
+    # States without an explicit context each get their own context
+    contexts = {
+        id(state_changed_events[0].context),
+        id(state_changed_events[1].context),
+        id(state_reported_events[0].context),
+    }
+    assert len(contexts) == 3
+    assert state_changed_events[0].time_fired_timestamp == 1234.0
+
+    context = ha.Context()
+    hass.states.async_set_many(
+        [("light.bowl", "on", None), ("light.kitchen", "on", None)],
+        force_update=True,
+        context=context,
+    )
+    await hass.async_block_till_done()
+    assert len(state_changed_events) == 4
+    assert state_changed_events[2].context is context
+    assert state_changed_events[3].context is context
+
+
+async def test_statemachine_set_many_invalid_state(hass: HomeAssistant) -> None:
+    """Test states written before an invalid state in a batch are dispatched."""
+    state_changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [
+                ("light.bowl", "on", None),
+                ("light.kitchen", "x" * 256, None),
+                ("light.porch", "on", None),
+            ]
+        )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in state_changed_events] == ["light.bowl"]
+    assert hass.states.get("light.kitchen") is None
+    assert hass.states.get("light.porch") is None
+
+
+async def test_eventbus_fire_many_internal(hass: HomeAssistant) -> None:
+    """Test firing multiple events of the same type."""
+    filtered_events: list[ha.Event] = []
+    all_events: list[ha.Event] = []
+
+    @ha.callback
+    def filtered_listener(event: ha.Event) -> None:
+        filtered_events.append(event)
+
+    @ha.callback
+    def match_all_listener(event: ha.Event) -> None:
+        all_events.append(event)
+
+    hass.bus.async_listen(
+        "test_event",
+        filtered_listener,
+        event_filter=ha.callback(lambda event_data: event_data["filtered"]),
+    )
+    hass.bus.async_listen(MATCH_ALL, match_all_listener)
+
+    context = ha.Context()
+    hass.bus.async_fire_many_internal(
+        "test_event",
+        [({"filtered": True}, context), ({"filtered": False}, None)],
+        time_fired=1234.0,
+    )
+    await hass.async_block_till_done()
+
+    assert len(filtered_events) == 1
+    assert filtered_events[0].context is context
+    assert filtered_events[0].time_fired_timestamp == 1234.0
+    assert [event.data for event in all_events] == [
+        {"filtered": True},
+        {"filtered": False},
+    ]
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -2850,6 +3052,103 @@ async def test_state_change_events_context_id_match_state_time(
     assert _ulid_timestamp(state.context.id) == int(state.last_updated_timestamp * 1000)
 
 
+async def test_state_machine_states_are_compact(hass: HomeAssistant) -> None:
+    """Test states written by the state machine create datetimes lazily."""
+    hass.states.async_set("light.bedroom", "on", {"brightness": 1}, timestamp=1000.0)
+    hass.states.async_set("Light.Bedroom", "on", {"brightness": 2}, timestamp=2000.0)
+    state = hass.states.get("light.bedroom")
+
+    # Only the timestamps are stored until the datetimes are accessed
+    assert "last_updated" not in state.__dict__
+    assert "last_changed" not in state.__dict__
+    assert "last_reported" not in state.__dict__
+    assert "object_id" not in state.__dict__
+    assert state.last_updated_timestamp == 2000.0
+    assert state.last_reported_timestamp == 2000.0
+    assert state.last_changed_timestamp == 1000.0
+    assert state.as_compressed_state == {
+        "a": {"brightness": 2},
+        "c": state.context.id,
+        "lc": 1000.0,
+        "lu": 2000.0,
+        "s": "on",
+    }
+
+    assert state.last_updated == dt_util.utc_from_timestamp(2000.0)
+    assert state.last_reported == dt_util.utc_from_timestamp(2000.0)
+    assert state.last_changed == dt_util.utc_from_timestamp(1000.0)
+    assert state.object_id == "bedroom"
+
+    # The entity_id and domain strings are shared between states
+    hass.states.async_set("light.kitchen", "on")
+    assert state.entity_id is next(iter(hass.states.async_entity_ids("light")))
+    assert hass.states.get("light.kitchen").domain is state.domain
+
+    hass.states.async_set("light.bedroom", "on", {"brightness": 2}, timestamp=3000.0)
+    assert state.last_reported_timestamp == 3000.0
+    assert state.last_reported == dt_util.utc_from_timestamp(3000.0)
+
+
+async def test_state_machine_interns_attributes(hass: HomeAssistant) -> None:
+    """Test identical attribute sets are shared between states."""
+    attributes = {"unit_of_measurement": "°C", "device_class": "temperature"}
+    hass.states.async_set("sensor.one", "1", attributes)
+    hass.states.async_set("sensor.two", "2", dict(attributes))
+    hass.states.async_set_many([("sensor.three", "3", dict(attributes))])
+    one = hass.states.get("sensor.one")
+    two = hass.states.get("sensor.two")
+    three = hass.states.get("sensor.three")
+
+    assert one.attributes is two.attributes
+    assert one.attributes is three.attributes
+    assert isinstance(one.attributes, ReadOnlyDict)
+    assert json_loads(one.as_dict_json) == json_loads(json_dumps(one.as_dict()))
+    assert json_loads(b"{" + two.as_compressed_state_json + b"}") == {
+        "sensor.two": json_loads(json_dumps(two.as_compressed_state))
+    }
+    assert one.json_fragment is not two.json_fragment
+
+    # Values that are equal but have different types are not shared
+    hass.states.async_set("sensor.one", "1", {"value": 1})
+    hass.states.async_set("sensor.two", "2", {"value": True})
+    hass.states.async_set("sensor.three", "3", {"value": 1.0})
+    assert hass.states.get("sensor.one").as_dict()["attributes"] == {"value": 1}
+    assert b'"value":true' in hass.states.get("sensor.two").as_dict_json
+    assert b'"value":1.0' in hass.states.get("sensor.three").as_dict_json
+
+    # Container and datetime values are not interned, equal values can
+    # serialize differently
+    for one_value, two_value in (
+        ((30, 100), (30.0, 100.0)),
+        ((True,), (1,)),
+        (
+            datetime(2024, 1, 1, 12, tzinfo=dt_util.UTC),
+            datetime(2024, 1, 1, 13, tzinfo=dt_util.get_time_zone("Europe/Paris")),
+        ),
+    ):
+        hass.states.async_set("sensor.one", "1", {"value": one_value})
+        hass.states.async_set("sensor.two", "2", {"value": two_value})
+        one = hass.states.get("sensor.one")
+        two = hass.states.get("sensor.two")
+        assert one.attributes == two.attributes
+        assert one.attributes is not two.attributes
+        assert json_loads(one.as_dict_json)["attributes"] == json_loads(
+            json_dumps(one.attributes)
+        )
+        assert json_loads(two.as_dict_json)["attributes"] == json_loads(
+            json_dumps(two.attributes)
+        )
+
+    # Unhashable values can not be interned
+    hass.states.async_set("sensor.one", "1", {"options": ["a", "b"]})
+    hass.states.async_set("sensor.two", "2", {"options": ["a", "b"]})
+    one = hass.states.get("sensor.one")
+    two = hass.states.get("sensor.two")
+    assert one.attributes == two.attributes
+    assert one.attributes is not two.attributes
+    assert b'"options":["a","b"]' in one.as_dict_json
+
+
 async def test_state_change_events_match_time_with_limits_of_precision(
     hass: HomeAssistant,
 ) -> None: